@@ -0,0 +1,101 @@
+# Anziehdrehmoment und Drehwinkel für drehmoment-, drehwinkel- und streckgrenzgesteuertes Anziehen (NumPy-vektorisiert)
+from numpy import arctan, asarray, pi
+
+from gewindedaten import gewinde_kennwerte
+from vorspannung import (
+    NY_TAB,
+    gewindemoment,
+    kopfreibungsmoment,
+    r_p02_min,
+    reibdurchmesser_kopf,
+    reibungswinkel,
+    vorspannkraft_zulaessig,
+)
+
+
+def drehwinkel(F_M, delta_s, delta_p, P, F_snug=0.0):
+    """
+    Drehwinkel ab dem Fügepunkt (Vorspannkraft F_snug) bis zur Vorspannkraft F_M im elastischen Bereich:
+
+        θ = 360° * (F_M - F_snug) * (δ_s + δ_p) / P
+
+    Returns:
+        array_like: θ in Grad.
+    """
+    return 360 * (F_M - F_snug) * (delta_s + delta_p) / P
+
+def anziehtabelle(d_2, P, alpha, roh_strich, D_Km, my_K, F_Mmin, F_Mmax, delta_s, delta_p, F_snug=0.0):
+    """
+    Anziehvorschrift für beliebig viele Verbindungen in einem Aufruf. Alle Argumente dürfen Arrays sein.
+
+    Args:
+        d_2 (array_like): Flankendurchmesser in mm.
+        P (array_like): Teilung (bei mehrgängigen Gewinden die Steigung P_h) in mm.
+        alpha (array_like): Steigungswinkel im Bogenmaß.
+        roh_strich (array_like): Modifizierter Reibungswinkel im Bogenmaß.
+        D_Km (array_like): Wirksamer Reibdurchmesser der Kopfauflage in mm.
+        my_K (array_like): Reibungszahl in der Kopfauflage.
+        F_Mmin (array_like): Minimale Montagevorspannkraft in N.
+        F_Mmax (array_like): Maximale Montagevorspannkraft in N.
+        delta_s (array_like): Nachgiebigkeit der Schraube in mm/N.
+        delta_p (array_like): Nachgiebigkeit der Zwischenlage in mm/N.
+        F_snug (array_like, optional): Vorspannkraft am Fügepunkt in N (drehwinkelgesteuertes Anziehen).
+
+    Returns:
+        dict: "M_Amin", "M_Amax" (N*m), "theta_min", "theta_max" (Grad) und der Momentenanteil "M_G_anteil" des Gewindes.
+    """
+    moment_je_kraft = gewindemoment(1.0, d_2, alpha, roh_strich) + kopfreibungsmoment(1.0, my_K, D_Km)
+    return {
+        "M_Amin": F_Mmin * moment_je_kraft / 1000,
+        "M_Amax": F_Mmax * moment_je_kraft / 1000,
+        "theta_min": drehwinkel(F_Mmin, delta_s, delta_p, P, F_snug),
+        "theta_max": drehwinkel(F_Mmax, delta_s, delta_p, P, F_snug),
+        "M_G_anteil": gewindemoment(1.0, d_2, alpha, roh_strich) / moment_je_kraft,
+    }
+
+def montageanweisung(d, P, festigkeitsklasse, my_G, delta_s, delta_p, my_K=None, alpha_A=1.0, ny=NY_TAB, R_p02=None, D_Km=None, F_snug=0.0):
+    """
+    Anziehvorschrift für Normgewinde (ISO-Spitzgewinde) aus Nenndurchmesser und Teilung, vektorisiert über alle Argumente.
+
+    Drehmomentgesteuert: F_Mmax = F_Mzul (Ausnutzung ν der Dehngrenze), F_Mmin = F_Mmax/α_A, M_A aus M_G + M_K.
+    Drehwinkelgesteuert: Drehwinkel ab dem Fügepunkt bis F_Mmin bzw. F_Mmax.
+    Streckgrenzgesteuert: Vorspannkraft F_M02 bei Erreichen der Dehngrenze (ν = 1) mit zugehörigem Moment und Drehwinkel.
+
+    Args:
+        d (array_like): Nenndurchmesser in mm.
+        P (array_like): Teilung in mm.
+        festigkeitsklasse (float): 8.8, 10.9 oder 12.9 (wird nur ohne R_p02 benötigt).
+        my_G (array_like): Reibungszahl im Gewinde.
+        delta_s (array_like): Nachgiebigkeit der Schraube in mm/N.
+        delta_p (array_like): Nachgiebigkeit der Zwischenlage in mm/N.
+        my_K (array_like, optional): Reibungszahl in der Kopfauflage, Standard μ_G.
+        alpha_A (array_like, optional): Anziehfaktor α_A.
+        ny (array_like, optional): Ausnutzungsgrad der Dehngrenze beim drehmomentgesteuerten Anziehen.
+        R_p02 (array_like, optional): Abweichende Dehngrenze in N/mm².
+        D_Km (array_like, optional): Abweichender Reibdurchmesser der Kopfauflage in mm.
+        F_snug (array_like, optional): Vorspannkraft am Fügepunkt in N.
+
+    Returns:
+        dict: Die Spalten aus anziehtabelle sowie "F_Mmin", "F_Mmax", "F_M02", "M_A02" und "theta_02".
+    """
+    d = asarray(d, dtype=float)
+    P = asarray(P, dtype=float)
+    gewinde = gewinde_kennwerte("ISO-Spitzgewinde", d, P)
+    d_2 = gewinde["d_2"]
+    alpha = arctan(P / (pi * d_2))
+    roh_strich = reibungswinkel(my_G)
+    if my_K is None:
+        my_K = my_G
+    if R_p02 is None:
+        R_p02 = r_p02_min(festigkeitsklasse, d)
+    if D_Km is None:
+        D_Km = reibdurchmesser_kopf(d)
+
+    F_Mmax = vorspannkraft_zulaessig(gewinde["A_s"], gewinde["d_s"], d_2, P, R_p02, my_G, ny)
+    F_Mmin = F_Mmax / alpha_A
+    tabelle = anziehtabelle(d_2, P, alpha, roh_strich, D_Km, my_K, F_Mmin, F_Mmax, delta_s, delta_p, F_snug)
+
+    F_M02 = vorspannkraft_zulaessig(gewinde["A_s"], gewinde["d_s"], d_2, P, R_p02, my_G, 1.0)
+    streckgrenze = anziehtabelle(d_2, P, alpha, roh_strich, D_Km, my_K, F_M02, F_M02, delta_s, delta_p, F_snug)
+    tabelle.update({"F_Mmin": F_Mmin, "F_Mmax": F_Mmax, "F_M02": F_M02, "M_A02": streckgrenze["M_Amax"], "theta_02": streckgrenze["theta_max"]})
+    return tabelle
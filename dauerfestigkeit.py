@@ -1,9 +1,169 @@
-from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QGroupBox
+from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QGroupBox, QPushButton, QFileDialog
 from PyQt5.QtCore import Qt
 
 # Vordimensionierung und Dauerfestigkeitsberechnung einer Schraubenverbindung 
-from numpy import pi, arctan, tan, cos, sqrt
+from functools import cache
+from numpy import pi, arctan, tan, cos, sqrt, isnan, array, asarray, searchsorted, clip
 from pandas import read_excel, DataFrame
+from vorspannung import R_P02_MIN, montagewerte
+from lastkollektiv import BINAER_DTYPES, kollektiv_aus_datei
+from woehler import NEIGUNG, MINER, zeitfestigkeit, bruchschwingspielzahl, schaedigung
+
+# Excel-Tabellen für F_MTab (Tabelle 3.9-3.12)
+FMTAB_PATHS_SCHAFT = ['stor/3b_37_Fm_Schaftschraube_Feingewinde.xls', 'stor/3b_37_Fm_Schaftschraube_Regelgewinde.xls']
+FMTAB_PATHS_TAILLE = ['stor/3b_37_Fm_Schaftschraube_Feingewinde.xls', 'stor/3b_37_Fm_Taillenschraube_Regelgewinde.xls']
+P_GZUL_PATH = 'stor/3.13.xlsx'
+
+@cache
+def read_fmtab_sheet(excel_path):
+    """
+    Liest eine F_MTab-Tabelle einmalig ein. Das Ergebnis wird zwischengespeichert und darf nicht verändert werden.
+    Die Funktion greift nicht auf Widgets zu und kann daher im WorkerPool laufen.
+
+    Args:
+        excel_path (str): Pfad zur Excel-Datei.
+
+    Returns:
+        tuple: (DataFrame mit bereinigter 'Abm.'-Spalte, Liste der bereinigten Spaltenüberschriften)
+    """
+    df = read_excel(excel_path, sheet_name="Tabelle")
+
+    # Extrahiere die Zeilenüberschriften aus der dritten Zeile (Index 1).
+    headers = df.iloc[1]
+    df_without_headers = DataFrame(df.values[3:], columns=headers)
+    df_without_headers.columns = df_without_headers.columns.map(str).str.strip()
+    df_without_headers.columns = df_without_headers.columns.fillna('NaN')
+
+    # Bereinigt die 'Abm.'-Spalte, indem Leerzeichen entfernt werden
+    df['Abm.'] = df['Abm.'].str.replace(' ', '')
+    return df, list(df_without_headers.columns)
+
+# Zeilenversatz der Festigkeitsklassen unterhalb der Gewindezeile
+FESTIGKEITSKLASSE_DIFF = {
+    8.8: 0,
+    10.9: 1,
+    12.9: 2
+}
+
+def abmessung(d, p):
+    """
+    Gibt die Bezeichnung einer Tabellenzeile zurück, z.B. 'M12x1,75'.
+    """
+    # Formatiert p passend
+    p_str = f"{p:.3f}".rstrip('0').rstrip('.') if isinstance(p, float) else str(p)
+    d_str = f"{d:.3f}".rstrip('0').rstrip('.') if isinstance(d, float) else str(d)
+    return f'M{d_str}x{p_str}'.replace('.', ',').replace(' ', '')
+
+def _to_float(value):
+    """
+    Wandelt einen Tabelleneintrag in float um (leere oder Textzellen ergeben nan).
+    """
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+@cache
+def fmtab_index(excel_path):
+    """
+    Baut aus einer F_MTab-Tabelle ein Interpolationsraster auf: Tabellenzeile -> Werte über den sortierten Reibungszahlen.
+    Je Reibungszahl wird die erste passende Spalte verwendet (die folgenden Spalten gleicher μ enthalten M_A).
+    Das Ergebnis wird zwischengespeichert und darf nicht verändert werden. Kann im WorkerPool laufen.
+
+    Args:
+        excel_path (str): Pfad zur Excel-Datei.
+
+    Returns:
+        tuple: (dict Abmessung -> Zeilenindex, Array der Reibungszahlen, Matrix der Werte [Zeile, μ])
+    """
+    df, columns = read_fmtab_sheet(excel_path)
+    my_columns = {}
+    for i, column in enumerate(columns):
+        my = _to_float(column.replace(',', '.'))
+        if my > 0:
+            my_columns.setdefault(my, i)
+    my_grid = array(sorted(my_columns))
+    values = df.iloc[:, [my_columns[my] for my in my_grid]].apply(lambda col: col.map(_to_float)).to_numpy(dtype=float)
+    rows = {abm: i for i, abm in enumerate(df['Abm.']) if isinstance(abm, str)}
+    return rows, my_grid, values
+
+def interpolate_fmtab(excel_paths, d, festigkeitsklasse, my, p):
+    """
+    Interpoliert F_MTab linear über μ für eine Gewindezeile (bilinear im Raster Zeile × μ, wobei die Zeile
+    als Gewindebezeichnung exakt getroffen wird). Außerhalb des Tabellenbereichs wird linear extrapoliert
+    und das Ergebnis markiert. Die Funktion greift nicht auf Widgets zu und kann daher im WorkerPool laufen.
+
+    Args:
+        excel_paths (list): Die zu durchsuchenden Excel-Dateien (Schaft- oder Taillenschraube).
+        d (float): Durchmesser.
+        festigkeitsklasse (float): Festigkeitsklasse.
+        my (float or array_like): Reibungskoeffizient(en).
+        p (float): Steigung.
+
+    Returns:
+        tuple: (F_MTab, extrapoliert, Meldung) – F_MTab und extrapoliert in der Form von my, oder (None, None, Meldung).
+    """
+    abm_value = abmessung(d, p)
+    diff = FESTIGKEITSKLASSE_DIFF.get(festigkeitsklasse, None)
+    if diff is None:
+        return None, None, "Ungültige Festigkeitsklasse"
+    my = asarray(my, dtype=float)
+
+    for excel_path in excel_paths:
+        rows, my_grid, values = fmtab_index(excel_path)
+        if abm_value not in rows:
+            continue  # Versuche den nächsten Excel-Pfad, wenn keine gültige Zeile gefunden wird
+
+        # Verschiebe die Zeilenauswahl um den Wert der Differenz nach unten
+        row_index = rows[abm_value] + diff
+        if row_index >= len(values):
+            return None, None, f"Index {row_index} out of range, cannot move down by {diff} rows"
+
+        row = values[row_index]
+        valid = ~isnan(row)
+        grid, row = my_grid[valid], row[valid]
+        if len(grid) < 2:
+            continue
+        j = clip(searchsorted(grid, my), 1, len(grid) - 1)
+        t = (my - grid[j - 1]) / (grid[j] - grid[j - 1])
+        F_MTab = row[j - 1] + t * (row[j] - row[j - 1])
+        extrapoliert = (my < grid[0]) | (my > grid[-1])
+        return F_MTab, extrapoliert, None
+
+    # Ausgabe, wenn in keinem Excel-Pfad eine gültige Zeile gefunden wird
+    return None, None, f"Keine gültige Zeile für {abm_value} in den angegebenen Dateien gefunden"
+
+def lookup_fmtab(excel_paths, d, festigkeitsklasse, my, p):
+    """
+    Sucht F_MTab in den Excel-Tabellen; Reibungszahlen zwischen den Tabellenspalten werden interpoliert.
+    Die Funktion greift nicht auf Widgets zu und kann daher im WorkerPool laufen.
+
+    Args:
+        excel_paths (list): Die zu durchsuchenden Excel-Dateien.
+        d (float): Durchmesser.
+        festigkeitsklasse (float): Festigkeitsklasse.
+        my (float): Reibungskoeffizient.
+        p (float): Steigung.
+
+    Returns:
+        tuple: (F_MTab oder None, Meldung für die Vordimensionierung oder None)
+    """
+    F_MTab, extrapoliert, message = interpolate_fmtab(excel_paths, d, festigkeitsklasse, my, p)
+    if F_MTab is None:
+        return None, message
+    if extrapoliert:
+        return float(F_MTab), f"\u03BC = {my} liegt außerhalb der Tabelle, F<sub>M Tab</sub> wurde extrapoliert"
+    return float(F_MTab), None
+
+def read_p_gzul_table(file_path=P_GZUL_PATH):
+    """
+    Liest Tabelle 3.13 (zulässige Grenzflächenpressung) ein. Kann im WorkerPool laufen.
+
+    Returns:
+        tuple: (Liste der Werkstoffnamen, Liste der p_Gzul-Werte in Tabellenreihenfolge)
+    """
+    df = read_excel(file_path)
+    return df.iloc[:, 1].dropna().tolist(), [float(value) for value in df.iloc[:, 2]]
 
 class DauerfestigkeitWidget(QWidget):
     
@@ -40,6 +200,11 @@ class DauerfestigkeitWidget(QWidget):
         super().__init__(parent)
         self.mainwindow = parent
         self.validator=validator
+        self.fmtab_cache = {}  # (Querschnitt, d, Festigkeitsklasse, my, P) -> (F_MTab, Meldung)
+        self.fmtab_pending = None
+        self.p_gzul_values = None
+        self.pending_werkstoff = None
+        self.kollektiv = None  # Rainflow-Kollektiv der Schraubenkraft aus einer Zeitreihe (lastkollektiv)
         self.setup_ui()
         for line_edit in self.line_edits.values():
             line_edit.editingFinished.connect(self.calculate)
@@ -151,10 +316,10 @@ class DauerfestigkeitWidget(QWidget):
 
         self.werkstoff = QComboBox()
         werkstoff_label = QLabel("Auflagewerkstoff auswählen")
-        file_path = 'stor/3.13.xlsx'
-        df = read_excel(file_path)
-        row_b = df.iloc[:, 1].dropna().tolist()
-        self.werkstoff.addItems(row_b)
+        # Tabelle 3.13 wird im Hintergrund geladen, die ComboBox wird in werkstoff_table_loaded gefüllt
+        self.werkstoff.setEnabled(False)
+        self.mainwindow.worker_pool.submit("dauerfestigkeit/werkstoff", read_p_gzul_table,
+                                           on_result=self.werkstoff_table_loaded, on_error=self.werkstoff_table_failed)
         self.werkstoff.currentIndexChanged.connect(self.update_werkstoff)
         scroll_layout.addWidget(werkstoff_label,k,0)
         scroll_layout.addWidget(self.werkstoff,k,1)
@@ -170,6 +335,53 @@ class DauerfestigkeitWidget(QWidget):
 
         self.flaechenp = QLabel("")
         scroll_layout.addWidget(self.flaechenp, k, 0, 1, 3)
+        k += 1
+
+        # Teil d Lastkollektiv aus einer gemessenen Zeitreihe F_A(t)
+        subtitle_kollektiv = QLabel("""<p style="font-size:10pt;"><u>Lastkollektiv aus Zeitreihe</u></p>""")
+        scroll_layout.addWidget(subtitle_kollektiv, k, 0)
+        k += 1
+        self.kollektiv_laden = QPushButton("Zeitreihe F_A(t) laden")
+        self.kollektiv_laden.setToolTip("CSV (Spalte F_A oder letzte Spalte), .npy oder Rohdaten (" + ", ".join(BINAER_DTYPES) + ")<br>"
+                                        "F<sub>S</sub>(t) = F<sub>V</sub> + \u03C6*F<sub>A</sub>(t), Rainflow-Zählung, "
+                                        "das größte Schwingspiel ersetzt F<sub>SAa</sub> im Nachweis")
+        self.kollektiv_laden.clicked.connect(self.zeitreihe_laden)
+        scroll_layout.addWidget(self.kollektiv_laden, k, 0)
+        self.kollektiv_verwerfen = QPushButton("Kollektiv verwerfen")
+        self.kollektiv_verwerfen.clicked.connect(self.kollektiv_entfernen)
+        scroll_layout.addWidget(self.kollektiv_verwerfen, k, 1)
+        k += 1
+
+        self.kollektiv_hinweis = QLabel("")
+        self.kollektiv_hinweis.setWordWrap(True)
+        scroll_layout.addWidget(self.kollektiv_hinweis, k, 0, 1, 3)
+        k += 1
+
+        # Teil e Zeitfestigkeit und Schadensakkumulation
+        subtitle_zeitfestigkeit = QLabel("""<p style="font-size:10pt;"><u>Zeitfestigkeit (Miner)</u></p>""")
+        scroll_layout.addWidget(subtitle_zeitfestigkeit, k, 0)
+        k += 1
+        miner_label = QLabel("Schadensakkumulation")
+        self.miner = QComboBox()
+        self.miner.addItems(MINER)
+        self.miner.setCurrentIndex(1)
+        self.miner.setToolTip("Unterhalb von \u03C3<sub>A</sub>: original keine Schädigung, elementar Wöhlerlinie verlängert, "
+                              "modifiziert nach Haibach mit der Neigung 2k-1")
+        self.miner.currentIndexChanged.connect(self.calculate)
+        scroll_layout.addWidget(miner_label, k, 0)
+        scroll_layout.addWidget(self.miner, k, 1)
+        k += 1
+
+        eingabee = [
+            [0, "N_Z", "", "Schwingspielzahl N<sub>Z</sub>", "Geforderte Schwingspielzahl für den Zeitfestigkeitsnachweis (10<sup>4</sup> bis 2*10<sup>6</sup>)"],
+            [0, "D_zul", "", "Zulässige Schadenssumme D<sub>zul</sub>", "Annahme 1 (Die Eingabe eine Wertes überschreibt diesen Wert automatisch )"],
+            [0, "sigma_AZ", "N/mm<sup>2</sup>", "Zeitfestigkeit \u03C3<sub>AZ</sub>", "SV: \u03C3<sub>AZSV</sub>=\u03C3<sub>ASV</sub>*(N<sub>D</sub>/N<sub>Z</sub>)<sup>1/3</sup><br>SG: \u03C3<sub>AZSG</sub>=\u03C3<sub>ASG</sub>*(N<sub>D</sub>/N<sub>Z</sub>)<sup>1/6</sup><br>mit N<sub>D</sub>=2*10<sup>6</sup>"],
+        ]
+        k = add_line_edits(eingabee, k, scroll_layout)
+
+        self.miner_hinweis = QLabel("")
+        self.miner_hinweis.setWordWrap(True)
+        scroll_layout.addWidget(self.miner_hinweis, k, 0, 1, 3)
         
        
 
@@ -261,6 +473,10 @@ class DauerfestigkeitWidget(QWidget):
         d_k= self.get_nachgiebigkeit("d_k")
         D_B= self.get_nachgiebigkeit("D_B")
 
+        # Mit einem Lastkollektiv gilt das größte Schwingspiel als Ausschlagskraft
+        if self.kollektiv != None and Phi != None:
+            F_SAa = self.kollektiv["F_SAa_max"] * Phi / self.kollektiv["Phi"]
+
         # Querbeanspruchung
         tau = self.get_value("tau")
         sigma_l = self.get_value("sigma_l")
@@ -269,7 +485,7 @@ class DauerfestigkeitWidget(QWidget):
         for i in range(3):
 
             if d != None and P != None and my != None and festigkeitsklasse != None:
-                F_MTab = self.get_fmtab(d, festigkeitsklasse,my,P)
+                F_MTab = self.request_fmtab(d, festigkeitsklasse, my, P)
                 self.set_value("F_MTab", F_MTab)
             else:
                 missing_values = []
@@ -407,7 +623,135 @@ class DauerfestigkeitWidget(QWidget):
                     self.flaechenp.setText(f"Die Flächenpressung an der Auflagefläche {round(p,4)} N/mm<sup>2</sup> ist kleiner als die zulässige Flächenpressung {round(p_Gzul,4)} N/mm<sup>2</sup>.")
                 else:
                     self.flaechenp.setText(f"Die Flächenpressung an der Auflagefläche {round(p,4)} N/mm<sup>2</sup> ist größer als die zulässige Flächenpressung {round(p_Gzul,4)} N/mm<sup>2</sup>.")
+
+        self.kollektiv_calc(Phi, A_s, sigma_A)
+        self.zeitfestigkeit_calc(Phi, A_s, sigma_a, sigma_A)
  
+    def zeitreihe_laden(self):
+        """
+        Liest eine Zeitreihe F<sub>A</sub>(t) im Hintergrund blockweise ein und zählt das Lastkollektiv der Schraubenkraft
+        mit dem aktuellen Verspannungsfaktor (lastkollektiv.kollektiv_aus_datei).
+        """
+        Phi = self.get_kraefte("Phi")
+        if Phi == None:
+            self.kollektiv_hinweis.setText("Für das Lastkollektiv wird der Verspannungsfaktor \u03C6 benötigt.")
+            return
+        pfad, _ = QFileDialog.getOpenFileName(self, "Zeitreihe laden", "",
+                                              "Zeitreihen (*.csv *.txt *.npy " + " ".join("*" + e for e in BINAER_DTYPES) + ")")
+        if not pfad:
+            return
+        F_V = self.get_kraefte("F_V") or 0.0
+        self.kollektiv_hinweis.setText(f"Zeitreihe {pfad} wird gezählt ...")
+        self.mainwindow.worker_pool.submit("dauerfestigkeit/kollektiv", kollektiv_aus_datei, pfad, Phi, F_V,
+                                           on_result=lambda kollektiv: self.kollektiv_geladen(kollektiv, Phi),
+                                           on_error=self.kollektiv_fehler)
+
+    def kollektiv_geladen(self, kollektiv, Phi):
+        """
+        Übernimmt das im Hintergrund gezählte Lastkollektiv und rechnet den Nachweis neu.
+
+        Args:
+            kollektiv (dict): Ergebnis von kollektiv_aus_datei.
+            Phi (float): Verspannungsfaktor, mit dem gezählt wurde.
+        """
+        self.kollektiv = {**kollektiv, "Phi": Phi}
+        self.calculate()
+
+    def kollektiv_fehler(self, error):
+        """
+        Meldet, dass die Zeitreihe nicht gelesen werden konnte.
+        """
+        self.kollektiv_hinweis.setText(f"Die Zeitreihe konnte nicht gelesen werden: {error}")
+
+    def kollektiv_entfernen(self):
+        """
+        Verwirft das Lastkollektiv; F<sub>SAa</sub> kommt wieder aus dem KraefteWidget.
+        """
+        self.kollektiv = None
+        self.kollektiv_hinweis.setText("")
+        self.line_edits["sigma_a"].clear()
+        self.calculate()
+
+    def kollektiv_calc(self, Phi, A_s, sigma_A):
+        """
+        Fasst das Lastkollektiv zusammen. Ausschläge skalieren linear mit \u03C6, ein seit dem Zählen geänderter
+        Verspannungsfaktor wird daher ohne erneutes Einlesen berücksichtigt.
+
+        Args:
+            Phi (float): Aktueller Verspannungsfaktor.
+            A_s (float): Spannungsquerschnitt in mm².
+            sigma_A (float): Zulässige Ausschlagsspannung in N/mm².
+        """
+        if self.kollektiv == None:
+            return
+        skalierung = Phi / self.kollektiv["Phi"] if Phi != None else 1.0
+        F_SAa = self.kollektiv["F_SAa"] * skalierung
+        zahl = lambda wert: f"{wert:.1f}".replace('.', ',')
+        text = (f"{self.kollektiv['n_werte']} Messwerte, {zahl(self.kollektiv['zyklen_gesamt'])} Schwingspiele, "
+                f"größte Ausschlagskraft F<sub>SAa</sub> = {zahl(self.kollektiv['F_SAa_max'] * skalierung)} N "
+                f"bei F<sub>Sm</sub> = {zahl(self.kollektiv['F_Sm_max'])} N.")
+        if A_s != None and A_s != 0 and sigma_A != None:
+            ueber = self.kollektiv["zyklen"][F_SAa / A_s > sigma_A].sum()
+            text += f" {zahl(ueber)} Schwingspiele liegen über \u03C3<sub>A</sub>."
+        self.kollektiv_hinweis.setText(text)
+
+    def zeitfestigkeit_calc(self, Phi, A_s, sigma_a, sigma_A):
+        """
+        Zeitfestigkeitsnachweis für N<sub>Z</sub> und Schadenssumme nach Miner (woehler). Mit Lastkollektiv wird über
+        dessen Ausschlagsklassen summiert, sonst über N<sub>Z</sub> Schwingspiele mit \u03C3<sub>a</sub>.
+
+        Args:
+            Phi (float): Aktueller Verspannungsfaktor.
+            A_s (float): Spannungsquerschnitt in mm².
+            sigma_a (float): Ausschlagsspannung in N/mm².
+            sigma_A (float): Dauerfestigkeit \u03C3<sub>ASV</sub> bzw. \u03C3<sub>ASG</sub> in N/mm².
+        """
+        D_zul = self.get_value("D_zul")
+        if D_zul == None:
+            D_zul = 1.0
+            self.set_value("D_zul", D_zul)
+            self.set_color("D_zul", "default")
+        if D_zul != 1.0:
+            self.set_color("D_zul", "normal")
+        if sigma_A == None:
+            self.miner_hinweis.setText("")
+            return
+
+        k = NEIGUNG[self.verg.currentText()]
+        miner = self.miner.currentText()
+        N_Z = self.get_value("N_Z")
+        zahl = lambda wert: f"{wert:.3g}".replace('.', ',')
+        texte = []
+        if N_Z != None and N_Z > 0:
+            sigma_AZ = float(zeitfestigkeit(N_Z, sigma_A, k))
+            self.set_value("sigma_AZ", sigma_AZ)
+            if sigma_a != None and self.kollektiv == None:
+                D = N_Z / float(bruchschwingspielzahl(sigma_a, sigma_A, k, miner))
+                vergleich = "kleiner" if sigma_a <= sigma_AZ else "größer"
+                texte.append(f"\u03C3<sub>a</sub> {round(sigma_a,4)} N/mm<sup>2</sup> ist {vergleich} als die Zeitfestigkeit "
+                             f"\u03C3<sub>AZ</sub> {round(sigma_AZ,4)} N/mm<sup>2</sup> für N<sub>Z</sub> = {zahl(N_Z)}, "
+                             f"Schadenssumme D = {zahl(D)} (D<sub>zul</sub> = {zahl(D_zul)}).")
+
+        if self.kollektiv != None and A_s != None and A_s != 0:
+            skalierung = Phi / self.kollektiv["Phi"] if Phi != None else 1.0
+            ergebnis = schaedigung(self.kollektiv["F_SAa"] * skalierung / A_s, self.kollektiv["zyklen"].sum(axis=1),
+                                   sigma_A, k, miner, D_zul)
+            D = float(ergebnis["D"])
+            lebensdauer = float(ergebnis["lebensdauer"])
+            text = f"Schadenssumme des Lastkollektivs D = {zahl(D)} je Durchlauf"
+            if D > 0:
+                text += (f", ertragbar sind {zahl(lebensdauer)} Durchläufe "
+                         f"({zahl(lebensdauer * float(ergebnis['N_gesamt']))} Schwingspiele)")
+                if N_Z != None and N_Z > 0:
+                    D_N_Z = D * N_Z / float(ergebnis["N_gesamt"])
+                    text += f"; für N<sub>Z</sub> = {zahl(N_Z)} Schwingspiele D = {zahl(D_N_Z)}" + (
+                        "" if D_N_Z <= D_zul else " > D<sub>zul</sub>, die Schraubenverbindung ist nicht zeitfest!")
+            text += "."
+            if ergebnis["n_kurzzeit"] > 0:
+                text += f" {zahl(float(ergebnis['n_kurzzeit']))} Schwingspiele liegen im Kurzzeitfestigkeitsbereich (N < 10<sup>4</sup>)."
+            texte.append(text)
+        self.miner_hinweis.setText("<br>".join(texte))
+
     def update_ui_for_taillenschrauben(self):
         """
         Aktualisiert die Benutzeroberfläche, um das Feld 'd_schmin' anzuzeigen, wenn 'Taillenschrauben' ausgewählt ist.
@@ -450,15 +794,36 @@ class DauerfestigkeitWidget(QWidget):
             self.belastung.setVisible(False)
             self.belastung_label.setVisible(False)
 
+    def werkstoff_table_loaded(self, result):
+        """
+        Füllt die Werkstoff-ComboBox, sobald Tabelle 3.13 im Hintergrund geladen wurde.
+
+        Args:
+            result (tuple): Werkstoffnamen und p_Gzul-Werte aus read_p_gzul_table.
+        """
+        names, self.p_gzul_values = result
+        self.werkstoff.blockSignals(True)
+        self.werkstoff.addItems(names)
+        self.werkstoff.blockSignals(False)
+        self.werkstoff.setEnabled(True)
+        if self.pending_werkstoff != None:
+            name, self.pending_werkstoff = self.pending_werkstoff, None
+            self.set_werkstoff(name)
+
+    def werkstoff_table_failed(self, error):
+        """
+        Meldet, dass Tabelle 3.13 nicht geladen werden konnte.
+        """
+        self.flaechenp.setText(f"Tabelle 3.13 konnte nicht geladen werden: {error}")
+
     def update_werkstoff(self):
         """
         Aktualisiert den Wert der zulässigen Grenzflächenpressung 'p_Gzul' basierend auf der Auswahl des Werkstoffs.
         """
         index = self.werkstoff.currentIndex()
-        file_path = 'stor/3.13.xlsx'
-        df = read_excel(file_path)
-        p_Gzul = df.iloc[index, 2]
-        p_Gzul = float(p_Gzul)
+        if self.p_gzul_values == None or index < 0:
+            return
+        p_Gzul = self.p_gzul_values[index]
         self.set_value("p_Gzul", p_Gzul)
 
     def set_werkstoff(self, name):
@@ -468,6 +833,11 @@ class DauerfestigkeitWidget(QWidget):
         Args:
             name (str): Der Name des auszuwählenden Werkstoffs.
         """
+        # Ist Tabelle 3.13 noch nicht geladen, wird die Auswahl nachgeholt
+        if self.p_gzul_values == None:
+            self.pending_werkstoff = name
+            return
+
         # Findet den Index des Items mit gegebenem Name
         index = self.werkstoff.findText(name)
         
@@ -581,9 +951,11 @@ class DauerfestigkeitWidget(QWidget):
         elif param == "festigkeitsklasse":
             text = self.mainwindow.werkstoff_widget.festigkeitsklasse
         try:
-            return float(text)
+            value = float(text)
         except:
             return None
+        # Kennwerte ohne Tabellenwert (z.B. R_p02 bei Gusseisen) gelten als fehlend
+        return None if isnan(value) else value
     
     def get_nachgiebigkeit(self, param):
         """
@@ -617,9 +989,17 @@ class DauerfestigkeitWidget(QWidget):
         except:
             return None
     
+    def fmtab_paths(self):
+        """
+        Gibt die Excel-Dateien für F_MTab passend zum gewählten Schraubenquerschnitt zurück.
+        """
+        if self.schraubenquerschnitt_combobox.currentText() in ["Schaftschrauben", "Dickschaftschrauben"]:
+            return FMTAB_PATHS_SCHAFT
+        return FMTAB_PATHS_TAILLE
+
     def get_fmtab(self, d, festigkeitsklasse, my, p):
         """
-        Berechnet den Wert von F_MTab basierend auf den übergebenen Parametern.
+        Berechnet den Wert von F_MTab basierend auf den übergebenen Parametern (synchron).
 
         Args:
             d (float): Durchmesser.
@@ -630,76 +1010,74 @@ class DauerfestigkeitWidget(QWidget):
         Returns:
             float: Der Wert von F_MTab.
         """
-        # Definiert den Excel Pfad
-        if self.schraubenquerschnitt_combobox.currentText() in ["Schaftschrauben", "Dickschaftschrauben"]:
-            excel_paths = [
-                'stor/3b_37_Fm_Schaftschraube_Feingewinde.xls',
-                'stor/3b_37_Fm_Schaftschraube_Regelgewinde.xls'
-            ]
-        else:
-            excel_paths = [
-                'stor/3b_37_Fm_Schaftschraube_Feingewinde.xls',
-                'stor/3b_37_Fm_Taillenschraube_Regelgewinde.xls'
-            ]
-
-        # Formatiert p passend
-        p_str = f"{p:.1f}".rstrip('0').rstrip('.') if isinstance(p, float) else str(p)
-        d_str = f"{d:.1f}".rstrip('0').rstrip('.') if isinstance(d, float) else str(d)
-        
-        # definiert abm_value und my_column vor der Schleife
-        abm_value = f'M{d_str}x{p_str}'.replace('.', ',').replace(' ', '')
-        my_column = f"{my:.2f}".rstrip('0')
-
-        # Liest die Excel data in ein pandas DataFrame
-        for excel_path in excel_paths:
-            self.df = read_excel(excel_path, sheet_name="Tabelle")
-
-            # Extrahiere die Zeilenüberschriften aus der dritten Zeile (Index 1).
-            headers = self.df.iloc[1]
-            df_without_headers = DataFrame(self.df.values[3:], columns=headers)
-
-            # Bereinigt die 'Abm.'-Spalte, indem Leerzeichen entfernt werden
-            self.df['Abm.'] = self.df['Abm.'].str.replace(' ', '')
-
-            # Findet die Zeile basierend auf d und p 
-            row = self.df[self.df['Abm.'] == abm_value]
-            if row.empty:
-                continue  # Versuche den nächsten Excel-Pfad, wenn keine gültige Zeile gefunden wird
-
-            # Bestimmt die Differenz basierend auf festigkeitsklasse
-            festigkeitsklasse_diff = {
-                8.8: 0,
-                10.9: 1,
-                12.9: 2
-            }
-
-            diff = festigkeitsklasse_diff.get(festigkeitsklasse, None)
-            if diff is None:
-                self.vordim.setText("Ungültige Festigkeitsklasse")
-                return None
-
-            # Verschiebe die Zeilenauswahl um den Wert der Differenz nach unten
-            row_index = row.index[0] + diff
-            if row_index >= len(self.df):
-                self.vordim.setText(f"Index {row_index} out of range, cannot move down by {diff} rows")
-                return None
-
-            adjusted_row = self.df.iloc[row_index]
-
-             # Findet die Spalte basierend auf 'my'
-            df_without_headers.columns = df_without_headers.columns.map(str).str.strip()
-            df_without_headers.columns = df_without_headers.columns.fillna('NaN')
-
-            if my_column not in df_without_headers.columns:
-                continue  # Versucht den nächsten Excel-Pfad, falls keine gültige Spalte gefunden wird
-            else:
-                # Findet den Index der ersten Spalte, die mit dem angegeben String beginnt
-                column_index = next((i for i, col in enumerate(df_without_headers.columns) if col.startswith(my_column)), None)
+        F_mtab, message = lookup_fmtab(self.fmtab_paths(), d, festigkeitsklasse, my, p)
+        if message != None:
+            self.vordim.setText(message)
+        return F_mtab
 
-            # Get F_mtab Wert
-            F_mtab = adjusted_row.iloc[column_index]
+    def request_fmtab(self, d, festigkeitsklasse, my, p):
+        """
+        Gibt F_MTab aus dem Zwischenspeicher zurück oder startet die Tabellensuche im WorkerPool.
+        Ein neuer Auftrag verwirft einen noch laufenden mit anderen Eingaben. Sobald das Ergebnis
+        vorliegt, wird calculate erneut ausgeführt.
+
+        Args:
+            d (float): Durchmesser.
+            festigkeitsklasse (float): Festigkeitsklasse.
+            my (float): Reibungskoeffizient.
+            p (float): Steigung.
+
+        Returns:
+            float: Der Wert von F_MTab oder None, solange die Suche läuft.
+        """
+        paths = self.fmtab_paths()
+        key = (tuple(paths), d, festigkeitsklasse, my, p)
+        if key in self.fmtab_cache:
+            F_mtab, message = self.fmtab_cache[key]
+            if message != None:
+                self.vordim.setText(message)
             return F_mtab
+        if self.fmtab_pending != key:
+            self.fmtab_pending = key
+            self.vordim.setText("F<sub>M Tab</sub> wird aus den Tabellen gelesen ...")
+            self.mainwindow.worker_pool.submit("dauerfestigkeit/fmtab", lookup_fmtab, paths, d, festigkeitsklasse, my, p,
+                                               on_result=lambda result, key=key: self.fmtab_loaded(key, result),
+                                               on_error=lambda error, key=key: self.fmtab_loaded(key, (None, f"Fehler beim Lesen der F_MTab-Tabellen: {error}")))
+        return None
 
-        # Ausgabe, wenn in keinem Excel-Pfad eine gültige Zeile oder Spalte gefunden wird
-        self.vordim.setText(f"Keine gültige Zeile oder Spalte für {abm_value} und my = {my_column} in den angegebenen Dateien gefunden")
-        return None
\ No newline at end of file
+    def fmtab_berechnet(self, d, festigkeitsklasse, my, p, result):
+        """
+        Berechnet F_MTab analytisch (ν = 0,9, μ_G = μ_K = μ), wenn die Tabellen keinen Wert liefern,
+        z.B. für Reibungszahlen zwischen den Tabellenspalten.
+
+        Args:
+            d (float): Durchmesser.
+            festigkeitsklasse (float): Festigkeitsklasse.
+            my (float): Reibungskoeffizient.
+            p (float): Steigung.
+            result (tuple): Das Ergebnis der Tabellensuche, das ohne gültige Festigkeitsklasse zurückgegeben wird.
+
+        Returns:
+            tuple: (F_MTab oder None, Meldung oder None)
+        """
+        if festigkeitsklasse not in R_P02_MIN:
+            return result
+        taille = self.schraubenquerschnitt_combobox.currentText() == "Taillenschrauben"
+        F_Mzul = float(montagewerte(d, p, festigkeitsklasse, my, taille=taille)["F_Mzul"])
+        return F_Mzul, "F<sub>M Tab</sub> nicht tabelliert, F<sub>M zul</sub> wurde berechnet (ν = 0,9)"
+
+    def fmtab_loaded(self, key, result):
+        """
+        Übernimmt das Ergebnis der Tabellensuche aus dem WorkerPool und rechnet neu.
+
+        Args:
+            key (tuple): Die Eingaben, für die gesucht wurde.
+            result (tuple): F_MTab und Meldung aus lookup_fmtab.
+        """
+        if result[0] is None:
+            _, d, festigkeitsklasse, my, p = key
+            result = self.fmtab_berechnet(d, festigkeitsklasse, my, p, result)
+        self.fmtab_cache[key] = result
+        if self.fmtab_pending == key:
+            self.fmtab_pending = None
+        self.calculate()
@@ -0,0 +1,136 @@
+# Exzentrische Verspannung und exzentrische Belastung: Verspannungsfaktor, Biegespannung der Schraube und Klaffgrenze (NumPy-vektorisiert)
+from numpy import asarray, errstate, inf, pi, where
+
+
+def biegenachgiebigkeit(l_K, E_P, I_Bers):
+    """
+    Biegenachgiebigkeit der verspannten Teile β_P = l_K/(E_P*I_Bers).
+
+    Args:
+        l_K (array_like): Klemmlänge in mm.
+        E_P (array_like): E-Modul der verspannten Teile in N/mm².
+        I_Bers (array_like): Ersatzflächenträgheitsmoment der verspannten Teile in mm⁴.
+
+    Returns:
+        array_like: β_P in 1/(N*mm).
+    """
+    return asarray(l_K, dtype=float) / (asarray(E_P, dtype=float) * asarray(I_Bers, dtype=float))
+
+def verspannungsfaktor_exzentrisch(delta_s, delta_p, beta_P, s_sym=0.0, a=0.0, n=1.0):
+    """
+    Verspannungsfaktor bei exzentrischer Verspannung (Abstand s_sym der Schraubenachse von der Symmetrieachse
+    der Trennfuge) und exzentrischer Belastung (Abstand a der Wirkungslinie von F_A), s_sym und a auf derselben
+    Seite positiv:
+
+        δ_P* = δ_P + s_sym²*β_P,  δ_P** = δ_P + s_sym*a*β_P
+        φ_en* = n*δ_P**/(δ_S + δ_P*)
+
+    Für s_sym = a = 0 ergibt sich der Verspannungsfaktor der zentrischen Verbindung φ_n = n*δ_P/(δ_S + δ_P).
+
+    Returns:
+        dict: "delta_p_stern", "delta_p_stern_stern" in mm/N und "Phi_en".
+    """
+    delta_s, delta_p, beta_P, s_sym, a, n = (asarray(x, dtype=float) for x in (delta_s, delta_p, beta_P, s_sym, a, n))
+    delta_p_stern = delta_p + s_sym**2 * beta_P
+    delta_p_stern_stern = delta_p + s_sym * a * beta_P
+    return {"delta_p_stern": delta_p_stern, "delta_p_stern_stern": delta_p_stern_stern,
+            "Phi_en": n * delta_p_stern_stern / (delta_s + delta_p_stern)}
+
+def klaffgrenze(F_V, A_D, I_BT, u, s_sym=0.0, a=0.0, Phi_en=0.0):
+    """
+    Grenzen gegen das einseitige Abheben (Klaffen) der Trennfuge am Rand im Abstand u von der Symmetrieachse
+    (auf der Seite der Belastung). Die Flächenpressung wird linear über die Trennfuge angenommen.
+
+    Mindestklemmkraft gegen Klaffen für F_A = 1 N (mit F_A multiplizieren):
+
+        F_KA/F_A = (a - s_sym)*u*A_D/(I_BT + s_sym*u*A_D)
+
+    Betriebskraft an der Klaffgrenze bei der Vorspannkraft F_V (aus p_U = 0 mit F_S = F_V + φ_en*F_A):
+
+        F_Aab = F_V*(I_BT + s_sym*u*A_D)/((1 - φ_en)*I_BT + (a - φ_en*s_sym)*u*A_D)
+
+    Args:
+        F_V (array_like): Vorspannkraft in N (für den Nachweis die kleinste, F_Mmin - F_Z).
+        A_D (array_like): Fläche der Trennfuge in mm².
+        I_BT (array_like): Flächenträgheitsmoment der Trennfuge in mm⁴.
+        u (array_like): Randabstand des Klaffpunkts von der Symmetrieachse in mm.
+        s_sym (array_like, optional): Abstand der Schraubenachse von der Symmetrieachse in mm.
+        a (array_like, optional): Abstand der Wirkungslinie von F_A von der Symmetrieachse in mm.
+        Phi_en (array_like, optional): Verspannungsfaktor φ_en*.
+
+    Returns:
+        dict: "F_KA_je_F_A" und "F_Aab" in N (inf, wenn die Fuge unter Zug nicht klafft).
+    """
+    F_V, A_D, I_BT, u, s_sym, a, Phi_en = (asarray(x, dtype=float) for x in (F_V, A_D, I_BT, u, s_sym, a, Phi_en))
+    tragend = I_BT + s_sym * u * A_D
+    nenner = (1 - Phi_en) * I_BT + (a - Phi_en * s_sym) * u * A_D
+    with errstate(divide='ignore', invalid='ignore'):
+        return {"F_KA_je_F_A": (a - s_sym) * u * A_D / tragend,
+                "F_Aab": where(nenner > 0, F_V * tragend / nenner, inf)}
+
+def biegespannung(F_A, Phi_en, s_sym, a, l_K, l_ers, E_S, E_P, I_Bers, d_S, A_d0):
+    """
+    Zusätzliche Schraubenspannung aus Zug und Biegung bei exzentrischer Belastung (gültig bis zur Klaffgrenze):
+
+        σ_SAb = (1 + (1/φ_en* - s_sym/a)*(l_K/l_ers)*(E_S/E_P)*π*a*d_S³/(8*I_Bers))*φ_en*F_A/A_d0
+              = (φ_en* + (a - s_sym*φ_en*)*(l_K/l_ers)*(E_S/E_P)*π*d_S³/(8*I_Bers))*F_A/A_d0
+
+    Args:
+        F_A (array_like): Betriebskraft in N (für den Ausschlag F_Ao - F_Au).
+        Phi_en (array_like): Verspannungsfaktor φ_en*.
+        s_sym (array_like): Abstand der Schraubenachse von der Symmetrieachse in mm.
+        a (array_like): Abstand der Wirkungslinie von F_A von der Symmetrieachse in mm.
+        l_K (array_like): Klemmlänge in mm.
+        l_ers (array_like): Ersatzbiegelänge der Schraube in mm (ohne genaueren Wert l_K).
+        E_S (array_like): E-Modul der Schraube in N/mm².
+        E_P (array_like): E-Modul der verspannten Teile in N/mm².
+        I_Bers (array_like): Ersatzflächenträgheitsmoment der verspannten Teile in mm⁴.
+        d_S (array_like): Schaftdurchmesser der Schraube in mm.
+        A_d0 (array_like): Maßgebender Querschnitt (A_s) in mm².
+
+    Returns:
+        array_like: σ_SAb in N/mm².
+    """
+    F_A, Phi_en, s_sym, a, l_K, l_ers, E_S, E_P, I_Bers, d_S, A_d0 = (
+        asarray(x, dtype=float) for x in (F_A, Phi_en, s_sym, a, l_K, l_ers, E_S, E_P, I_Bers, d_S, A_d0))
+    biegung = (a - s_sym * Phi_en) * l_K / l_ers * E_S / E_P * pi * d_S**3 / (8 * I_Bers)
+    return (Phi_en + biegung) * F_A / A_d0
+
+def exzentrische_verbindung(delta_s, delta_p, F_V, F_Ao, l_K, E_S, E_P, I_Bers, A_D, u, d_S, A_s,
+                            s_sym=0.0, a=0.0, n=1.0, F_Au=0.0, I_BT=None, l_ers=None):
+    """
+    Exzentrische Einschraubenverbindung in einem Aufruf, vektorisiert über alle Argumente
+    (z.B. Arrays von s_sym und a für Parameterstudien).
+
+    Args:
+        delta_s, delta_p (array_like): Nachgiebigkeiten der Schraube und der verspannten Teile in mm/N.
+        F_V (array_like): Kleinste Vorspannkraft in N.
+        F_Ao, F_Au (array_like): Ober- und Untergrenze der Betriebskraft in N.
+        l_K, E_S, E_P, I_Bers, d_S: Siehe biegespannung.
+        A_D, u: Siehe klaffgrenze.
+        A_s (array_like): Spannungsquerschnitt in mm².
+        s_sym, a (array_like, optional): Exzentrizitäten in mm.
+        n (array_like, optional): Krafteinleitungsfaktor.
+        I_BT (array_like, optional): Flächenträgheitsmoment der Trennfuge, Standard I_Bers.
+        l_ers (array_like, optional): Ersatzbiegelänge der Schraube, Standard l_K.
+
+    Returns:
+        dict: "beta_P", "Phi_en", "delta_p_stern", "delta_p_stern_stern", "F_KA" (für F_Ao), "F_Aab",
+            "sigma_SAbo" (für F_Ao) und die Ausschlagsspannung "sigma_ab" = |σ_SAbo - σ_SAbu|/2.
+    """
+    I_BT = I_Bers if I_BT is None else I_BT
+    l_ers = l_K if l_ers is None else l_ers
+    beta_P = biegenachgiebigkeit(l_K, E_P, I_Bers)
+    ergebnis = verspannungsfaktor_exzentrisch(delta_s, delta_p, beta_P, s_sym, a, n)
+    Phi_en = ergebnis["Phi_en"]
+    klaffen = klaffgrenze(F_V, A_D, I_BT, u, s_sym, a, Phi_en)
+    sigma_SAbo = biegespannung(F_Ao, Phi_en, s_sym, a, l_K, l_ers, E_S, E_P, I_Bers, d_S, A_s)
+    sigma_SAbu = biegespannung(F_Au, Phi_en, s_sym, a, l_K, l_ers, E_S, E_P, I_Bers, d_S, A_s)
+    ergebnis.update({
+        "beta_P": beta_P,
+        "F_KA": klaffen["F_KA_je_F_A"] * asarray(F_Ao, dtype=float),
+        "F_Aab": klaffen["F_Aab"],
+        "sigma_SAbo": sigma_SAbo,
+        "sigma_ab": abs(sigma_SAbo - sigma_SAbu) / 2,
+    })
+    return ergebnis
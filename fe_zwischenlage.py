@@ -0,0 +1,252 @@
+# Achsensymmetrisches FE-Modell der verspannten Teile (lineare Elastizität, 4-Knoten-Ringelemente) für δ_p und δ_pn
+from functools import lru_cache
+from itertools import pairwise
+
+from numpy import (
+    arange,
+    array,
+    asarray,
+    ceil,
+    concatenate,
+    cumsum,
+    einsum,
+    flatnonzero,
+    interp,
+    isfinite,
+    linspace,
+    meshgrid,
+    ones,
+    pi,
+    repeat,
+    searchsorted,
+    sqrt,
+    tile,
+    unique,
+    zeros,
+)
+
+try:
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.linalg import splu
+except ImportError:  # scipy ist optional, nur für die FE-Berechnung nötig
+    coo_matrix = None
+    splu = None
+
+# Gaußpunkte 2x2
+_GAUSS = [(-1 / sqrt(3), -1 / sqrt(3)), (1 / sqrt(3), -1 / sqrt(3)), (1 / sqrt(3), 1 / sqrt(3)), (-1 / sqrt(3), 1 / sqrt(3))]
+# Eckknoten (ξ, η) in der Reihenfolge (r0, z0), (r1, z0), (r1, z1), (r0, z1)
+_ECKEN = array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=float)
+# Wachstumsfaktor der Elementbreite außerhalb des Verformungsbereichs (r > d_k/2 + l_K)
+WACHSTUM = 1.25
+
+def fe_verfuegbar():
+    """
+    Gibt zurück, ob scipy für die FE-Berechnung installiert ist.
+    """
+    return splu is not None
+
+def _teilung(stuetzstellen, groesse):
+    """
+    Unterteilt die Intervalle zwischen den (sortierten) Stützstellen gleichmäßig in Elemente der Größe ≤ groesse.
+    """
+    stuetzstellen = unique(asarray(stuetzstellen, dtype=float))
+    knoten = [stuetzstellen[:1]]
+    for a, b in pairwise(stuetzstellen):
+        anzahl = max(int(ceil((b - a) / groesse - 1e-9)), 1)
+        knoten.append(linspace(a, b, anzahl + 1)[1:])
+    return concatenate(knoten)
+
+def _knoten_r(r_i, r_k, r_a, stuetzstellen, groesse):
+    """
+    Radiale Knoten: gleichmäßig bis r_k + Abstand, danach geometrisch wachsend bis r_a.
+    """
+    innen = [x for x in stuetzstellen if x <= r_k] + [r_i, r_k]
+    knoten = _teilung(innen, groesse)
+    r, h = knoten[-1], groesse
+    aussen = [x for x in stuetzstellen if x > r_k] + [r_a]
+    while r < r_a - 1e-9:
+        h *= WACHSTUM
+        naechste = min([x for x in aussen if x > r + 1e-9])
+        r = naechste if r + 1.5 * h >= naechste else r + h
+        knoten = concatenate([knoten, [r]])
+    return knoten
+
+def _steifigkeit(r, z, aktiv, E_elem, nu):
+    """
+    Assembliert die Steifigkeitsmatrix aller aktiven Elemente (vektorisiert über die Elemente).
+    """
+    n_r = len(r)
+    j, i = (flatnonzero(aktiv) // (n_r - 1)), (flatnonzero(aktiv) % (n_r - 1))
+    r_0, r_1 = r[i], r[i + 1]
+    dr, dz = r_1 - r_0, z[j + 1] - z[j]
+    E_e = E_elem[aktiv.ravel()]
+    knoten = array([j * n_r + i, j * n_r + i + 1, (j + 1) * n_r + i + 1, (j + 1) * n_r + i]).T
+    freiheitsgrade = repeat(2 * knoten, 2, axis=1) + tile([0, 1], 4)
+
+    faktor = 1 / ((1 + nu) * (1 - 2 * nu))
+    D = faktor * array([[1 - nu, nu, nu, 0], [nu, 1 - nu, nu, 0], [nu, nu, 1 - nu, 0], [0, 0, 0, (1 - 2 * nu) / 2]])
+    K_e = zeros((len(E_e), 8, 8))
+    for xi, eta in _GAUSS:
+        N = (1 + _ECKEN[:, 0] * xi) * (1 + _ECKEN[:, 1] * eta) / 4
+        dN_dr = _ECKEN[:, 0] * (1 + _ECKEN[:, 1] * eta) / 4 * 2 / dr[:, None]
+        dN_dz = _ECKEN[:, 1] * (1 + _ECKEN[:, 0] * xi) / 4 * 2 / dz[:, None]
+        r_g = r_0 + (1 + xi) / 2 * dr
+        B = zeros((len(E_e), 4, 8))
+        B[:, 0, 0::2] = dN_dr
+        B[:, 1, 1::2] = dN_dz
+        B[:, 2, 0::2] = N / r_g[:, None]
+        B[:, 3, 0::2] = dN_dz
+        B[:, 3, 1::2] = dN_dr
+        gewicht = E_e * 2 * pi * r_g * dr * dz / 4
+        K_e += einsum('ekm,kl,eln,e->emn', B, D, B, gewicht)
+    zeilen = repeat(freiheitsgrade, 8, axis=1).ravel()
+    spalten = tile(freiheitsgrade, 8).ravel()
+    anzahl = 2 * n_r * len(z)
+    return coo_matrix((K_e.ravel(), (zeilen, spalten)), shape=(anzahl, anzahl)).tocsc()
+
+def _flaechenlast(r, spalten, zeilen_knoten, n_r, anzahl):
+    """
+    Konsistente Knotenlasten einer gleichmäßigen Flächenpressung mit der Resultierenden 1 N auf den Stirnflächen
+    der angegebenen Elementspalten (axial, in den Knotenzeilen zeilen_knoten je Spalte).
+    """
+    f = zeros(anzahl)
+    r_0, r_1 = r[spalten], r[spalten + 1]
+    flaeche = (pi * (r_1**2 - r_0**2)).sum()
+    links = 2 * pi * (r_1 - r_0) * (2 * r_0 + r_1) / 6 / flaeche
+    rechts = 2 * pi * (r_1 - r_0) * (r_0 + 2 * r_1) / 6 / flaeche
+    for knoten, last in ((zeilen_knoten * n_r + spalten, links), (zeilen_knoten * n_r + spalten + 1, rechts)):
+        f[2 * knoten + 1] += last
+    return f
+
+class _Modell:
+    """
+    Vernetztes und faktorisiertes FE-Modell mit der Lösung für die Einheitsklemmkraft (wird in modell() zwischengespeichert).
+    """
+    def __init__(self, d_k, D_B, D_A, h, E, nu, verbindungsart, aussparungen, elementgroesse):
+        r_i, l_K = D_B / 2, sum(h)
+        r_k = d_k / 2
+        # Unendlich ausgedehnte Zwischenlage: Rand außerhalb jedes Verformungskegels (φ ≤ 45°)
+        r_a = D_A / 2 if isfinite(D_A) else r_k + 1.5 * l_K
+        r_k = min(r_k, r_a)
+        if elementgroesse is None:
+            elementgroesse = min((r_k - r_i) / 6, l_K / 20)
+        grenzen_z = concatenate([[0], cumsum(h)])
+        r = _knoten_r(r_i, r_k, r_a, [x for a in aussparungen for x in a[:2] if r_i < x < r_a], elementgroesse)
+        z = _teilung(list(grenzen_z) + [x for a in aussparungen for x in a[2:] if 0 < x < l_K], elementgroesse)
+        n_r, n_z = len(r), len(z)
+
+        # Aktive Elemente und E-Modul je Element aus der Schicht seiner Mitte
+        r_m, z_m = meshgrid((r[:-1] + r[1:]) / 2, (z[:-1] + z[1:]) / 2)
+        aktiv = ones(r_m.shape, dtype=bool)
+        for r_1, r_2, z_1, z_2 in aussparungen:
+            aktiv &= ~((r_m > r_1) & (r_m < r_2) & (z_m > z_1) & (z_m < z_2))
+        E_elem = asarray(E, dtype=float)[searchsorted(grenzen_z[1:-1], z_m, side='right')].ravel()
+        K = _steifigkeit(r, z, aktiv, E_elem, nu)
+
+        # Auflagen: oberstes bzw. unterstes aktives Element je Spalte unter Kopf und Mutter
+        spalten_k = flatnonzero(r[1:] <= r_k + 1e-9)
+        spalten_k = spalten_k[aktiv[:, spalten_k].any(axis=0)]
+        oben = aktiv[:, spalten_k].argmax(axis=0)
+        unten = n_z - 2 - aktiv[::-1, spalten_k].argmax(axis=0)
+        anzahl = 2 * n_r * n_z
+        self.f_kopf = _flaechenlast(r, spalten_k, oben, n_r, anzahl)
+        self.f_mutter = _flaechenlast(r, spalten_k, unten + 1, n_r, anzahl)
+
+        # Freiheitsgrade der Knoten ohne aktives Element entfallen
+        benutzt = zeros((n_z, n_r), dtype=bool)
+        for dj in (0, 1):
+            for di in (0, 1):
+                benutzt[dj:n_z - 1 + dj, di:n_r - 1 + di] |= aktiv
+        frei = repeat(benutzt.ravel(), 2)
+        if verbindungsart == "Durchsteckverbindung":
+            # Kopf- und Mutterauflage im Gleichgewicht, ein Knoten gegen Starrkörperverschiebung gehalten
+            f = self.f_kopf - self.f_mutter
+            frei[flatnonzero(self.f_mutter)[0]] = False
+        else:
+            # Einschraubverbindung: Zwischenlage liegt reibungsfrei auf dem starren Grundkörper auf
+            f = self.f_kopf
+            spalten = arange(n_r - 1)[aktiv.any(axis=0)]
+            boden = n_z - 1 - aktiv[::-1, spalten].argmax(axis=0)
+            frei[2 * (boden * n_r + spalten) + 1] = False
+            frei[2 * (boden * n_r + spalten + 1) + 1] = False
+        index = flatnonzero(frei)
+        self.faktorisierung = splu(K[index][:, index])
+        self.u = zeros(anzahl)
+        self.u[index] = self.faktorisierung.solve(f[index])
+
+        # Mittlere axiale Verschiebung je Knotenebene im Bereich der Auflage D_B..d_k (mit Flächen gewichtet),
+        # an den Auflagen selbst arbeitskonjugiert
+        self.z = z
+        self.u_z = zeros(n_z)
+        for j in range(n_z):
+            spalten_j = spalten_k[benutzt[j, spalten_k] & benutzt[j, spalten_k + 1]]
+            if len(spalten_j):
+                self.u_z[j] = _flaechenlast(r, spalten_j, j + 0 * spalten_j, n_r, anzahl) @ self.u
+        self.u_z[0] = self.f_kopf @ self.u
+        self.u_z[-1] = self.f_mutter @ self.u if verbindungsart == "Durchsteckverbindung" else 0.0
+        self.grenzen_z = grenzen_z
+        self.l_K = l_K
+        self.elemente = int(aktiv.sum())
+        self.freiheitsgrade = len(index)
+
+    def verschiebung(self, tiefe):
+        """
+        Mittlere axiale Verschiebung je N in der Tiefe (von der Kopfauflage aus), zwischen den Knotenebenen interpoliert.
+        """
+        return interp(tiefe, self.z, self.u_z)
+
+@lru_cache(maxsize=32)
+def modell(d_k, D_B, D_A, h, E, nu=0.3, verbindungsart="Durchsteckverbindung", aussparungen=(), elementgroesse=None):
+    """
+    Erstellt (oder liefert aus dem Zwischenspeicher) Netz, Faktorisierung und Einheitslösung eines Querschnitts.
+    Alle Argumente müssen hashbar sein (Tupel statt Listen).
+    """
+    if splu is None:
+        raise ImportError("Für die FE-Berechnung wird scipy benötigt (pip install scipy).")
+    return _Modell(d_k, D_B, D_A, h, E, nu, verbindungsart, aussparungen, elementgroesse)
+
+def fe_nachgiebigkeit(d_k, D_B, D_A, h, E, nu=0.3, verbindungsart="Durchsteckverbindung", aussparungen=(), n=None, elementgroesse=None):
+    """
+    Berechnet die Nachgiebigkeit der verspannten Teile mit einem achsensymmetrischen FE-Modell.
+
+    Der Querschnitt ist ein Ring D_B..D_A aus Schichten h (von der Kopfauflage aus) mit den E-Moduln E.
+    Die Klemmkraft wirkt als gleichmäßige Flächenpressung auf den Auflagen D_B..d_k; bei Senkungen o.ä.
+    (Aussparungen) auf der jeweils ersten Materialschicht darunter. Bei Einschraubverbindungen liegt die
+    Zwischenlage auf einem starren Grundkörper auf.
+
+    Netz und Faktorisierung werden je Querschnitt zwischengespeichert; weitere Lastfälle (δ_pn für andere n)
+    werten nur die vorhandene Lösung aus.
+
+    Args:
+        d_k (float): Außendurchmesser der Kopf- bzw. Mutterauflage in mm.
+        D_B (float): Bohrungsdurchmesser in mm.
+        D_A (float): Außendurchmesser der Zwischenlage in mm (inf für unendlich ausgedehnt).
+        h (list): Schichtdicken in mm.
+        E (list): E-Moduln der Schichten in N/mm².
+        nu (float, optional): Querkontraktionszahl.
+        verbindungsart (str, optional): "Durchsteckverbindung" oder "Einschraubverbindung".
+        aussparungen (list, optional): Entfernte Bereiche (r_1, r_2, z_1, z_2) in mm, z von der Kopfauflage aus,
+            z.B. eine Senkung (D_B/2, D_S/2, 0, t_S).
+        n (array_like, optional): Krafteinleitungsfaktoren für δ_pn (Krafteinleitungsebenen symmetrisch zur Mitte).
+        elementgroesse (float, optional): Elementkantenlänge in mm, Standard (d_k - D_B)/12 bzw. l_K/20.
+
+    Returns:
+        dict: "delta_p" (mm/N), "delta" und "A" je Schicht, "delta_pn" (für n, sonst None),
+            "elemente" und "freiheitsgrade".
+    """
+    ergebnis = modell(float(d_k), float(D_B), float(D_A), tuple(float(x) for x in h), tuple(float(x) for x in E), float(nu),
+                      verbindungsart, tuple(tuple(float(x) for x in a) for a in aussparungen), elementgroesse)
+    u_grenzen = ergebnis.verschiebung(ergebnis.grenzen_z)
+    delta = u_grenzen[:-1] - u_grenzen[1:]
+    delta_pn = None
+    if n is not None:
+        n = asarray(n, dtype=float)
+        delta_pn = ergebnis.verschiebung(ergebnis.l_K * (1 - n) / 2) - ergebnis.verschiebung(ergebnis.l_K * (1 + n) / 2)
+    return {
+        "delta_p": float(u_grenzen[0] - u_grenzen[-1]),
+        "delta": delta,
+        "A": asarray(h, dtype=float) / (asarray(E, dtype=float) * delta),
+        "delta_pn": delta_pn,
+        "elemente": ergebnis.elemente,
+        "freiheitsgrade": ergebnis.freiheitsgrade,
+    }
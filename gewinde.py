@@ -1,9 +1,10 @@
 from PyQt5.QtCore import pyqtSignal
-from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QGroupBox
+from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QGroupBox, QCompleter
 from PyQt5.QtCore import Qt
  
 
 from numpy import pi, arctan, tan
+from gewindedaten import BEZEICHNUNGEN, get_gewinde, gewinde_nach_bezeichnung, naechstes_gewinde
 
 class GewindeWidget(QWidget):
     
@@ -31,6 +32,8 @@ class GewindeWidget(QWidget):
         spiel_edit (QLineEdit): Eingabefeld für das Spiel im Gewinde.
         spiel_label (QLabel): Label für das Spiel im Gewinde.
         spiel_unit_label (QLabel): Einheiten-Label für das Spiel im Gewinde.
+        normgewinde_edit (QLineEdit): Eingabefeld mit Autovervollständigung für Normgewinde (z.B. M12x1,5).
+        normgewinde_label (QLabel): Hinweis, ob (d, P) ein Normgewinde ist.
         changed_d (pyqtSignal): Signal, das den neuen Durchmesserwert übermittelt.
         changed_a_s (pyqtSignal): Signal, das den neuen Spannungsquerschnittswert übermittelt.
     """
@@ -87,6 +90,16 @@ class GewindeWidget(QWidget):
         scroll_layout.addWidget(gewinde_label, 1, 0)
         scroll_layout.addWidget(self.gewindeart_box, 1, 1)
 
+        # Auswahl eines Normgewindes aus dem Gewindekatalog
+        self.normgewinde_edit = QLineEdit()
+        self.normgewinde_edit.setPlaceholderText("Normgewinde, z.B. M12x1,5")
+        self.normgewinde_edit.setToolTip("Regel- und Feingewinde nach ISO 261/262, Trapezgewinde nach ISO 2904")
+        completer = QCompleter([gewinde["bezeichnung"] for gewinde in BEZEICHNUNGEN.values()], self.normgewinde_edit)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.normgewinde_edit.setCompleter(completer)
+        self.normgewinde_edit.editingFinished.connect(self.set_normgewinde)
+        scroll_layout.addWidget(self.normgewinde_edit, 1, 2)
+
         for pflicht,name,unit,param, verweis in eingaben:
             k=k+1
             if pflicht == 1:
@@ -112,6 +125,9 @@ class GewindeWidget(QWidget):
                 name_label.hide()
                 unit_label.hide()
 
+        self.normgewinde_label = QLabel("")
+        scroll_layout.addWidget(self.normgewinde_label, 2 + k, 0, 1, 3)
+
     def calculate(self):
         """
         Berechnet verschiedene Parameter basierend auf den Werten der Eingabefelder.
@@ -226,6 +242,8 @@ class GewindeWidget(QWidget):
                 d_2 = p_h / (tan(alpha) * pi)
                 self.set_value("d_2", d_2)
                 changes = True
+        self.check_normgewinde()
+
         # Am Ende der Kalkulation werden die Signal-Werte nochmals ausgelesen und an die anderen Widgets übergeben
         d = self.get_value("d")
         if d != None:
@@ -237,6 +255,43 @@ class GewindeWidget(QWidget):
         self.mainwindow.wirkungsgrad_widget.calculate()
         self.mainwindow.dauerfestigkeit_widget.calculate()
 
+    def set_normgewinde(self):
+        """
+        Übernimmt d, P (und a_c beim Trapezgewinde) des im Eingabefeld gewählten Normgewindes und rechnet neu.
+        Abgeleitete Größen werden vorher geleert, damit sie aus den Normwerten neu berechnet werden.
+        """
+        gewinde = gewinde_nach_bezeichnung(self.normgewinde_edit.text())
+        if gewinde is None:
+            if self.normgewinde_edit.text():
+                self.normgewinde_label.setText("Unbekanntes Normgewinde")
+            return
+        self.gewindeart_box.setCurrentText(gewinde["gewindeart"])
+        for param in ["p_h", "alpha", "d_2", "d_3", "d_s", "A_s"]:
+            self.line_edits[param].clear()
+        self.set_value("d", gewinde["d"])
+        self.set_value("P", gewinde["P"])
+        if self.get_value("n") == None:
+            self.set_value("n", 1)
+        if gewinde["gewindeart"] == "ISO-Trapezgewinde":
+            self.set_value("a_c", gewinde["a_c"])
+        self.calculate()
+
+    def check_normgewinde(self):
+        """
+        Prüft, ob (d, P) ein Normgewinde ist, und schlägt sonst das nächstgelegene vor.
+        """
+        d = self.get_value("d")
+        P = self.get_value("P")
+        if d == None or P == None:
+            self.normgewinde_label.setText("")
+            return
+        gewinde = get_gewinde(self.gewindeart, d, P)
+        if gewinde is not None:
+            self.normgewinde_label.setText(f"Normgewinde {gewinde['bezeichnung']}")
+        else:
+            vorschlag = naechstes_gewinde(self.gewindeart, d, P)
+            self.normgewinde_label.setText(f"Kein Normgewinde, nächstes Normgewinde: {vorschlag['bezeichnung']}")
+
     def gewindeart_changed(self):
         """
         Aktualisiert die Benutzeroberfläche basierend auf der ausgewählten Gewindeart.
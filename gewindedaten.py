@@ -0,0 +1,194 @@
+# Normgewinde: ISO-Spitzgewinde (Regel- und Feingewinde nach ISO 261/262) und ISO-Trapezgewinde (ISO 2904)
+from bisect import bisect_left
+
+from numpy import array, pi
+
+GEWINDEARTEN = ["ISO-Spitzgewinde", "ISO-Trapezgewinde"]
+
+# Nenndurchmesser d [mm] -> Teilung P [mm]
+REGELGEWINDE = {3: 0.5, 4: 0.7, 5: 0.8, 6: 1, 8: 1.25, 10: 1.5, 12: 1.75, 14: 2, 16: 2, 18: 2.5, 20: 2.5, 22: 2.5, 24: 3,
+                27: 3, 30: 3.5, 33: 3.5, 36: 4, 39: 4, 42: 4.5, 45: 4.5, 48: 5, 52: 5, 56: 5.5, 60: 5.5, 64: 6}
+FEINGEWINDE = {8: [1], 10: [1, 1.25], 12: [1.25, 1.5], 14: [1.5], 16: [1.5], 18: [1.5], 20: [1.5], 22: [1.5], 24: [2],
+               27: [2], 30: [2], 33: [2], 36: [3], 39: [3], 42: [3], 45: [3], 48: [3], 52: [4], 56: [4], 60: [4], 64: [4]}
+TRAPEZGEWINDE = {8: 1.5, 10: 2, 12: 3, 14: 3, 16: 4, 18: 4, 20: 4, 22: 5, 24: 5, 26: 5, 28: 5, 30: 6, 32: 6, 36: 6,
+                 40: 7, 44: 7, 48: 8, 52: 8, 60: 9, 70: 10, 80: 10, 100: 12}
+
+SPALTEN = ["d", "P", "d_2", "d_3", "d_s", "A_s", "h_3", "a_c"]
+
+def spiel_trapezgewinde(P):
+    """
+    Spiel im Gewinde a_c eines ISO-Trapezgewindes in Abhängigkeit der Teilung P (ISO 2904).
+    """
+    if P <= 1.5:
+        return 0.15
+    if P <= 5:
+        return 0.25
+    if P <= 12:
+        return 0.5
+    return 1.0
+
+def gewinde_kennwerte(gewindeart, d, P, a_c=0.0):
+    """
+    Berechnet die Durchmesser und den Spannungsquerschnitt eines Gewindes (wie GewindeWidget.calculate).
+    Funktioniert auch mit NumPy-Arrays für d und P.
+
+    Args:
+        gewindeart (str): "ISO-Spitzgewinde" oder "ISO-Trapezgewinde".
+        d (float): Außendurchmesser.
+        P (float): Teilung.
+        a_c (float, optional): Spiel im Gewinde (nur ISO-Trapezgewinde).
+
+    Returns:
+        dict: Die Kennwerte mit den Schlüsseln aus SPALTEN.
+    """
+    if gewindeart == "ISO-Spitzgewinde":
+        d_2 = d - 0.650 * P
+        d_3 = d - 1.227 * P
+        h_3 = (d - d_3) / 2
+    else:
+        d_2 = d - 0.5 * P
+        h_3 = 0.5 * P + a_c
+        d_3 = d - 2 * h_3
+    d_s = (d_2 + d_3) / 2
+    return {"d": d, "P": P, "d_2": d_2, "d_3": d_3, "d_s": d_s, "A_s": pi * d_s**2 / 4, "h_3": h_3, "a_c": a_c}
+
+def bezeichnung(gewindeart, d, P, reihe="Regelgewinde"):
+    """
+    Gibt die Kurzbezeichnung eines Gewindes zurück, z.B. "M12", "M12x1,5" oder "Tr40x7".
+    """
+    def zahl(x):
+        return f"{x:g}".replace('.', ',')
+    if gewindeart == "ISO-Trapezgewinde":
+        return f"Tr{zahl(d)}x{zahl(P)}"
+    if reihe == "Regelgewinde":
+        return f"M{zahl(d)}"
+    return f"M{zahl(d)}x{zahl(P)}"
+
+def _katalog_zeilen(gewindeart):
+    """
+    Erzeugt die nach (d, P) sortierten Katalogzeilen einer Gewindeart.
+    """
+    zeilen = []
+    if gewindeart == "ISO-Spitzgewinde":
+        for d, P in REGELGEWINDE.items():
+            zeilen.append((d, P, "Regelgewinde", 0.0))
+        for d, steigungen in FEINGEWINDE.items():
+            for P in steigungen:
+                zeilen.append((d, P, "Feingewinde", 0.0))
+    else:
+        for d, P in TRAPEZGEWINDE.items():
+            zeilen.append((d, P, "Trapezgewinde", spiel_trapezgewinde(P)))
+    zeilen.sort()
+    katalog = []
+    for d, P, reihe, a_c in zeilen:
+        gewinde = gewinde_kennwerte(gewindeart, float(d), float(P), a_c)
+        gewinde["gewindeart"] = gewindeart
+        gewinde["reihe"] = reihe
+        gewinde["bezeichnung"] = bezeichnung(gewindeart, d, P, reihe)
+        katalog.append(gewinde)
+    return katalog
+
+# Katalog je Gewindeart, sortiert nach (d, P), und Indizes für die binäre Suche
+KATALOG = {gewindeart: _katalog_zeilen(gewindeart) for gewindeart in GEWINDEARTEN}
+_INDEX = {(gewinde["gewindeart"], gewinde["d"], gewinde["P"]): gewinde for gewindeart in GEWINDEARTEN for gewinde in KATALOG[gewindeart]}
+_DURCHMESSER = {gewindeart: sorted({gewinde["d"] for gewinde in KATALOG[gewindeart]}) for gewindeart in GEWINDEARTEN}
+_STEIGUNGEN = {}
+for _gewindeart in GEWINDEARTEN:
+    for _gewinde in KATALOG[_gewindeart]:
+        _STEIGUNGEN.setdefault((_gewindeart, _gewinde["d"]), []).append(_gewinde["P"])
+_A_S = {}
+for _gewindeart in GEWINDEARTEN:
+    for _reihe in (None, "Regelgewinde", "Feingewinde", "Trapezgewinde"):
+        _zeilen = sorted((g for g in KATALOG[_gewindeart] if _reihe is None or g["reihe"] == _reihe), key=lambda g: (g["A_s"], g["d"]))
+        if _zeilen:
+            _A_S[(_gewindeart, _reihe)] = ([g["A_s"] for g in _zeilen], _zeilen)
+BEZEICHNUNGEN = {gewinde["bezeichnung"].upper(): gewinde for gewindeart in GEWINDEARTEN for gewinde in KATALOG[gewindeart]}
+
+def get_gewinde(gewindeart, d, P=None):
+    """
+    Gibt ein Normgewinde aus dem Katalog zurück.
+
+    Args:
+        gewindeart (str): "ISO-Spitzgewinde" oder "ISO-Trapezgewinde".
+        d (float): Außendurchmesser.
+        P (float, optional): Teilung. Ohne Angabe die Regelsteigung bzw. die Steigung nach ISO 2904.
+
+    Returns:
+        dict: Die Kennwerte (SPALTEN sowie "gewindeart", "reihe", "bezeichnung") oder None, wenn kein Normgewinde.
+    """
+    if P is None:
+        steigungen = _STEIGUNGEN.get((gewindeart, float(d)))
+        if steigungen is None:
+            return None
+        P = REGELGEWINDE.get(d, steigungen[-1]) if gewindeart == "ISO-Spitzgewinde" else steigungen[0]
+    return _INDEX.get((gewindeart, round(float(d), 3), round(float(P), 3)))
+
+def gewinde_nach_bezeichnung(text):
+    """
+    Sucht ein Normgewinde nach seiner Kurzbezeichnung (z.B. "M12x1.5", "m10" oder "Tr40x7").
+
+    Returns:
+        dict: Das Gewinde oder None.
+    """
+    return BEZEICHNUNGEN.get(text.strip().upper().replace('.', ',').replace(' ', ''))
+
+def naechster_durchmesser(gewindeart, d):
+    """
+    Gibt den nächstgelegenen genormten Außendurchmesser zurück (binäre Suche).
+    """
+    durchmesser = _DURCHMESSER[gewindeart]
+    i = bisect_left(durchmesser, d)
+    kandidaten = durchmesser[max(i - 1, 0):i + 1]
+    return min(kandidaten, key=lambda x: abs(x - d))
+
+def naechste_steigung(gewindeart, d, P):
+    """
+    Gibt die nächstgelegene genormte Teilung für einen genormten Außendurchmesser d zurück.
+
+    Returns:
+        float: Die Teilung oder None, wenn d kein genormter Durchmesser ist.
+    """
+    steigungen = _STEIGUNGEN.get((gewindeart, float(d)))
+    if steigungen is None:
+        return None
+    i = bisect_left(steigungen, P)
+    kandidaten = steigungen[max(i - 1, 0):i + 1]
+    return min(kandidaten, key=lambda x: abs(x - P))
+
+def naechstes_gewinde(gewindeart, d, P):
+    """
+    Rastet eine beliebige Eingabe (d, P) auf das nächste Normgewinde ein: erst der Durchmesser, dann die Teilung.
+
+    Returns:
+        dict: Das nächstgelegene Normgewinde.
+    """
+    d_norm = naechster_durchmesser(gewindeart, d)
+    return get_gewinde(gewindeart, d_norm, naechste_steigung(gewindeart, d_norm, P))
+
+def gewinde_fuer_A_s(gewindeart, A_s_min, reihe=None):
+    """
+    Gibt das kleinste Normgewinde mit einem Spannungsquerschnitt A_s ≥ A_s_min zurück (binäre Suche).
+
+    Args:
+        gewindeart (str): "ISO-Spitzgewinde" oder "ISO-Trapezgewinde".
+        A_s_min (float): Erforderlicher Spannungsquerschnitt in mm².
+        reihe (str, optional): "Regelgewinde", "Feingewinde" oder "Trapezgewinde". Ohne Angabe alle.
+
+    Returns:
+        dict: Das Gewinde oder None, wenn keines groß genug ist.
+    """
+    werte, zeilen = _A_S[(gewindeart, reihe)]
+    i = bisect_left(werte, A_s_min)
+    return zeilen[i] if i < len(zeilen) else None
+
+def gewinde_arrays(gewindeart, reihe=None):
+    """
+    Gibt den Katalog einer Gewindeart spaltenweise als NumPy-Arrays zurück (für Batch-Berechnungen).
+
+    Returns:
+        dict: Die Spalten aus SPALTEN als Arrays, sortiert nach (d, P), sowie "bezeichnung" als Liste.
+    """
+    zeilen = [g for g in KATALOG[gewindeart] if reihe is None or g["reihe"] == reihe]
+    spalten = {name: array([g[name] for g in zeilen], dtype=float) for name in SPALTEN}
+    spalten["bezeichnung"] = [g["bezeichnung"] for g in zeilen]
+    return spalten
@@ -0,0 +1,165 @@
+# Nichtlineare Kennlinien von Schraube und verspannten Teilen (Dichtungen, weiche Zwischenlagen): Arbeitspunkt und Kraftaufteilung (NumPy-vektorisiert)
+from numpy import (
+    asarray,
+    clip,
+    concatenate,
+    diff,
+    errstate,
+    linspace,
+    searchsorted,
+    unique,
+    where,
+)
+
+
+def kennlinie(f, F):
+    """
+    Stückweise lineare Kennlinie aus Wertepaaren (Weg, Kraft), z.B. eine gemessene Dichtungskennlinie.
+    Der Ursprung wird ergänzt; über den letzten Punkt hinaus wird mit der letzten Steigung verlängert.
+
+    Args:
+        f (array_like): Verformung in mm (Verlängerung der Schraube bzw. Zusammendrückung der Teile), steigend.
+        F (array_like): Kraft in N, nicht fallend.
+
+    Returns:
+        tuple: (f, F) als Arrays, beginnend bei (0, 0).
+
+    Raises:
+        ValueError: Wenn die Kennlinie nicht monoton ist.
+    """
+    f, F = asarray(f, dtype=float), asarray(F, dtype=float)
+    if f.size == 0 or f[0] != 0:
+        f, F = concatenate(([0.0], f)), concatenate(([0.0], F))
+    if (diff(f) <= 0).any() or (diff(F) < 0).any() or F[0] != 0 or F[-1] <= 0:
+        raise ValueError("Die Kennlinie muss bei (0, 0) beginnen, f steigend und F nicht fallend sein")
+    return f, F
+
+def linear_kennlinie(delta, F_max=1.0):
+    """
+    Lineare Kennlinie F = f/δ (z.B. der Schraube mit δ_s).
+
+    Returns:
+        tuple: (f, F) mit zwei Punkten.
+    """
+    return kennlinie([delta * F_max], [F_max])
+
+def _interpolieren(x, xp, fp):
+    """
+    Lineare Interpolation wie numpy.interp, außerhalb von xp aber mit den Randsteigungen verlängert.
+    """
+    x = asarray(x, dtype=float)
+    i = clip(searchsorted(xp, x, side="right") - 1, 0, len(xp) - 2)
+    with errstate(divide='ignore', invalid='ignore'):
+        steigung = (fp[i + 1] - fp[i]) / (xp[i + 1] - xp[i])
+    return fp[i] + where(xp[i + 1] > xp[i], steigung, 0) * (x - xp[i])
+
+def kraft(kl, f):
+    """
+    Kraft der Kennlinie bei der Verformung f (0 für f <= 0: Schraube entlastet bzw. Trennfuge offen).
+
+    Returns:
+        array_like: F in N.
+    """
+    f = asarray(f, dtype=float)
+    return where(f > 0, _interpolieren(f, *kl), 0.0)
+
+def weg(kl, F):
+    """
+    Verformung der Kennlinie bei der Kraft F (Umkehrfunktion, auf waagrechten Abschnitten der kleinste Weg).
+
+    Returns:
+        array_like: f in mm.
+    """
+    f_tab, F_tab = kl
+    F = asarray(F, dtype=float)
+    i = clip(searchsorted(F_tab, F, side="left") - 1, 0, len(F_tab) - 2)
+    with errstate(divide='ignore', invalid='ignore'):
+        f = f_tab[i] + (F - F_tab[i]) * (f_tab[i + 1] - f_tab[i]) / (F_tab[i + 1] - F_tab[i])
+    return where(F > 0, where(F_tab[i + 1] > F_tab[i], f, f_tab[i]), 0.0)
+
+def _nullstelle(g, knick, ziel):
+    """
+    Löst g(x) = ziel für eine stetige, stückweise lineare und monotone Funktion exakt: g wird an allen Knickstellen
+    ausgewertet, die Lösung für alle Zielwerte in einem Aufruf linear interpoliert bzw. extrapoliert.
+    """
+    x = unique(knick)
+    if len(x) < 2:
+        x = concatenate((x, x + 1.0))
+    werte = g(x)
+    if werte[-1] < werte[0]:
+        x, werte = x[::-1], werte[::-1]
+    return _interpolieren(ziel, werte, x)
+
+def arbeitspunkt(F_M, kl_S, kl_P, f_Z=0.0):
+    """
+    Arbeitspunkt nach dem Setzen: Bei der Montage gilt F_S(f_SM) = F_P(f_PM) = F_M, der Setzbetrag f_Z teilt sich
+    so auf Schraube (Entlastung a) und Teile (f_Z - a) auf, dass wieder Gleichgewicht herrscht:
+
+        F_S(f_SM - a) = F_P(f_PM - f_Z + a)
+
+    Args:
+        F_M (float): Montagevorspannkraft in N.
+        kl_S, kl_P (tuple): Kennlinien von Schraube und verspannten Teilen (kennlinie).
+        f_Z (float, optional): Setzbetrag in mm.
+
+    Returns:
+        dict: "F_V" in N, "f_SV" und "f_PV" (Verformungen von Schraube und Teilen bei F_V) in mm, "F_Z" = F_M - F_V.
+    """
+    f_SM, f_PM = float(weg(kl_S, F_M)), float(weg(kl_P, F_M))
+    if f_Z >= f_SM + f_PM:
+        return {"F_V": 0.0, "f_SV": 0.0, "f_PV": 0.0, "F_Z": float(F_M)}
+    knick = concatenate((f_SM - kl_S[0], kl_P[0] - f_PM + f_Z, [0.0, f_Z]))
+    knick = knick[(knick >= 0) & (knick <= f_Z)]
+    a = float(clip(_nullstelle(lambda a: kraft(kl_S, f_SM - a) - kraft(kl_P, f_PM - f_Z + a), knick, 0.0), 0, f_Z)) if f_Z > 0 else 0.0
+    F_V = float(kraft(kl_S, f_SM - a))
+    return {"F_V": F_V, "f_SV": f_SM - a, "f_PV": f_PM - f_Z + a, "F_Z": float(F_M) - F_V}
+
+def betriebspunkt(F_A, kl_S, kl_P, F_V):
+    """
+    Kraftaufteilung unter der axialen Betriebskraft F_A (Krafteinleitung unter Kopf und Mutter), vektorisiert
+    über beliebig viele Laststufen. Schraube und Teile verformen sich um denselben Weg Δf:
+
+        F_S(f_SV + Δf) - F_P(f_PV - Δf) = F_A
+
+    Die linke Seite ist stückweise linear und steigend, Δf wird exakt aus den Knickstellen beider Kennlinien
+    bestimmt (einschließlich des Abhebens der Teile bei F_P = 0).
+
+    Args:
+        F_A (array_like): Axiale Betriebskraft(e) in N.
+        kl_S, kl_P (tuple): Kennlinien von Schraube und verspannten Teilen.
+        F_V (float): Vorspannkraft in N.
+
+    Returns:
+        dict: "delta_f" in mm, "F_S" und "F_P" (= F_KR) sowie "F_SA" = F_S - F_V und "F_PA" = F_V - F_P in N,
+            "Phi" = F_SA/F_A (sekantialer Verspannungsfaktor) und "klafft" (F_P = 0).
+    """
+    f_SV, f_PV = float(weg(kl_S, F_V)), float(weg(kl_P, F_V))
+    knick = concatenate((kl_S[0] - f_SV, f_PV - kl_P[0]))
+    delta_f = _nullstelle(lambda x: kraft(kl_S, f_SV + x) - kraft(kl_P, f_PV - x), knick, F_A)
+    F_S, F_P = kraft(kl_S, f_SV + delta_f), kraft(kl_P, f_PV - delta_f)
+    F_A = asarray(F_A, dtype=float)
+    with errstate(divide='ignore', invalid='ignore'):
+        Phi = where(F_A != 0, (F_S - F_V) / F_A, 0.0)
+    return {"delta_f": delta_f, "F_S": F_S, "F_P": F_P, "F_SA": F_S - F_V, "F_PA": F_V - F_P, "Phi": Phi,
+            "klafft": F_P <= 0}
+
+def verspannungsschaubild(kl_S, kl_P, F_V, F_A=0.0, punkte=200):
+    """
+    Kurven des Verspannungsschaubilds mit den wahren Kennlinien über der Schraubenverlängerung f: Die Kennlinie
+    der Teile ist am Arbeitspunkt gespiegelt (f = f_SV + f_PV - f_P).
+
+    Returns:
+        dict: "f_S", "F_S", "f_P", "F_P" (Kurven), "f_V" und "F_V" (Arbeitspunkt) sowie "f_A", "F_SA" und "F_KR"
+            (Betriebspunkt unter F_A, Werte als float).
+    """
+    f_SV, f_PV = float(weg(kl_S, F_V)), float(weg(kl_P, F_V))
+    last = betriebspunkt(F_A, kl_S, kl_P, F_V)
+    f_ende = max(f_SV + float(last["delta_f"]), f_SV) * 1.2 + 1e-12
+    f_S = linspace(0, f_ende, punkte)
+    f_P = linspace(0, f_SV + f_PV, punkte)
+    f_P = f_P[f_SV + f_PV - f_P <= f_ende]
+    f_P = concatenate((f_P, kl_P[0][(kl_P[0] < f_SV + f_PV) & (kl_P[0] > f_SV + f_PV - f_ende)]))
+    f_P.sort()
+    return {"f_S": f_S, "F_S": kraft(kl_S, f_S), "f_P": f_SV + f_PV - f_P, "F_P": kraft(kl_P, f_P),
+            "f_V": f_SV, "F_V": float(F_V), "f_A": f_SV + float(last["delta_f"]),
+            "F_SA": float(last["F_SA"]), "F_KR": float(last["F_P"])}
@@ -1,9 +1,31 @@
-from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QSplitter, QTreeView
+from contextlib import contextmanager
+from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QSplitter, QTreeView, QPushButton, QTableWidget, QTableWidgetItem, QHBoxLayout, QFileDialog
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QDoubleValidator
+from PyQt5.QtGui import QDoubleValidator, QBrush, QColor
 from pandas import read_excel
+from numpy import isfinite
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from setzen import setzbetrag, RAUTIEFE_GRENZEN
+from schraubenbild import ANORDNUNGEN, kreisflansch, rechteckbild, schraubenbild_berechnen
+from schraubenkraefte import betriebskraefte
+from exzentrizitaet import exzentrische_verbindung
+from reibschluss import S_G_MIN, klemmkraft_querkraft, reibschluss_schraubenbild
+from lastfaelle import LASTFALL_SPALTEN, ERGEBNIS_SPALTEN, HUELLE, lastfaelle_lesen, lastfaelle_berechnen
+from relaxation import vorspannkraftverlust
+from kennlinie import kennlinie, linear_kennlinie, weg, arbeitspunkt, betriebspunkt, verspannungsschaubild
+
+ALPHA_A_PATH = "stor/3.7.xlsx"
+
+def read_alpha_a_table(file_path=ALPHA_A_PATH):
+    """
+    Liest Tabelle 3.7 (Anziehfaktor alpha_A) ein. Greift nicht auf Widgets zu und kann daher im WorkerPool laufen.
+
+    Returns:
+        tuple: (Liste der Bereiche "x,y bis a,b", Liste der zugehörigen ToolTips)
+    """
+    df = read_excel(file_path, header=None)
+    return df.iloc[1:, 0].tolist(), df.iloc[1:, 1].tolist()
 
 class KraefteWidget(QWidget):
     """
@@ -11,6 +33,8 @@ class KraefteWidget(QWidget):
     """
     # Define the signal to notify when values change
     valuesChanged = pyqtSignal()
+    # Signal mit der Menge aller geänderten Parameter (einzeln oder gesammelt aus batch())
+    paramsChanged = pyqtSignal(object)
 
     def __init__(self, validator, parent=None):
         """
@@ -20,6 +44,8 @@ class KraefteWidget(QWidget):
         self.validator = validator
         self.mainwindow = parent
         self.line_edits = {}
+        self._batch_depth = 0
+        self._batch_changes = set()
         self.setup_ui()
         for line_edit in self.line_edits.values():
             line_edit.editingFinished.connect(self.calculate)
@@ -79,6 +105,8 @@ class KraefteWidget(QWidget):
 
         # Gemittelte Rautiefe Eingabe
         self.add_lineedits(6, scroll_layout, [[0, "R_z", "", "Gemittelte Rautiefe R<sub>z</sub>:", ""]])
+        self.setz_hinweis = QLabel("")
+        scroll_layout.addWidget(self.setz_hinweis, 7, 3)
 
         # Belastung Zug/Druck oder Schub als ComboBox
         belastung_label = QLabel("Belastung Zug/Druck oder Schub:")
@@ -153,6 +181,173 @@ class KraefteWidget(QWidget):
 
         self.add_lineedits(24, scroll_layout, eingaben)
 
+        # Schraubenbild: Verteilung der äußeren Lasten auf mehrere Schrauben
+        subtitle_bild = QLabel("""<p style="font-size:10pt;"><u>Schraubenbild (Mehrschraubenverbindung)</u></p>""")
+        scroll_layout.addWidget(subtitle_bild, 50, 0)
+
+        anordnung_label = QLabel("Anordnung der Schrauben")
+        self.anordnung = QComboBox()
+        self.anordnung.addItems(ANORDNUNGEN)
+        scroll_layout.addWidget(anordnung_label, 51, 0)
+        scroll_layout.addWidget(self.anordnung, 51, 1)
+
+        self.add_lineedits(51, scroll_layout, [
+            [0, "n_S", "", "Anzahl Schrauben n (Rechteck: je Reihe)", "Kreisflansch: Schrauben auf dem Lochkreis<br>Rechteck: Schrauben je Reihe"],
+            [0, "D_L", "mm", "Lochkreisdurchmesser D<sub>L</sub>", "Erste Schraube auf der x-Achse"],
+            [0, "n_R", "", "Anzahl Reihen", "Reihen in y-Richtung"],
+            [0, "t_x", "mm", "Teilung t<sub>x</sub>", "Abstand der Schrauben einer Reihe"],
+            [0, "t_y", "mm", "Teilung t<sub>y</sub>", "Abstand der Reihen"],
+        ])
+
+        koordinaten_label = QLabel("Koordinaten x y der Schrauben")
+        self.koordinaten = QLineEdit()
+        self.koordinaten.setObjectName("koordinaten")
+        self.koordinaten.setPlaceholderText("x y; x y; ... (z.B. 0 0; 120 0; 60 80)")
+        self.koordinaten.setToolTip("Schraubenmitten in mm, Paare durch Semikolon getrennt")
+        self.koordinaten.editingFinished.connect(self.schraubenbild_calc)
+        scroll_layout.addWidget(koordinaten_label, 57, 0)
+        scroll_layout.addWidget(self.koordinaten, 57, 1)
+        scroll_layout.addWidget(QLabel("mm"), 57, 2)
+
+        self.add_lineedits(57, scroll_layout, [
+            [0, "F_Ages", "N", "Axialkraft der Verbindung F<sub>A ges</sub>", "Greift im Ursprung an (Zug positiv)"],
+            [0, "M_x", "Nm", "Biegemoment M<sub>x</sub>", "Um die x-Achse, Zug bei y > 0"],
+            [0, "M_y", "Nm", "Biegemoment M<sub>y</sub>", "Um die y-Achse, Zug bei x < 0"],
+            [0, "F_Qges", "N", "Querkraft der Verbindung F<sub>Q ges</sub>", "In x-Richtung"],
+            [0, "M_t", "Nm", "Torsionsmoment M<sub>t</sub>", "Um die Schraubenachse im Ursprung"],
+        ])
+
+        self.schraubenbild_ergebnis = QLabel("")
+        self.schraubenbild_ergebnis.setWordWrap(True)
+        scroll_layout.addWidget(self.schraubenbild_ergebnis, 63, 0, 1, 3)
+        self.uebernehmen = QPushButton("Maßgebende Schraube übernehmen")
+        self.uebernehmen.setToolTip("Setzt F<sub>A</sub> und F<sub>Q</sub> auf die größten Werte aller Schrauben")
+        self.uebernehmen.clicked.connect(self.schraubenbild_uebernehmen)
+        scroll_layout.addWidget(self.uebernehmen, 64, 1)
+
+        self.scroll_layout = scroll_layout
+        self.schraubenbild = None
+        self.anordnung.currentIndexChanged.connect(self.update_ui_for_anordnung)
+        self.anordnung.currentIndexChanged.connect(self.schraubenbild_calc)
+        self.update_ui_for_anordnung()
+
+        # Exzentrische Verspannung und Belastung
+        subtitle_exz = QLabel("""<p style="font-size:10pt;"><u>Exzentrische Verspannung und Belastung</u></p>""")
+        scroll_layout.addWidget(subtitle_exz, 65, 0)
+
+        self.add_lineedits(65, scroll_layout, [
+            [0, "s_sym", "mm", "Exzentrizität der Verspannung s<sub>sym</sub>", "Abstand der Schraubenachse von der Symmetrieachse der Trennfuge"],
+            [0, "a", "mm", "Exzentrizität der Belastung a", "Abstand der Wirkungslinie von F<sub>A</sub> von der Symmetrieachse<br>(auf derselben Seite wie s<sub>sym</sub> positiv)"],
+            [0, "u", "mm", "Randabstand des Klaffpunkts u", "Abstand des Trennfugenrands von der Symmetrieachse auf der Seite der Belastung"],
+            [0, "A_D", "mm<sup>2</sup>", "Trennfugenfläche A<sub>D</sub>", ""],
+            [0, "I_Bers", "mm<sup>4</sup>", "Ersatzflächenträgheitsmoment I<sub>Bers</sub>", "Flächenträgheitsmoment der verspannten Teile, z.B. b*c<sup>3</sup>/12"],
+            [0, "I_BT", "mm<sup>4</sup>", "Flächenträgheitsmoment der Trennfuge I<sub>BT</sub>", "Ohne Eingabe gilt I<sub>BT</sub> = I<sub>Bers</sub>"],
+            [0, "l_ers", "mm", "Ersatzbiegelänge der Schraube l<sub>ers</sub>", "Ohne Eingabe gilt l<sub>ers</sub> = l<sub>K</sub>"],
+            [0, "beta_P", "1/(Nmm)", "Biegenachgiebigkeit β<sub>P</sub>", "β<sub>P</sub> = l<sub>K</sub>/(E<sub>P</sub>*I<sub>Bers</sub>)"],
+            [0, "Phi_en", "", "Verspannungsfaktor φ<sub>en</sub>*", "φ<sub>en</sub>* = n*(δ<sub>p</sub> + s<sub>sym</sub>*a*β<sub>P</sub>)/(δ<sub>s</sub> + δ<sub>p</sub> + s<sub>sym</sub><sup>2</sup>*β<sub>P</sub>)"],
+            [0, "F_SA_e", "N", "Schraubenzusatzkraft F<sub>SA</sub> (exzentrisch)", "F<sub>SA</sub> = φ<sub>en</sub>**F<sub>A</sub>"],
+            [0, "F_Smax_e", "N", "Maximale Schraubenkraft F<sub>Smax</sub> (exzentrisch)", "F<sub>Smax</sub> = F<sub>Mmax</sub> + φ<sub>en</sub>**F<sub>A</sub>"],
+            [0, "F_KR_e", "N", "Restklemmkraft F<sub>KR</sub> (exzentrisch)", "F<sub>KR</sub> = F<sub>Mmin</sub> - F<sub>Z</sub> - (1-φ<sub>en</sub>*)*F<sub>A</sub>"],
+            [0, "F_KA", "N", "Mindestklemmkraft gegen Klaffen F<sub>KA</sub>", "F<sub>KA</sub> = F<sub>A</sub>*(a-s<sub>sym</sub>)*u*A<sub>D</sub>/(I<sub>BT</sub>+s<sub>sym</sub>*u*A<sub>D</sub>)"],
+            [0, "F_Aab", "N", "Betriebskraft an der Klaffgrenze F<sub>Aab</sub>", "Aus p = 0 am Rand u bei F<sub>V</sub> = F<sub>Mmin</sub> - F<sub>Z</sub>"],
+            [0, "sigma_SAb", "N/mm<sup>2</sup>", "Zusatzspannung aus Zug und Biegung σ<sub>SAb</sub>", "σ<sub>SAb</sub> = (φ<sub>en</sub>* + (a-s<sub>sym</sub>*φ<sub>en</sub>*)*l<sub>K</sub>/l<sub>ers</sub>*E<sub>S</sub>/E<sub>P</sub>*π*d<sub>S</sub><sup>3</sup>/(8*I<sub>Bers</sub>))*F<sub>A</sub>/A<sub>s</sub>"],
+            [0, "sigma_ab", "N/mm<sup>2</sup>", "Ausschlagsspannung σ<sub>ab</sub> (exzentrisch)", "σ<sub>ab</sub> = (σ<sub>SAbo</sub> - σ<sub>SAbu</sub>)/2"],
+        ])
+        self.exzentrizitaet_hinweis = QLabel("")
+        self.exzentrizitaet_hinweis.setWordWrap(True)
+        scroll_layout.addWidget(self.exzentrizitaet_hinweis, 82, 0, 1, 3)
+
+        # Reibschlüssige Übertragung von Querkraft und Torsion
+        subtitle_reib = QLabel("""<p style="font-size:10pt;"><u>Reibschluss (Querkraft und Torsion)</u></p>""")
+        scroll_layout.addWidget(subtitle_reib, 83, 0)
+
+        querbelastung_label = QLabel("Querbelastung")
+        self.querbelastung = QComboBox()
+        self.querbelastung.addItems(list(S_G_MIN))
+        self.querbelastung.setToolTip("Geforderte Rutschsicherheit S<sub>G</sub>: ruhend 1,2, wechselnd 1,8")
+        self.querbelastung.currentIndexChanged.connect(self.calculate)
+        scroll_layout.addWidget(querbelastung_label, 84, 0)
+        scroll_layout.addWidget(self.querbelastung, 84, 1)
+
+        self.add_lineedits(84, scroll_layout, [
+            [0, "q_F", "", "Querkraftübertragende Trennfugen q<sub>F</sub>", "Annahme 1"],
+            [0, "q_M", "", "Momentübertragende Trennfugen q<sub>M</sub>", "Ohne Eingabe gilt q<sub>M</sub> = q<sub>F</sub>"],
+            [0, "M_Y", "Nm", "Drehmoment um die Schraubenachse M<sub>Y</sub>", "Einzelschraube, Reibradius r<sub>a</sub>"],
+            [0, "r_a", "mm", "Reibradius r<sub>a</sub>", "Mittlerer Radius der momentübertragenden Trennfuge"],
+            [0, "F_KQerf", "N", "Mindestklemmkraft Querkraft F<sub>KQerf</sub>", "F<sub>KQerf</sub>=F<sub>Q</sub>/(q<sub>F</sub>*\u03BC)+M<sub>Y</sub>/(q<sub>M</sub>*r<sub>a</sub>*\u03BC)"],
+            [0, "S_G", "", "Rutschsicherheit S<sub>G</sub>", "S<sub>G</sub>=F<sub>KR</sub>/F<sub>KQerf</sub> mit F<sub>KR</sub>=F<sub>Mmin</sub>-F<sub>Z</sub>-(1-\u03C6)*F<sub>A</sub>"],
+        ])
+        self.reibschluss_hinweis = QLabel("")
+        self.reibschluss_hinweis.setWordWrap(True)
+        scroll_layout.addWidget(self.reibschluss_hinweis, 91, 0, 1, 3)
+
+        # Lastfalltabelle mit Hüllkurve
+        subtitle_lastfaelle = QLabel("""<p style="font-size:10pt;"><u>Lastfälle</u></p>""")
+        scroll_layout.addWidget(subtitle_lastfaelle, 92, 0)
+
+        self.lastfaelle = QTableWidget(0, len(LASTFALL_SPALTEN) + len(ERGEBNIS_SPALTEN))
+        self.lastfaelle.setHorizontalHeaderLabels(["Name", "F_Ao [N]", "F_Au [N]", "F_Q [N]",
+                                                   "F_Smax [N]", "F_KR [N]", "σ_a [N/mm²]", "p [N/mm²]", "S_G"])
+        self.lastfaelle.setToolTip("Maßgebende Lastfälle der Hüllkurve sind farbig markiert (max. F<sub>Smax</sub>, min. F<sub>KR</sub>, max. \u03C3<sub>a</sub>, max. p, min. S<sub>G</sub>)")
+        self.lastfaelle.itemChanged.connect(self.lastfaelle_calc)
+        scroll_layout.addWidget(self.lastfaelle, 93, 0, 1, 3)
+
+        lastfall_layout = QHBoxLayout()
+        for text, slot in [("+ Lastfall", self.add_lastfall), ("- Lastfall", self.remove_lastfall),
+                           ("Lastfälle laden (CSV/Excel)", self.lastfaelle_laden)]:
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            lastfall_layout.addWidget(button)
+        scroll_layout.addLayout(lastfall_layout, 94, 0, 1, 3)
+
+        self.lastfaelle_hinweis = QLabel("")
+        self.lastfaelle_hinweis.setWordWrap(True)
+        scroll_layout.addWidget(self.lastfaelle_hinweis, 95, 0, 1, 3)
+
+        # Kriechen und Relaxation der verspannten Teile über der Betriebszeit
+        subtitle_relaxation = QLabel("""<p style="font-size:10pt;"><u>Kriechen/Relaxation im Betrieb</u></p>""")
+        scroll_layout.addWidget(subtitle_relaxation, 96, 0)
+
+        self.add_lineedits(96, scroll_layout, [
+            [0, "l_kr", "mm", "Kriechende Länge l<sub>kr</sub>", "Dicke der kriechenden Teile (Aluminium, Kunststoff, Dichtung)<br>Ohne Eingabe: Zwischenlagen der Nachgiebigkeit mit E &lt; 120000 N/mm<sup>2</sup>"],
+            [0, "A_kr", "mm<sup>2</sup>", "Druckfläche der kriechenden Teile A<sub>kr</sub>", "Ohne Eingabe: kleinste Ersatzfläche der kriechenden Zwischenlagen"],
+            [0, "B_kr", "", "Kriechkoeffizient B", "Norton-Bailey ε<sub>kr</sub> = B*σ<sup>n</sup>*t<sup>m</sup> (t in h, σ in N/mm<sup>2</sup>) bei Betriebstemperatur"],
+            [0, "n_kr", "", "Spannungsexponent n", "Norton-Bailey ε<sub>kr</sub> = B*σ<sup>n</sup>*t<sup>m</sup>"],
+            [0, "m_kr", "", "Zeitexponent m", "Annahme 1 (stationäres Kriechen), m &lt; 1 für Primärkriechen"],
+            [0, "t_B", "h", "Betriebszeit t<sub>B</sub>", "Annahme 87600 h (10 Jahre)"],
+            [0, "F_V_t", "N", "Vorspannkraft nach t<sub>B</sub>", "F<sub>V</sub>(t) = F<sub>Mmin</sub> - F<sub>Z</sub> - l<sub>kr</sub>*ε<sub>kr</sub>(t)/(δ<sub>s</sub> + δ<sub>p</sub>)"],
+            [0, "t_Kerf", "h", "Nachziehintervall t(F<sub>KR</sub> = F<sub>Kerf</sub>)", "Betriebszeit, nach der F<sub>KR</sub> = F<sub>V</sub>(t) - (1-φ)*F<sub>A</sub> die erforderliche Restklemmkraft F<sub>Kerf</sub> erreicht"],
+        ])
+        self.relaxation_hinweis = QLabel("")
+        self.relaxation_hinweis.setWordWrap(True)
+        scroll_layout.addWidget(self.relaxation_hinweis, 105, 0, 1, 3)
+
+        # Nichtlineare Kennlinie der verspannten Teile (Dichtungen, weiche Zwischenlagen)
+        subtitle_kennlinie = QLabel("""<p style="font-size:10pt;"><u>Nichtlineare Bauteilkennlinie</u></p>""")
+        scroll_layout.addWidget(subtitle_kennlinie, 106, 0)
+
+        kennlinie_label = QLabel("Kennlinie f F der Teile")
+        self.bauteilkennlinie = QLineEdit()
+        self.bauteilkennlinie.setObjectName("bauteilkennlinie")
+        self.bauteilkennlinie.setPlaceholderText("z.B. 0,05 2000; 0,1 8000; 0,15 20000")
+        self.bauteilkennlinie.setToolTip("Wertepaare Zusammendrückung f in mm und Kraft F in N, durch ; getrennt (stückweise linear, "
+                                         "über den letzten Punkt mit der letzten Steigung verlängert).<br>Ohne Eingabe gilt die lineare Kennlinie mit \u03B4<sub>p</sub>.")
+        self.bauteilkennlinie.editingFinished.connect(self.calculate)
+        scroll_layout.addWidget(kennlinie_label, 107, 0)
+        scroll_layout.addWidget(self.bauteilkennlinie, 107, 1)
+        scroll_layout.addWidget(QLabel("mm N"), 107, 2)
+
+        self.add_lineedits(107, scroll_layout, [
+            [0, "F_V_nl", "N", "Vorspannkraft F<sub>V</sub> (Kennlinie)", "Arbeitspunkt nach dem Setzen: F<sub>S</sub>(f<sub>SM</sub> - a) = F<sub>P</sub>(f<sub>PM</sub> - f<sub>Z</sub> + a) mit F<sub>M</sub> = F<sub>Mmin</sub>"],
+            [0, "f_V_nl", "mm", "Schraubenverlängerung f<sub>V</sub> (Kennlinie)", "f<sub>V</sub> = F<sub>V</sub>*\u03B4<sub>s</sub>"],
+            [0, "F_SA_nl", "N", "Schraubenzusatzkraft F<sub>SA</sub> (Kennlinie)", "F<sub>S</sub>(f<sub>SV</sub> + Δf) - F<sub>P</sub>(f<sub>PV</sub> - Δf) = F<sub>A</sub>,  F<sub>SA</sub> = F<sub>S</sub> - F<sub>V</sub>"],
+            [0, "F_PA_nl", "N", "Entlastung der Teile F<sub>PA</sub> (Kennlinie)", "F<sub>PA</sub> = F<sub>A</sub> - F<sub>SA</sub>"],
+            [0, "Phi_nl", "", "Verspannungsfaktor \u03C6 (Kennlinie)", "Sekante \u03C6 = F<sub>SA</sub>/F<sub>A</sub>"],
+        ])
+        self.kennlinie_hinweis = QLabel("")
+        self.kennlinie_hinweis.setWordWrap(True)
+        scroll_layout.addWidget(self.kennlinie_hinweis, 113, 0, 1, 3)
+
         # Add plot area
         self.figure = plt.Figure()
         self.canvas = FigureCanvas(self.figure)
@@ -227,181 +422,172 @@ class KraefteWidget(QWidget):
         f_V = self.get_value("f_V")
         f_Smax_total = self.get_value("f_Smax_total")
         
-        # Store updates to minimize UI updates
-        updates = {}
-        
         # Temporarily disable signals to avoid triggering events during calculation
         for line_edit in self.line_edits.values():
             line_edit.blockSignals(True)
             
-        # Now perform the calculations as before
-        for i in range(3):
-            if alpha_A is not None and alpha_A != 0 and F_Mmax is not None:
-                F_Mmin = F_Mmax / alpha_A
-                self.set_value("F_Mmin", F_Mmin)
-            elif alpha_A is not None and F_Mmin is not None:
-                F_Mmax = alpha_A * F_Mmin
-                self.set_value("F_Mmax", F_Mmax)
-
-            if (delta_s != 0 or delta_p != 0) and (delta_s is not None and delta_p is not None):
-                Phi = delta_p / (delta_s + delta_p)
-                self.set_value("Phi", Phi)
-
-                if f_Z is not None:
-                    F_Z = f_Z * 0.001 / (delta_s + delta_p)
-                    self.set_value("F_Z", F_Z)
-
-            if Phi is not None and (F_A is not None or F_Ao is not None) and F_Z is not None and F_KR is not None:
-                if F_A is not None:
-                    F_V = F_KR + (1 - Phi) * F_A
-                    self.set_value("F_V", F_V)
-                elif F_Ao is not None:
-                    F_V = F_KR + (1 - Phi) * F_Ao
-                    self.set_value("F_V", F_V)
-
-            if Phi is not None and F_A is not None and F_V is not None:
-                F_KR = F_V + (1 - Phi) * F_A
-                self.set_value("F_KR", F_KR)
-
-            if Phi is not None and (F_A is not None or F_Ao is not None):
-                if F_A is not None:
-                    F_SA = Phi * F_A
-                    self.set_value("F_SA", F_SA)
-                elif F_Ao is not None:
-                    F_SA = Phi * F_Ao
-                    self.set_value("F_SA", F_SA)
-
-            if F_SA is not None and F_A is not None:
-                F_PA = F_A - F_SA
-                self.set_value("F_PA", F_PA)
-
-            if F is not None and Phi is not None:
-                F_S = Phi * F
-                F_P = (1 - Phi) * F
-                self.set_value("F_S", F_S)
-                self.set_value("F_P", F_P)
-
-            if F_Mmin is not None and F_Z is not None:
-                F_V = F_Mmin - F_Z
-                self.set_value("F_V", F_V)
-
-            if F_V is not None and F_Z is not None:
-                F_Mmin = F_V + F_Z
-                self.set_value("F_Mmin", F_Mmin)
-
-            if F_Mmax is not None and F_SA is not None:
-                F_Smax = F_Mmax + F_SA
-                self.set_value("F_Smax", F_Smax)
-
-            if F_Smax is not None and F_SA is not None:
-                F_Mmax = F_Smax - F_SA
-                self.set_value("F_Mmax", F_Mmax)
-
-            if F_Smax is not None and F_A is not None:
-                F_KR = F_Smax - F_A
-                self.set_value("F_KR", F_KR)
-
-            if Phi is not None and F_Ao is not None and F_Au is not None:
-                F_SAa = Phi * (F_Ao - F_Au) / 2
-                self.set_value("F_SAa", F_SAa)
-
-            if Phi is not None and F_V is not None and F_Ao is not None and F_Au is not None:
-                F_Sm = F_V + Phi * (F_Ao + F_Au) / 2
-                self.set_value("F_Sm", F_Sm)
-
-            if F_Mmin is not None and F_Z is not None and F_A is not None and Phi is not None:
-                F_Kerf = F_Mmin - F_Z - (1 - Phi) * F_A
-                self.set_value("F_Kerf", F_Kerf)
-            elif F_Verf is not None and Phi is not None and F_Ao is not None:
-                F_Kerf = F_Verf - (1 - Phi) * F_Ao
-                self.set_value("F_Kerf", F_Kerf)
-            elif F_Verf is not None and F_Ao == 0:
-                F_Kerf = F_Verf
-                self.set_value("F_Kerf", F_Kerf)
-                self.set_value("F_Verf", F_Kerf)
-
-            if F_Kerf is not None and Phi is not None and F_Ao is not None:
-                F_Verf = F_Kerf + (1 - Phi) * F_Ao
-                self.set_value("F_Verf", F_Verf)
-            elif my is not None and F_Q is not None:
-                F_Verf = F_Q / my
-                self.set_value("F_Verf", F_Verf)
-                self.set_value("F_Kerf", F_Verf)
-
+        # Now perform the calculations as before. Alle Änderungen der drei Durchläufe
+        # werden in einer Transaktion gesammelt und erst am Ende einmal gemeldet.
+        with self.batch():
+            # Setzbetrag aus der Tabelle (hängt nur von den Eingaben ab, daher einmal vor den Durchläufen)
+            self.setz_hinweis.setText("")
             if R_Z is not None and gewinde is not None and kopf_mutterauflagen is not None and trennfugen is not None:
-                f_ZF = {
-                    1: {"Zug/Druck": [3, 2.5, 1.5], "Schub": [3, 3, 2]},
-                    2: {"Zug/Druck": [3, 3, 2], "Schub": [3, 4.5, 2.5]},
-                    3: {"Zug/Druck": [3, 4, 3], "Schub": [3, 6.5, 3.5]}
-                }
-
-                if R_Z < 10:
-                    index = 1
-                elif R_Z < 40:
-                    index = 2
-                elif R_Z < 160:
-                    index = 3
+                f_Z_tabelle, gueltig = setzbetrag(R_Z, gewinde, kopf_mutterauflagen, trennfugen, belastung)
+                if gueltig:
+                    f_Z = float(f_Z_tabelle)
+                    self.set_value("f_Z", f_Z)
                 else:
-                    print("Ungültige Rautiefe")
-                    return None
-
-                f_Z_values = f_ZF[index][belastung]
-                f_Z = f_Z_values[0] * gewinde + f_Z_values[1] * kopf_mutterauflagen + f_Z_values[2] * trennfugen
-                self.set_value("f_Z", f_Z)
-
-            if F_Mmax is not None and F_SA is not None:
-                F_PM = F_Mmax - F_SA
-                self.set_value("F_PM", F_PM)
-
-            if F_Z is not None:
-                Fz = F_Z
-                self.set_value("Fz", Fz)
-
-            if F_Smax is not None and F_Erv is None:
-                F_Erv = 1.5 * F_Smax
-                self.set_value("F_Erv", F_Erv)
-
-            if F_Kerf is not None:
-                F_Erf = F_Kerf
-                self.set_value("F_Erf", F_Erf)
-
-            if F_Smax is not None and delta_s is not None and delta_s != 0:
-                f_SMmax = F_Smax * delta_s
-                self.set_value("f_SMmax", f_SMmax)
-
-            if F_Mmax is not None and delta_p is not None and delta_p != 0:
-                f_PMmax = F_Mmax * delta_p
-                self.set_value("f_PMmax", f_PMmax)
-
-            if F_Smax is not None and f_SMmax is not None and f_SMmax != 0:
-                c_S = F_Smax / f_SMmax
-                self.set_value("c_S", c_S)
-
-            if F_Mmax is not None and f_PMmax is not None and f_PMmax != 0:
-                c_P = F_Mmax / f_PMmax
-                self.set_value("c_P", c_P)
-
-            if F_SA is not None and delta_s is not None and delta_s != 0:
-                f_SA = F_SA * delta_s
-                self.set_value("f_SA", f_SA)
-
-            if F_V is not None and delta_s is not None and delta_s != 0:
-                f_V = F_V * delta_s
-                self.set_value("f_V", f_V)
+                    self.setz_hinweis.setText(f"Ungültige Rautiefe (0 ≤ R<sub>z</sub> &lt; {RAUTIEFE_GRENZEN[-1]:g} µm), f<sub>Z</sub> wurde nicht berechnet")
+
+            for i in range(3):
+                if alpha_A is not None and alpha_A != 0 and F_Mmax is not None:
+                    F_Mmin = F_Mmax / alpha_A
+                    self.set_value("F_Mmin", F_Mmin)
+                elif alpha_A is not None and F_Mmin is not None:
+                    F_Mmax = alpha_A * F_Mmin
+                    self.set_value("F_Mmax", F_Mmax)
+
+                if (delta_s != 0 or delta_p != 0) and (delta_s is not None and delta_p is not None):
+                    Phi = delta_p / (delta_s + delta_p)
+                    self.set_value("Phi", Phi)
+
+                    if f_Z is not None:
+                        F_Z = f_Z * 0.001 / (delta_s + delta_p)
+                        self.set_value("F_Z", F_Z)
+
+                if Phi is not None and (F_A is not None or F_Ao is not None) and F_Z is not None and F_KR is not None:
+                    if F_A is not None:
+                        F_V = F_KR + (1 - Phi) * F_A
+                        self.set_value("F_V", F_V)
+                    elif F_Ao is not None:
+                        F_V = F_KR + (1 - Phi) * F_Ao
+                        self.set_value("F_V", F_V)
+
+                if Phi is not None and F_A is not None and F_V is not None:
+                    F_KR = F_V + (1 - Phi) * F_A
+                    self.set_value("F_KR", F_KR)
+
+                if Phi is not None and (F_A is not None or F_Ao is not None):
+                    if F_A is not None:
+                        F_SA = Phi * F_A
+                        self.set_value("F_SA", F_SA)
+                    elif F_Ao is not None:
+                        F_SA = Phi * F_Ao
+                        self.set_value("F_SA", F_SA)
+
+                if F_SA is not None and F_A is not None:
+                    F_PA = F_A - F_SA
+                    self.set_value("F_PA", F_PA)
+
+                if F is not None and Phi is not None:
+                    F_S = Phi * F
+                    F_P = (1 - Phi) * F
+                    self.set_value("F_S", F_S)
+                    self.set_value("F_P", F_P)
+
+                if F_Mmin is not None and F_Z is not None:
+                    F_V = F_Mmin - F_Z
+                    self.set_value("F_V", F_V)
 
-            if F_Smax is not None and delta_s is not None and delta_s != 0:
-                f_Smax_total = F_Smax * delta_s
-                self.set_value("f_Smax_total", f_Smax_total)
+                if F_V is not None and F_Z is not None:
+                    F_Mmin = F_V + F_Z
+                    self.set_value("F_Mmin", F_Mmin)
+
+                if F_Mmax is not None and F_SA is not None:
+                    F_Smax = F_Mmax + F_SA
+                    self.set_value("F_Smax", F_Smax)
+
+                if F_Smax is not None and F_SA is not None:
+                    F_Mmax = F_Smax - F_SA
+                    self.set_value("F_Mmax", F_Mmax)
+
+                if F_Smax is not None and F_A is not None:
+                    F_KR = F_Smax - F_A
+                    self.set_value("F_KR", F_KR)
+
+                if Phi is not None and F_Ao is not None and F_Au is not None:
+                    F_SAa = Phi * (F_Ao - F_Au) / 2
+                    self.set_value("F_SAa", F_SAa)
+
+                if Phi is not None and F_V is not None and F_Ao is not None and F_Au is not None:
+                    F_Sm = F_V + Phi * (F_Ao + F_Au) / 2
+                    self.set_value("F_Sm", F_Sm)
+
+                if F_Mmin is not None and F_Z is not None and F_A is not None and Phi is not None:
+                    F_Kerf = F_Mmin - F_Z - (1 - Phi) * F_A
+                    self.set_value("F_Kerf", F_Kerf)
+                elif F_Verf is not None and Phi is not None and F_Ao is not None:
+                    F_Kerf = F_Verf - (1 - Phi) * F_Ao
+                    self.set_value("F_Kerf", F_Kerf)
+                elif F_Verf is not None and F_Ao == 0:
+                    F_Kerf = F_Verf
+                    self.set_value("F_Kerf", F_Kerf)
+                    self.set_value("F_Verf", F_Kerf)
+
+                if F_Kerf is not None and Phi is not None and F_Ao is not None:
+                    F_Verf = F_Kerf + (1 - Phi) * F_Ao
+                    self.set_value("F_Verf", F_Verf)
+                elif my is not None and F_Q is not None:
+                    F_Verf = float(self.klemmkraft_querkraft(F_Q, my))
+                    self.set_value("F_Verf", F_Verf)
+                    self.set_value("F_Kerf", F_Verf)
+
+                if F_Mmax is not None and F_SA is not None:
+                    F_PM = F_Mmax - F_SA
+                    self.set_value("F_PM", F_PM)
+
+                if F_Z is not None:
+                    Fz = F_Z
+                    self.set_value("Fz", Fz)
+
+                if F_Smax is not None and F_Erv is None:
+                    F_Erv = 1.5 * F_Smax
+                    self.set_value("F_Erv", F_Erv)
+
+                if F_Kerf is not None:
+                    F_Erf = F_Kerf
+                    self.set_value("F_Erf", F_Erf)
+
+                if F_Smax is not None and delta_s is not None and delta_s != 0:
+                    f_SMmax = F_Smax * delta_s
+                    self.set_value("f_SMmax", f_SMmax)
+
+                if F_Mmax is not None and delta_p is not None and delta_p != 0:
+                    f_PMmax = F_Mmax * delta_p
+                    self.set_value("f_PMmax", f_PMmax)
+
+                if F_Smax is not None and f_SMmax is not None and f_SMmax != 0:
+                    c_S = F_Smax / f_SMmax
+                    self.set_value("c_S", c_S)
+
+                if F_Mmax is not None and f_PMmax is not None and f_PMmax != 0:
+                    c_P = F_Mmax / f_PMmax
+                    self.set_value("c_P", c_P)
+
+                if F_SA is not None and delta_s is not None and delta_s != 0:
+                    f_SA = F_SA * delta_s
+                    self.set_value("f_SA", f_SA)
+
+                if F_V is not None and delta_s is not None and delta_s != 0:
+                    f_V = F_V * delta_s
+                    self.set_value("f_V", f_V)
+
+                if F_Smax is not None and delta_s is not None and delta_s != 0:
+                    f_Smax_total = F_Smax * delta_s
+                    self.set_value("f_Smax_total", f_Smax_total)
         
         # Re-enable signals now that calculation is complete
         for line_edit in self.line_edits.values():
             line_edit.blockSignals(False)
-            
-        # Emit a single signal that values have changed
-        self.valuesChanged.emit()
         
         # Calculate dependent values in other widgets
         self.mainwindow.dauerfestigkeit_widget.calculate()
+        self.schraubenbild_calc()
+        self.exzentrizitaet_calc()
+        self.reibschluss_calc()
+        self.lastfaelle_calc()
+        self.relaxation_calc()
+        self.kennlinie_calc()
         
         # Update the plot only if the widget is visible to save resources
         if self.isVisible():
@@ -436,10 +622,19 @@ class KraefteWidget(QWidget):
         f_Smax_total = self.get_value("f_Smax_total") or f_SMmax
 
         # Plot spring characteristics with force on X-axis and displacement on Y-axis
-        ax.plot([0, f_SMmax], [0, F_Smax], 'b-', label='Cs (Schraube)')
-        ax.plot([0, f_PMmax], [0, F_Mmax], 'r-', label='Cp (Bauteil)')
-        ax.plot([f_V, f_Smax_total], [F_V, F_Smax], 'b-')  # Extended bolt line
-        ax.plot([f_Z, f_PMmax], [0, F_Mmax], 'r-')  # Extended part line
+        schaubild = self.kennlinie_schaubild()
+        if schaubild is None:
+            ax.plot([0, f_SMmax], [0, F_Smax], 'b-', label='Cs (Schraube)')
+            ax.plot([0, f_PMmax], [0, F_Mmax], 'r-', label='Cp (Bauteil)')
+            ax.plot([f_V, f_Smax_total], [F_V, F_Smax], 'b-')  # Extended bolt line
+            ax.plot([f_Z, f_PMmax], [0, F_Mmax], 'r-')  # Extended part line
+        else:
+            # Wahre Kennlinien: Schraube linear, Teile nichtlinear und am Arbeitspunkt gespiegelt
+            F_V, f_V = schaubild["F_V"], schaubild["f_V"]
+            ax.plot(schaubild["f_S"], schaubild["F_S"], 'b-', label='Cs (Schraube)')
+            ax.plot(schaubild["f_P"], schaubild["F_P"], 'r-', label='Bauteil (Kennlinie)')
+            ax.plot([schaubild["f_A"]] * 2, [schaubild["F_KR"], F_V + schaubild["F_SA"]], 'k--', label='F_A')
+            f_SMmax = max(f_SMmax, float(schaubild["f_S"][-1]))
 
         # Intersection point at (f_V, F_V)
         ax.plot(f_V, F_V, 'ko', label='Schnittpunkt')  # Initial contact point
@@ -504,7 +699,8 @@ class KraefteWidget(QWidget):
         # Add a horizontal line at y=0
         ax.axhline(y=0, color='black', linestyle='-', linewidth=0.5)
 
-        self.canvas.draw()
+        # Zeichnen in der Event-Loop bündeln, statt den GUI-Thread bei jeder Änderung zu blockieren
+        self.canvas.draw_idle()
 
     def update_delta_values(self, delta_s, delta_p, Phi):
         """
@@ -514,19 +710,514 @@ class KraefteWidget(QWidget):
         self.set_value("delta_p", delta_p)
         self.set_value("Phi", Phi)
 
+    def update_ui_for_anordnung(self):
+        """
+        Zeigt nur die Geometriefelder der gewählten Anordnung an.
+        """
+        anordnung = self.anordnung.currentText()
+        sichtbar = {
+            52: anordnung in ["Kreisflansch", "Rechteck"],
+            53: anordnung == "Kreisflansch",
+            54: anordnung == "Rechteck",
+            55: anordnung == "Rechteck",
+            56: anordnung == "Rechteck",
+            57: anordnung == "Koordinaten",
+        }
+        for row, visible in sichtbar.items():
+            for column in range(3):
+                item = self.scroll_layout.itemAtPosition(row, column)
+                if item is not None:
+                    item.widget().setVisible(visible)
+        self.uebernehmen.setEnabled(False)
+
+    def schraubenbild_lage(self):
+        """
+        Koordinaten der Schrauben für die gewählte Anordnung.
+
+        Returns:
+            tuple: (x, y) in mm oder None, solange die Geometrie unvollständig ist.
+        """
+        anordnung = self.anordnung.currentText()
+        n_S = self.get_value("n_S")
+        if anordnung == "Einzelschraube":
+            return [0.0], [0.0]
+        if anordnung == "Kreisflansch":
+            D_L = self.get_value("D_L")
+            if n_S is None or n_S < 1 or D_L is None:
+                return None
+            return kreisflansch(n_S, D_L)
+        if anordnung == "Rechteck":
+            n_R, t_x, t_y = self.get_value("n_R"), self.get_value("t_x"), self.get_value("t_y")
+            if None in (n_S, n_R, t_x, t_y) or n_S < 1 or n_R < 1:
+                return None
+            return rechteckbild(n_S, n_R, t_x, t_y)
+        try:
+            paare = [[float(wert.replace(',', '.')) for wert in paar.split()] for paar in self.koordinaten.text().split(';') if paar.strip()]
+        except ValueError:
+            return None
+        if not paare or any(len(paar) != 2 for paar in paare):
+            return None
+        return [paar[0] for paar in paare], [paar[1] for paar in paare]
+
+    def schraubenbild_calc(self):
+        """
+        Verteilt F<sub>A ges</sub>, M<sub>x</sub>, M<sub>y</sub>, F<sub>Q ges</sub> und M<sub>t</sub> auf die Schrauben des
+        Schraubenbilds und rechnet die Kräfte- und Festigkeitskette für alle Schrauben in einem Durchlauf.
+        Die Schraubenkennwerte (φ, F<sub>Mmax</sub>, α<sub>A</sub>, F<sub>Z</sub>, μ) stammen aus diesem Widget,
+        A<sub>s</sub> und d aus dem Gewinde, A<sub>p</sub>, p<sub>Gzul</sub> und R<sub>p02</sub> aus der Dauerfestigkeit.
+        """
+        if not hasattr(self.mainwindow, "dauerfestigkeit_widget"):
+            return  # Die übrigen Widgets werden erst nach diesem erzeugt
+        self.schraubenbild = None
+        self.uebernehmen.setEnabled(False)
+        lasten = [self.get_value(param) for param in ("F_Ages", "M_x", "M_y", "F_Qges", "M_t")]
+        if all(last is None for last in lasten):
+            self.schraubenbild_ergebnis.setText("")
+            return
+        F_Ages, M_x, M_y, F_Qges, M_t = (last or 0.0 for last in lasten)
+
+        lage = self.schraubenbild_lage()
+        if lage is None:
+            self.schraubenbild_ergebnis.setText("Die Geometrie des Schraubenbilds ist unvollständig.")
+            return
+        dauerfestigkeit = self.mainwindow.dauerfestigkeit_widget
+        Phi = self.get_value("Phi")
+        F_Mmax = self.get_value("F_Mmax")
+        A_s = dauerfestigkeit.get_gewinde("A_s")
+        d = dauerfestigkeit.get_gewinde("d")
+        if None in (Phi, F_Mmax, A_s, d):
+            self.schraubenbild_ergebnis.setText("Für das Schraubenbild werden \u03C6, F<sub>Mmax</sub>, A<sub>s</sub> und d benötigt.")
+            return
+
+        x, y = lage
+        q_F, q_M, S_G_erf = self.reibschluss_parameter()
+        my = self.get_value("my") or None
+        ergebnis = schraubenbild_berechnen(
+            x, y, Phi, F_Mmax, A_s, d, F_Ages, M_x * 1000, M_y * 1000, F_Qges, 0.0, M_t * 1000,
+            alpha_A=self.get_value("alpha_A") or 1.0, F_Z=self.get_value("F_Z") or 0.0, my=my, q_F=q_F,
+            R_p02=dauerfestigkeit.get_werkstoff("R_p02"), A_p=dauerfestigkeit.get_value("A_p"), p_Gzul=dauerfestigkeit.get_value("p_Gzul"),
+            schlussgewalzt=dauerfestigkeit.verg.currentText() == "Schlussgewalzte/gerollte SG")
+        self.schraubenbild = ergebnis
+
+        zahl = lambda wert, stellen: f"{wert:.{stellen}f}".replace('.', ',')
+        i = int(ergebnis["massgebend"]["F_Smax"])
+        j = int(ergebnis["massgebend"]["F_KR"])
+        k = int(ergebnis["massgebend"]["sigma_a"])
+        text = (f"{len(ergebnis['F_A'])} Schrauben. Größte Schraubenkraft an Schraube {i + 1}: "
+                f"F<sub>A</sub> = {zahl(ergebnis['F_A'][i], 1)} N, F<sub>Smax</sub> = {zahl(ergebnis['F_Smax'][i], 1)} N."
+                f"<br>Kleinste Restklemmkraft an Schraube {j + 1}: F<sub>KR</sub> = {zahl(ergebnis['F_KR'][j], 1)} N"
+                f" bei F<sub>Q</sub> = {zahl(ergebnis['F_Q'][j], 1)} N.")
+        if "F_KQerf" in ergebnis:
+            text += f" Erforderlich F<sub>KQerf</sub> = F<sub>Q</sub>/(q<sub>F</sub>*\u03BC) = {zahl(ergebnis['F_KQerf'][j], 1)} N."
+        if ergebnis["F_KR"][j] <= 0:
+            text += " <b>Die Trennfuge klafft!</b>"
+        elif "F_KQerf" in ergebnis and ergebnis["F_KR"][j] < ergebnis["F_KQerf"][j]:
+            text += " <b>Die Querkraft kann nicht durch Reibschluss übertragen werden!</b>"
+        text += f"<br>Größte Ausschlagsspannung an Schraube {k + 1}: \u03C3<sub>a</sub> = {zahl(ergebnis['sigma_a'][k], 2)} N/mm<sup>2</sup>"
+        text += f" (\u03C3<sub>A</sub> = {zahl(ergebnis['sigma_A'][k], 2)} N/mm<sup>2</sup>)."
+        if "p" in ergebnis:
+            m = int(ergebnis["massgebend"]["p"])
+            text += f"<br>Größte Flächenpressung an Schraube {m + 1}: p = {zahl(ergebnis['p'][m], 2)} N/mm<sup>2</sup>."
+        if my is not None and (F_Qges or M_t):
+            reibschluss = reibschluss_schraubenbild(x, y, ergebnis["F_KR"], my, F_Qges, 0.0, M_t * 1000, q_F, q_M, S_G_erf)
+            r = int(reibschluss["massgebend"])
+            text += (f"<br>Kleinste Rutschsicherheit an Schraube {r + 1}: S<sub>G</sub> = {zahl(reibschluss['S_G'][r], 2)}"
+                     f" (erforderlich {zahl(S_G_erf, 2)}, F<sub>KQerf</sub> = {zahl(reibschluss['F_KQerf'][r], 1)} N),"
+                     f" gesamte Verbindung S<sub>G ges</sub> = {zahl(reibschluss['S_G_ges'], 2)}.")
+            if reibschluss["S_G"][r] < S_G_erf:
+                text += " <b>Die Verbindung kann rutschen!</b>"
+        self.schraubenbild_ergebnis.setText(text)
+        self.uebernehmen.setEnabled(True)
+
+    def schraubenbild_uebernehmen(self):
+        """
+        Übernimmt die größte Axialkraft und die größte Querkraft aller Schrauben als F<sub>A</sub> und F<sub>Q</sub>
+        der Einzelschraube und rechnet neu.
+        """
+        if self.schraubenbild is None:
+            return
+        with self.batch():
+            self.set_value("F_A", float(self.schraubenbild["F_A"].max()))
+            self.set_value("F_Q", float(self.schraubenbild["F_Q"].max()))
+        self.calculate()
+
+    def exzentrizitaet_calc(self):
+        """
+        Rechnet die Verbindung mit exzentrischer Verspannung (s<sub>sym</sub>) und Belastung (a): φ<sub>en</sub>*,
+        Schraubenkräfte über betriebskraefte, Biegespannung der Schraube und Klaffgrenze.
+        Klemmlänge und E-Moduln stammen aus dem Bauteilstapel der Nachgiebigkeit, d<sub>S</sub> und A<sub>s</sub> aus dem Gewinde.
+        """
+        if not hasattr(self.mainwindow, "dauerfestigkeit_widget"):
+            return  # Die übrigen Widgets werden erst nach diesem erzeugt
+        self.exzentrizitaet_hinweis.setText("")
+        s_sym = self.get_value("s_sym")
+        a = self.get_value("a")
+        if s_sym is None and a is None:
+            return
+        s_sym, a = s_sym or 0.0, a or 0.0
+        u, A_D, I_Bers = self.get_value("u"), self.get_value("A_D"), self.get_value("I_Bers")
+        delta_s, delta_p = self.get_value("delta_s"), self.get_value("delta_p")
+        F_Mmax, F_A = self.get_value("F_Mmax"), self.get_value("F_A")
+        if F_A is None:
+            F_A = self.get_value("F_Ao")
+        nachgiebigkeit = self.mainwindow.nachgiebigkeit_widget
+        dauerfestigkeit = self.mainwindow.dauerfestigkeit_widget
+        d_S = dauerfestigkeit.get_gewinde("d_s") or dauerfestigkeit.get_gewinde("d")
+        A_s = dauerfestigkeit.get_gewinde("A_s")
+        if None in (u, A_D, I_Bers, delta_s, delta_p, F_Mmax, F_A, d_S, A_s) or I_Bers == 0:
+            self.exzentrizitaet_hinweis.setText("Für die exzentrische Verbindung werden u, A<sub>D</sub>, I<sub>Bers</sub>, δ<sub>s</sub>, δ<sub>p</sub>, F<sub>Mmax</sub>, F<sub>A</sub>, d und A<sub>s</sub> benötigt.")
+            return
+
+        stapel = nachgiebigkeit.stapel
+        lagen = ~stapel.schraube & (stapel.l > 0)
+        l_K = float(stapel.l[lagen].sum()) if lagen.any() else None
+        if not l_K:
+            self.exzentrizitaet_hinweis.setText("Die Klemmlänge l<sub>K</sub> fehlt (Dicken der Zwischenlagen in der Nachgiebigkeit).")
+            return
+        E_P = next((float(E) for E in stapel.E[lagen] if E > 0), 210000.0)
+        E_S = next((float(E) for E in stapel.E[stapel.schraube] if E > 0), 210000.0)
+
+        alpha_A = self.get_value("alpha_A") or 1.0
+        F_Z = self.get_value("F_Z") or 0.0
+        F_Au = self.get_value("F_Au") or 0.0
+        ergebnis = exzentrische_verbindung(delta_s, delta_p, F_Mmax / alpha_A - F_Z, F_A, l_K, E_S, E_P, I_Bers, A_D, u, d_S, A_s,
+                                           s_sym, a, nachgiebigkeit.get_value("n") or 1.0, F_Au,
+                                           self.get_value("I_BT"), self.get_value("l_ers"))
+        Phi_en = float(ergebnis["Phi_en"])
+        kraefte = betriebskraefte(Phi_en, F_Mmax, F_A, alpha_A, F_Z, F_Au)
+        werte = {"beta_P": ergebnis["beta_P"], "Phi_en": Phi_en, "F_SA_e": kraefte["F_SA"], "F_Smax_e": kraefte["F_Smax"],
+                 "F_KR_e": kraefte["F_KR"], "F_KA": ergebnis["F_KA"], "F_Aab": ergebnis["F_Aab"],
+                 "sigma_SAb": ergebnis["sigma_SAbo"], "sigma_ab": ergebnis["sigma_ab"]}
+        with self.batch():
+            for param, wert in werte.items():
+                if isfinite(wert):
+                    self.set_value(param, float(wert))
+                else:
+                    self.line_edits[param].clear()
+
+        zahl = lambda wert: f"{float(wert):.1f}".replace('.', ',')
+        if kraefte["F_KR"] < ergebnis["F_KA"]:
+            text = (f"Die Trennfuge klafft: F<sub>KR</sub> = {zahl(kraefte['F_KR'])} N ist kleiner als F<sub>KA</sub> = {zahl(ergebnis['F_KA'])} N. "
+                    "σ<sub>SAb</sub> gilt nur bis zur Klaffgrenze.")
+        else:
+            text = f"Kein Klaffen: F<sub>KR</sub> = {zahl(kraefte['F_KR'])} N ≥ F<sub>KA</sub> = {zahl(ergebnis['F_KA'])} N."
+        sigma_A = dauerfestigkeit.get_value("sigma_A")
+        if sigma_A is not None:
+            vergleich = "≤" if ergebnis["sigma_ab"] <= sigma_A else "&gt;"
+            text += f"<br>σ<sub>ab</sub> = {zahl(ergebnis['sigma_ab'])} N/mm<sup>2</sup> {vergleich} σ<sub>A</sub> = {zahl(sigma_A)} N/mm<sup>2</sup>."
+        self.exzentrizitaet_hinweis.setText(text)
+
+    def reibschluss_parameter(self):
+        """
+        Trennfugenzahlen q<sub>F</sub>, q<sub>M</sub> und geforderte Rutschsicherheit aus den Eingaben (mit Standardwerten).
+
+        Returns:
+            tuple: (q_F, q_M, S_G_erf)
+        """
+        q_F = self.get_value("q_F") or 1
+        q_M = self.get_value("q_M") or q_F
+        return q_F, q_M, S_G_MIN[self.querbelastung.currentText()]
+
+    def klemmkraft_querkraft(self, F_Q, my):
+        """
+        Mindestklemmkraft F<sub>KQerf</sub> der Einzelschraube für F<sub>Q</sub> und M<sub>Y</sub> (siehe reibschluss.klemmkraft_querkraft).
+        """
+        q_F, q_M, _ = self.reibschluss_parameter()
+        M_Y = self.get_value("M_Y") or 0.0
+        r_a = self.get_value("r_a")
+        if not r_a:
+            M_Y, r_a = 0.0, 1.0
+        return klemmkraft_querkraft(F_Q, my, q_F, M_Y * 1000, r_a, q_M)
+
+    def reibschluss_calc(self):
+        """
+        Berechnet F<sub>KQerf</sub> und die Rutschsicherheit S<sub>G</sub> der Einzelschraube über die Kräftekette
+        (betriebskraefte) und vergleicht mit der geforderten Rutschsicherheit.
+        """
+        self.reibschluss_hinweis.setText("")
+        F_Q, my = self.get_value("F_Q"), self.get_value("my")
+        Phi, F_Mmax = self.get_value("Phi"), self.get_value("F_Mmax")
+        if F_Q is None or not my:
+            return
+        S_G_erf = self.reibschluss_parameter()[2]
+        F_KQerf = float(self.klemmkraft_querkraft(F_Q, my))
+        self.set_value("F_KQerf", F_KQerf)
+        if Phi is None or F_Mmax is None:
+            return
+        kraefte = betriebskraefte(Phi, F_Mmax, self.get_value("F_A") or 0.0, self.get_value("alpha_A") or 1.0, self.get_value("F_Z") or 0.0)
+        F_KR = float(kraefte["F_KR"])
+        S_G = max(F_KR, 0.0) / F_KQerf if F_KQerf > 0 else float("inf")
+        if S_G != float("inf"):
+            self.set_value("S_G", S_G)
+        zahl = lambda wert: f"{wert:.2f}".replace('.', ',')
+        if S_G >= S_G_erf:
+            self.reibschluss_hinweis.setText(f"Die Rutschsicherheit S<sub>G</sub> = {zahl(S_G)} ist ausreichend (S<sub>G erf</sub> = {zahl(S_G_erf)}).")
+        else:
+            self.reibschluss_hinweis.setText(f"Die Rutschsicherheit S<sub>G</sub> = {zahl(S_G)} ist kleiner als S<sub>G erf</sub> = {zahl(S_G_erf)}. "
+                                             f"Erforderlich F<sub>KR</sub> \u2265 {zahl(S_G_erf * F_KQerf)} N.")
+
+    def relaxation_calc(self):
+        """
+        Vorspannkraftverlust durch Kriechen der verspannten Teile über der Betriebszeit (relaxation.vorspannkraftverlust)
+        ausgehend von F<sub>V</sub> = F<sub>Mmin</sub> - F<sub>Z</sub> unter der Betriebskraft F<sub>A</sub>, mit dem Nachziehintervall bis F<sub>KR</sub> = F<sub>Kerf</sub>.
+        """
+        if not hasattr(self.mainwindow, "nachgiebigkeit_widget"):
+            return
+        self.relaxation_hinweis.setText("")
+        B, n = self.get_value("B_kr"), self.get_value("n_kr")
+        if B is None or n is None:
+            return
+        delta_s, delta_p, Phi = self.get_value("delta_s"), self.get_value("delta_p"), self.get_value("Phi")
+        F_Mmax = self.get_value("F_Mmax")
+        l_kr, A_kr = self.get_value("l_kr"), self.get_value("A_kr")
+        if l_kr is None or A_kr is None:
+            stapel = self.mainwindow.nachgiebigkeit_widget.stapel
+            kriechend = ~stapel.schraube & (stapel.E > 0) & (stapel.E < 120000) & (stapel.l > 0)
+            if kriechend.any():
+                l_kr = l_kr if l_kr is not None else float(stapel.l[kriechend].sum())
+                A_kr = A_kr if A_kr is not None else float(stapel.A[kriechend].min())
+        if None in (delta_s, delta_p, Phi, F_Mmax, l_kr, A_kr) or not A_kr > 0:
+            self.relaxation_hinweis.setText("Für das Kriechen werden δ<sub>s</sub>, δ<sub>p</sub>, φ, F<sub>Mmax</sub>, l<sub>kr</sub> und A<sub>kr</sub> benötigt.")
+            return
+
+        F_A = self.get_value("F_A")
+        if F_A is None:
+            F_A = self.get_value("F_Ao") or 0.0
+        F_V0 = F_Mmax / (self.get_value("alpha_A") or 1.0) - (self.get_value("F_Z") or 0.0)
+        F_Kerf = self.get_value("F_Kerf") or 0.0
+        t_B = self.get_value("t_B") or 87600.0
+        ergebnis = vorspannkraftverlust(F_V0, delta_s + delta_p, l_kr, A_kr, B, n, self.get_value("m_kr") or 1.0,
+                                        (1 - Phi) * F_A, F_Kerf, t_B)
+        t_Kerf = float(ergebnis["t_Kerf"])
+        with self.batch():
+            self.set_value("F_V_t", float(ergebnis["F_V"]))
+            if isfinite(t_Kerf):
+                self.set_value("t_Kerf", t_Kerf)
+            else:
+                self.line_edits["t_Kerf"].clear()
+
+        zahl = lambda wert: f"{wert:.1f}".replace('.', ',')
+        text = (f"Kriechverlust nach {zahl(t_B)} h: {zahl(float(ergebnis['verlust']))} N "
+                f"({zahl(100 * float(ergebnis['verlust']) / F_V0)} % von F<sub>V</sub>), F<sub>KR</sub> = {zahl(float(ergebnis['F_KR']))} N.")
+        if isfinite(t_Kerf):
+            text += f" F<sub>KR</sub> erreicht F<sub>Kerf</sub> = {zahl(F_Kerf)} N nach {zahl(t_Kerf)} h, die Schraube muss vorher nachgezogen werden."
+        else:
+            text += f" F<sub>Kerf</sub> = {zahl(F_Kerf)} N wird innerhalb der Betriebszeit nicht unterschritten."
+        self.relaxation_hinweis.setText(text)
+
+    def kennlinie_parameter(self):
+        """
+        Kennlinien von Schraube (linear mit δ<sub>s</sub>) und Teilen (Eingabe), Montagevorspannkraft F<sub>Mmin</sub> und Setzbetrag.
+
+        Returns:
+            tuple: (kl_S, kl_P, F_M, f_Z in mm) oder None, wenn keine gültige Bauteilkennlinie eingegeben ist.
+        """
+        text = self.bauteilkennlinie.text().strip()
+        delta_s, F_Mmax = self.get_value("delta_s"), self.get_value("F_Mmax")
+        if not text or not delta_s or not F_Mmax:
+            return None
+        try:
+            paare = [[float(wert.replace(',', '.')) for wert in paar.split()] for paar in text.split(';') if paar.strip()]
+            if not paare or any(len(paar) != 2 for paar in paare):
+                raise ValueError("Je Punkt werden f und F benötigt")
+            kl_P = kennlinie([paar[0] for paar in paare], [paar[1] for paar in paare])
+        except ValueError as error:
+            self.kennlinie_hinweis.setText(f"Die Bauteilkennlinie ist ungültig: {error}")
+            return None
+        F_M = F_Mmax / (self.get_value("alpha_A") or 1.0)
+        f_Z = (self.get_value("f_Z") or 0.0) * 0.001
+        F_Z = self.get_value("F_Z")
+        if not f_Z and F_Z:
+            # Nur F_Z eingegeben: f_Z = F_Z*(δ_s + δ_p), ohne δ_p mit der Sekantennachgiebigkeit der Teile bei F_M
+            delta_p = self.get_value("delta_p") or float(weg(kl_P, F_M)) / F_M
+            f_Z = F_Z * (delta_s + delta_p)
+        return linear_kennlinie(delta_s, F_M), kl_P, F_M, f_Z
+
+    def kennlinie_calc(self):
+        """
+        Arbeitspunkt (F<sub>V</sub>, f<sub>V</sub>) nach dem Setzen und Kraftaufteilung F<sub>SA</sub>/F<sub>PA</sub> unter F<sub>A</sub>
+        mit der nichtlinearen Bauteilkennlinie (kennlinie.arbeitspunkt, kennlinie.betriebspunkt).
+        """
+        self.kennlinie_hinweis.setText("")
+        parameter = self.kennlinie_parameter()
+        if parameter is None:
+            return
+        kl_S, kl_P, F_M, f_Z = parameter
+        F_A = self.get_value("F_A")
+        if F_A is None:
+            F_A = self.get_value("F_Ao") or 0.0
+        punkt = arbeitspunkt(F_M, kl_S, kl_P, f_Z)
+        last = betriebspunkt(F_A, kl_S, kl_P, punkt["F_V"])
+        with self.batch():
+            self.set_value("F_V_nl", punkt["F_V"])
+            self.set_value("f_V_nl", punkt["f_SV"])
+            self.set_value("F_SA_nl", float(last["F_SA"]))
+            self.set_value("F_PA_nl", float(last["F_PA"]))
+            self.set_value("Phi_nl", float(last["Phi"]))
+
+        zahl = lambda wert: f"{round(wert, 1) + 0.0:.1f}".replace('.', ',')
+        text = (f"Setzkraft F<sub>Z</sub> = {zahl(punkt['F_Z'])} N, Restklemmkraft unter F<sub>A</sub>: "
+                f"F<sub>KR</sub> = {zahl(float(last['F_P']))} N.")
+        if last["klafft"]:
+            text += " Die Teile heben ab, die Schraube trägt F<sub>A</sub> allein."
+        self.kennlinie_hinweis.setText(text)
+
+    def kennlinie_schaubild(self):
+        """
+        Kurven des Verspannungsschaubilds mit der nichtlinearen Bauteilkennlinie für update_plot und PlotWindow.
+
+        Returns:
+            dict: Siehe kennlinie.verspannungsschaubild, oder None ohne Bauteilkennlinie.
+        """
+        parameter = self.kennlinie_parameter()
+        if parameter is None:
+            return None
+        kl_S, kl_P, F_M, f_Z = parameter
+        F_A = self.get_value("F_A")
+        if F_A is None:
+            F_A = self.get_value("F_Ao") or 0.0
+        return verspannungsschaubild(kl_S, kl_P, arbeitspunkt(F_M, kl_S, kl_P, f_Z)["F_V"], F_A)
+
+    def add_lastfall(self, werte=None):
+        """
+        Hängt einen Lastfall an die Tabelle an (ohne Werte mit den aktuellen F<sub>Ao</sub>/F<sub>A</sub>, F<sub>Au</sub> und F<sub>Q</sub>).
+
+        Args:
+            werte (list, optional): Name, F_Ao, F_Au und F_Q.
+        """
+        if not werte:
+            F_Ao = self.get_value("F_Ao")
+            werte = [f"LF {self.lastfaelle.rowCount() + 1}", F_Ao if F_Ao is not None else self.get_value("F_A"),
+                     self.get_value("F_Au"), self.get_value("F_Q")]
+        self.lastfaelle.blockSignals(True)
+        row = self.lastfaelle.rowCount()
+        self.lastfaelle.insertRow(row)
+        for column, wert in enumerate(werte):
+            text = wert if isinstance(wert, str) else ("" if wert is None else f"{wert:g}".replace('.', ','))
+            self.lastfaelle.setItem(row, column, QTableWidgetItem(text))
+        for column in range(len(LASTFALL_SPALTEN), self.lastfaelle.columnCount()):
+            item = QTableWidgetItem("")
+            item.setFlags(item.flags() & ~Qt.ItemIsEditable)
+            self.lastfaelle.setItem(row, column, item)
+        self.lastfaelle.blockSignals(False)
+
+    def remove_lastfall(self):
+        """
+        Entfernt die ausgewählten Lastfälle, ohne Auswahl den letzten.
+        """
+        rows = sorted({index.row() for index in self.lastfaelle.selectedIndexes()}, reverse=True)
+        for row in rows or [self.lastfaelle.rowCount() - 1]:
+            if row >= 0:
+                self.lastfaelle.removeRow(row)
+        self.lastfaelle_calc()
+
+    def lastfaelle_laden(self):
+        """
+        Lädt Lastfälle aus einer CSV- oder Excel-Datei (siehe lastfaelle.lastfaelle_lesen) und ersetzt die Tabelle.
+        """
+        pfad, _ = QFileDialog.getOpenFileName(self, "Lastfälle laden", "", "Lastfälle (*.csv *.xls *.xlsx)")
+        if not pfad:
+            return
+        try:
+            self.set_lastfaelle(lastfaelle_lesen(pfad))
+        except (OSError, ValueError, KeyError) as error:
+            self.lastfaelle_hinweis.setText(f"Die Lastfälle konnten nicht gelesen werden: {error}")
+
+    def set_lastfaelle(self, lastfaelle):
+        """
+        Ersetzt die Lastfalltabelle und rechnet alle Lastfälle.
+
+        Args:
+            lastfaelle (dict): Spalten aus LASTFALL_SPALTEN mit gleich langen Listen.
+        """
+        self.lastfaelle.setRowCount(0)
+        for werte in zip(*(lastfaelle[spalte] for spalte in LASTFALL_SPALTEN)):
+            self.add_lastfall(list(werte))
+        self.lastfaelle_calc()
+
+    def lastfall_spalte(self, column):
+        """
+        Werte einer Kraftspalte der Lastfalltabelle (leere Zellen als 0, ungültige als nan).
+        """
+        werte = []
+        for row in range(self.lastfaelle.rowCount()):
+            item = self.lastfaelle.item(row, column)
+            text = item.text().strip().replace(',', '.') if item is not None else ""
+            try:
+                werte.append(float(text) if text else 0.0)
+            except ValueError:
+                werte.append(float("nan"))
+        return werte
+
+    def lastfaelle_calc(self):
+        """
+        Rechnet alle Lastfälle der Tabelle in einem Durchlauf (lastfaelle_berechnen) mit den Schraubenkennwerten der
+        Einzelschraube, trägt die Ergebnisse ein und markiert je Kriterium den maßgebenden Lastfall der Hüllkurve.
+        """
+        if not hasattr(self.mainwindow, "dauerfestigkeit_widget") or self.lastfaelle.rowCount() == 0:
+            self.lastfaelle_hinweis.setText("")
+            return
+        dauerfestigkeit = self.mainwindow.dauerfestigkeit_widget
+        Phi, F_Mmax = self.get_value("Phi"), self.get_value("F_Mmax")
+        A_s, d = dauerfestigkeit.get_gewinde("A_s"), dauerfestigkeit.get_gewinde("d")
+        self.lastfaelle.blockSignals(True)
+        for row in range(self.lastfaelle.rowCount()):
+            for column in range(len(LASTFALL_SPALTEN), self.lastfaelle.columnCount()):
+                item = self.lastfaelle.item(row, column)
+                item.setText("")
+                item.setBackground(QBrush())
+        if None in (Phi, F_Mmax, A_s, d):
+            self.lastfaelle.blockSignals(False)
+            self.lastfaelle_hinweis.setText("Für die Lastfälle werden \u03C6, F<sub>Mmax</sub>, A<sub>s</sub> und d benötigt.")
+            return
+
+        q_F = self.reibschluss_parameter()[0]
+        ergebnis = lastfaelle_berechnen(
+            *(self.lastfall_spalte(column) for column in range(1, len(LASTFALL_SPALTEN))), Phi, F_Mmax, A_s, d,
+            alpha_A=self.get_value("alpha_A") or 1.0, F_Z=self.get_value("F_Z") or 0.0, my=self.get_value("my") or None, q_F=q_F,
+            R_p02=dauerfestigkeit.get_werkstoff("R_p02"), A_p=dauerfestigkeit.get_value("A_p"), p_Gzul=dauerfestigkeit.get_value("p_Gzul"),
+            schlussgewalzt=dauerfestigkeit.verg.currentText() == "Schlussgewalzte/gerollte SG")
+
+        for offset, spalte in enumerate(ERGEBNIS_SPALTEN):
+            if spalte not in ergebnis:
+                continue
+            column = len(LASTFALL_SPALTEN) + offset
+            werte = ergebnis[spalte] + 0 * ergebnis["F_Smax"]
+            for row, wert in enumerate(werte):
+                self.lastfaelle.item(row, column).setText(f"{wert:.4g}".replace('.', ',') if isfinite(wert) else "-")
+            if spalte in ergebnis["huelle"]:
+                self.lastfaelle.item(ergebnis["huelle"][spalte][0], column).setBackground(QBrush(QColor("#ffd6a5")))
+        self.lastfaelle.blockSignals(False)
+
+        namen = [self.lastfaelle.item(row, 0).text() if self.lastfaelle.item(row, 0) else str(row + 1) for row in range(self.lastfaelle.rowCount())]
+        zahl = lambda wert: f"{wert:.4g}".replace('.', ',')
+        zeilen = [f"{HUELLE[spalte]}. {spalte} = {zahl(wert)} ({namen[index]})" for spalte, (index, wert) in ergebnis["huelle"].items()]
+        self.lastfaelle_hinweis.setText(f"Hüllkurve über {len(namen)} Lastfälle: " + "; ".join(zeilen))
+
     def load_alpha_a(self):
         """
-        Speist die Excel-Daten in ein pandas DataFrame ein und setzt daraus die ToolTips (Hover-Overs) für alpha<sub>A</sub>.
+        Lädt Tabelle 3.7 im WorkerPool. Die ComboBox wird in alpha_a_loaded gefüllt.
         """
-        df = read_excel("stor/3.7.xlsx", header=None)
+        self.alpha_a.setEnabled(False)
+        self.mainwindow.worker_pool.submit("kraefte/alpha_a", read_alpha_a_table, on_result=self.alpha_a_loaded)
 
-        items = df.iloc[1:, 0].tolist()
-        tooltips = df.iloc[1:, 1].tolist()
+    def alpha_a_loaded(self, result):
+        """
+        Setzt die Einträge und ToolTips (Hover-Overs) für alpha<sub>A</sub> aus den geladenen Excel-Daten.
+
+        Args:
+            result (tuple): Bereiche und ToolTips aus read_alpha_a_table.
+        """
+        items, tooltips = result
 
+        # Das Befüllen soll keinen alpha_A-Wert setzen
+        self.alpha_a.blockSignals(True)
         for item, tooltip in zip(items, tooltips):
             self.alpha_a.addItem(item)
             index = self.alpha_a.findText(item)
             self.alpha_a.setItemData(index, tooltip, Qt.ToolTipRole)
+        self.alpha_a.blockSignals(False)
+        self.alpha_a.setEnabled(True)
 
     def set_alpha_a(self):
         """
@@ -566,15 +1257,45 @@ class KraefteWidget(QWidget):
                 return None
         return None
 
+    @contextmanager
+    def batch(self):
+        """
+        Fasst mehrere Wertänderungen zu einer Transaktion zusammen.
+
+        Innerhalb des Blocks sendet set_value keine Signale, sondern merkt sich nur die
+        geänderten Parameter. Beim Verlassen des äußersten Blocks werden valuesChanged und
+        paramsChanged genau einmal mit der gesamten Änderungsmenge emittiert.
+        Blöcke dürfen verschachtelt werden.
+
+        Beispiel:
+            with kraefte_widget.batch():
+                kraefte_widget.set_value("F_A", 6000)
+                kraefte_widget.set_value("F_KR", 4000)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_changes:
+                changes = self._batch_changes
+                self._batch_changes = set()
+                self.valuesChanged.emit()
+                self.paramsChanged.emit(changes)
+
     def set_value(self, param, value):
         """
         Setzt den Wert eines bestimmten Parameters in den Eingabefeldern.
-        Optimiert, um unnötige UI-Updates zu vermeiden.
+        Optimiert, um unnötige UI-Updates zu vermeiden. Innerhalb von batch() wird
+        die Änderung nur vorgemerkt und erst am Ende der Transaktion gemeldet.
         """
         line_edit = self.line_edits[param]
         current_text = line_edit.text()
         
-        if isinstance(value, (int, float)):
+        if value is None:
+            # None leert das Feld
+            formatted_value = ""
+        elif isinstance(value, (int, float)):
             if abs(value) < 1e-3 or abs(value) > 1e4:
                 formatted_value = f"{value:.4e}".replace('e', 'E')
             else:
@@ -590,4 +1311,8 @@ class KraefteWidget(QWidget):
             line_edit.setText(formatted_value)
             line_edit.blockSignals(False)
             # Only emit signal if value changed
-            self.valuesChanged.emit()
+            if self._batch_depth:
+                self._batch_changes.add(param)
+            else:
+                self.valuesChanged.emit()
+                self.paramsChanged.emit({param})
@@ -0,0 +1,62 @@
+# Krafteinleitungsfaktor n aus Verbindungstyp und Lage der Krafteinleitung (Tabellenwerte, bilinear interpoliert, NumPy-vektorisiert)
+from numpy import array, asarray, broadcast_arrays, clip, searchsorted
+
+# Verbindungstypen SV 1 bis SV 6: von der Krafteinleitung nahe der Kopf-/Mutterauflage (SV 1)
+# bis zur Krafteinleitung nahe der Trennfuge (SV 6)
+VERBINDUNGSTYPEN = ["SV 1", "SV 2", "SV 3", "SV 4", "SV 5", "SV 6"]
+
+# Stützstellen: bezogene Länge des Anschlusskörpers l_A/h und bezogener Abstand a_k/h
+# der Krafteinleitung vom Rand der Kopfauflage (h: Höhe des Anschlusskörpers)
+L_A_H = array([0.0, 0.1, 0.2, 0.3])
+A_K_H = array([0.0, 0.1, 0.3, 0.5])
+
+# n[Verbindungstyp][l_A/h][a_k/h]; außerhalb der Stützstellen gilt der Randwert (l_A/h ≥ 0,3 bzw. a_k/h ≥ 0,5)
+N_TABELLE = array([
+    [[0.70, 0.55, 0.30, 0.13], [0.52, 0.41, 0.22, 0.10], [0.34, 0.28, 0.16, 0.07], [0.16, 0.14, 0.12, 0.04]],
+    [[0.57, 0.46, 0.30, 0.13], [0.44, 0.35, 0.23, 0.10], [0.30, 0.24, 0.17, 0.07], [0.15, 0.13, 0.12, 0.04]],
+    [[0.44, 0.37, 0.26, 0.12], [0.34, 0.28, 0.20, 0.09], [0.25, 0.21, 0.15, 0.07], [0.14, 0.12, 0.10, 0.04]],
+    [[0.42, 0.34, 0.25, 0.12], [0.33, 0.27, 0.19, 0.09], [0.24, 0.20, 0.14, 0.07], [0.13, 0.11, 0.10, 0.04]],
+    [[0.30, 0.25, 0.22, 0.10], [0.24, 0.20, 0.17, 0.08], [0.19, 0.16, 0.14, 0.06], [0.12, 0.10, 0.08, 0.03]],
+    [[0.15, 0.14, 0.14, 0.07], [0.13, 0.11, 0.11, 0.06], [0.12, 0.10, 0.10, 0.06], [0.10, 0.08, 0.07, 0.03]],
+])
+
+def _stelle(stuetzstellen, x):
+    """
+    Index des linken Stützpunkts und Anteil zum rechten Stützpunkt (außerhalb auf den Rand begrenzt).
+    """
+    x = clip(x, stuetzstellen[0], stuetzstellen[-1])
+    i = clip(searchsorted(stuetzstellen, x) - 1, 0, len(stuetzstellen) - 2)
+    return i, (x - stuetzstellen[i]) / (stuetzstellen[i + 1] - stuetzstellen[i])
+
+def krafteinleitungsfaktor(verbindungstyp, h, a_k, l_A=0.0):
+    """
+    Krafteinleitungsfaktor n aus der Tabelle für den Verbindungstyp, bilinear über l_A/h und a_k/h interpoliert.
+    Alle Argumente dürfen Arrays sein (Batch-Auswertung vieler Verbindungen).
+
+    Args:
+        verbindungstyp (array_like): Index 0..5 für SV 1 bis SV 6 oder die Bezeichnung aus VERBINDUNGSTYPEN.
+        h (array_like): Höhe des Anschlusskörpers in mm.
+        a_k (array_like): Abstand der Krafteinleitung vom Rand der Kopfauflage in mm.
+        l_A (array_like, optional): Länge des Anschlusskörpers in mm.
+
+    Returns:
+        array_like: n (0 < n ≤ 0,7).
+    """
+    if isinstance(verbindungstyp, str):
+        verbindungstyp = VERBINDUNGSTYPEN.index(verbindungstyp)
+    typ, h, a_k, l_A = broadcast_arrays(asarray(verbindungstyp, dtype=int), asarray(h, dtype=float), asarray(a_k, dtype=float), asarray(l_A, dtype=float))
+    i, s = _stelle(L_A_H, l_A / h)
+    j, t = _stelle(A_K_H, a_k / h)
+    return ((1 - s) * (1 - t) * N_TABELLE[typ, i, j] + (1 - s) * t * N_TABELLE[typ, i, j + 1]
+            + s * (1 - t) * N_TABELLE[typ, i + 1, j] + s * t * N_TABELLE[typ, i + 1, j + 1])
+
+def nachgiebigkeiten_n(delta_s, delta_p, n):
+    """
+    Der Schraube bzw. der Zwischenlage zugerechnete Nachgiebigkeiten bei Krafteinleitung innerhalb der verspannten Teile:
+    δ_pn = n*δ_p, δ_sn = δ_s + (1-n)*δ_p und φ_n = n*δ_p/(δ_s + δ_p).
+
+    Returns:
+        dict: "delta_sn", "delta_pn" und "Phi_n".
+    """
+    delta_s, delta_p, n = (asarray(x, dtype=float) for x in (delta_s, delta_p, n))
+    return {"delta_sn": delta_s + (1 - n) * delta_p, "delta_pn": n * delta_p, "Phi_n": n * delta_p / (delta_s + delta_p)}
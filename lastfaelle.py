@@ -0,0 +1,75 @@
+# Lastfalltabelle: alle Lastfälle einer Verbindung in einem Durchlauf durch die Kräfte- und Festigkeitskette und deren Hüllkurve
+import os
+
+from numpy import argmax, argmin, asarray, errstate, inf, isfinite, where
+from pandas import read_csv, read_excel
+
+from schraubenkraefte import betriebskraefte, festigkeitsnachweis
+
+# Spalten der Lastfalltabelle (Eingaben) und der Ergebnisse
+LASTFALL_SPALTEN = ["Name", "F_Ao", "F_Au", "F_Q"]
+ERGEBNIS_SPALTEN = ["F_Smax", "F_KR", "sigma_a", "p", "S_G"]
+# Maßgebend ist der größte (max) bzw. kleinste (min) Wert
+HUELLE = {"F_Smax": "max", "F_KR": "min", "sigma_a": "max", "p": "max", "S_G": "min"}
+
+def lastfaelle_lesen(pfad):
+    """
+    Liest Lastfälle aus einer CSV- oder Excel-Datei mit einer Kopfzeile aus LASTFALL_SPALTEN
+    (F_A wird als F_Ao gelesen, fehlende Spalten gelten als 0). CSV-Dateien mit Semikolon werden
+    mit Dezimalkomma gelesen.
+
+    Args:
+        pfad (str): Pfad der Datei (.csv, .xls oder .xlsx).
+
+    Returns:
+        dict: "Name" (Liste) und je Kraftspalte eine Liste der Werte in N.
+    """
+    if os.path.splitext(pfad)[1].lower() == ".csv":
+        with open(pfad, encoding="utf-8-sig") as datei:
+            semikolon = ";" in datei.readline()
+        df = read_csv(pfad, sep=";", decimal=",") if semikolon else read_csv(pfad)
+    else:
+        df = read_excel(pfad)
+    df = df.rename(columns={spalte: str(spalte).strip() for spalte in df.columns}).rename(columns={"F_A": "F_Ao"})
+    lastfaelle = {"Name": [str(name) for name in df["Name"]] if "Name" in df else [f"LF {i + 1}" for i in range(len(df))]}
+    for spalte in LASTFALL_SPALTEN[1:]:
+        lastfaelle[spalte] = df[spalte].fillna(0).astype(float).tolist() if spalte in df else [0.0] * len(df)
+    return lastfaelle
+
+def lastfaelle_berechnen(F_Ao, F_Au, F_Q, Phi, F_Mmax, A_s, d, alpha_A=1.0, F_Z=0.0, my=None, q_F=1, R_p02=None, A_p=None,
+                         p_Gzul=None, tau_t=0.0, k_tau=0.5, schlussgewalzt=False):
+    """
+    Rechnet alle Lastfälle in einem vektorisierten Durchlauf durch betriebskraefte und festigkeitsnachweis
+    und bestimmt die Hüllkurve (maßgebender Lastfall je Kriterium, siehe HUELLE).
+
+    Args:
+        F_Ao (array_like): Obergrenze der Betriebskraft je Lastfall in N.
+        F_Au (array_like): Untergrenze der Betriebskraft je Lastfall in N.
+        F_Q (array_like): Querkraft je Lastfall in N.
+        Phi, F_Mmax, A_s, d, alpha_A, F_Z, my, q_F: Siehe schraubenkraefte.betriebskraefte.
+        R_p02, A_p, p_Gzul, tau_t, k_tau, schlussgewalzt: Siehe schraubenkraefte.festigkeitsnachweis.
+
+    Returns:
+        dict: Alle Ergebnisse je Lastfall (Arrays), "S_G" = F_KR/F_KQerf (mit my) und "huelle" mit
+            {Kriterium: (Index des maßgebenden Lastfalls, Wert)}.
+    """
+    F_Ao = asarray(F_Ao, dtype=float)
+    kraefte = betriebskraefte(Phi, F_Mmax, F_Ao, alpha_A, F_Z, F_Au, F_Q, my, q_F)
+    festigkeit = festigkeitsnachweis(kraefte["F_Smax"], kraefte["F_SAa"], kraefte["F_Sm"], A_s, d, R_p02, A_p, p_Gzul,
+                                     tau_t, k_tau, schlussgewalzt)
+    ergebnis = {**kraefte, **festigkeit}
+    if "F_KQerf" in kraefte:
+        with errstate(divide='ignore', invalid='ignore'):
+            ergebnis["S_G"] = where(kraefte["F_KQerf"] > 0, where(kraefte["F_KR"] > 0, kraefte["F_KR"], 0) / kraefte["F_KQerf"], inf)
+
+    huelle = {}
+    for kriterium, richtung in HUELLE.items():
+        if kriterium not in ergebnis or F_Ao.size == 0:
+            continue
+        werte = ergebnis[kriterium] + 0 * F_Ao
+        if not isfinite(werte).any():
+            continue
+        index = int(argmax(where(isfinite(werte), werte, -inf)) if richtung == "max" else argmin(where(isfinite(werte), werte, inf)))
+        huelle[kriterium] = (index, float(werte[index]))
+    ergebnis["huelle"] = huelle
+    return ergebnis
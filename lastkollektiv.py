@@ -0,0 +1,196 @@
+# Lastkollektiv aus gemessenen Zeitreihen F_A(t): blockweises Einlesen, Rainflow-Zählung und Klassierung (NumPy-vektorisiert)
+import os
+
+from numpy import abs as np_abs
+from numpy import (
+    asarray,
+    concatenate,
+    diff,
+    flatnonzero,
+    float32,
+    float64,
+    histogram2d,
+    inf,
+    linspace,
+    load,
+    memmap,
+    ones,
+    sign,
+    zeros,
+)
+from pandas import read_csv
+
+# Werte je Block; der Speicherbedarf hängt nur von der Blockgröße ab, nicht von der Länge der Zeitreihe
+BLOCKGROESSE = 1_000_000
+# Binärformate ohne Kopf (Rohdaten in Maschinen-Byte-Reihenfolge)
+BINAER_DTYPES = {".f32": float32, ".f64": float64, ".bin": float64, ".dat": float64}
+
+def zeitreihe_bloecke(pfad, spalte=None, blockgroesse=BLOCKGROESSE):
+    """
+    Liest eine Zeitreihe blockweise. .npy-Dateien und Rohdaten (BINAER_DTYPES) werden speicherabgebildet,
+    CSV-Dateien in Blöcken gelesen (mit Semikolon als Trenner und Dezimalkomma).
+
+    Args:
+        pfad (str): Pfad der Datei.
+        spalte (str or int, optional): Spalte der Betriebskraft (CSV: Name oder Nummer, .npy: Nummer bei 2D-Arrays),
+            Standard "F_A" bzw. die letzte Spalte.
+        blockgroesse (int, optional): Anzahl der Werte je Block.
+
+    Yields:
+        ndarray: Block der Zeitreihe als float-Array.
+    """
+    endung = os.path.splitext(pfad)[1].lower()
+    if endung in (".csv", ".txt"):
+        with open(pfad, encoding="utf-8-sig") as datei:
+            semikolon = ";" in datei.readline()
+        optionen = {"sep": ";", "decimal": ","} if semikolon else {}
+        for block in read_csv(pfad, chunksize=blockgroesse, encoding="utf-8-sig", **optionen):
+            if spalte is None:
+                werte = block["F_A"] if "F_A" in block else block.iloc[:, -1]
+            else:
+                werte = block.iloc[:, spalte] if isinstance(spalte, int) else block[spalte]
+            yield werte.to_numpy(dtype=float)
+        return
+
+    if endung == ".npy":
+        daten = load(pfad, mmap_mode="r")
+        if daten.ndim > 1:
+            daten = daten[:, -1 if spalte is None else spalte]
+    elif endung in BINAER_DTYPES:
+        daten = memmap(pfad, dtype=BINAER_DTYPES[endung], mode="r")
+    else:
+        raise ValueError(f"Unbekanntes Dateiformat '{endung}' (CSV, .npy oder {', '.join(BINAER_DTYPES)})")
+    for start in range(0, len(daten), blockgroesse):
+        yield asarray(daten[start:start + blockgroesse], dtype=float)
+
+def umkehrpunkte(x):
+    """
+    Umkehrpunkte einer Folge (Spitzen und Täler); gleiche aufeinanderfolgende Werte werden zusammengefasst,
+    der erste und der letzte Wert bleiben immer erhalten.
+
+    Returns:
+        ndarray: Die Umkehrpunkte.
+    """
+    x = asarray(x, dtype=float)
+    if len(x) < 3:
+        return x
+    x = x[concatenate(([True], diff(x) != 0))]
+    richtung = sign(diff(x))
+    umkehr = concatenate(([True], richtung[1:] != richtung[:-1], [True]))
+    return x[umkehr]
+
+def rainflow(r):
+    """
+    Rainflow-Zählung (Vier-Punkt-Methode) einer Folge von Umkehrpunkten. Je Durchlauf werden alle geschlossenen
+    Hystereseschleifen r[i+1], r[i+2] mit |r[i+2] - r[i+1]| <= |r[i+1] - r[i]| und <= |r[i+3] - r[i+2]| zugleich
+    gezählt und entfernt (Treffer mit mindestens drei Punkten Abstand beeinflussen sich nicht).
+
+    Args:
+        r (array_like): Umkehrpunkte (siehe umkehrpunkte).
+
+    Returns:
+        tuple: (Ausschläge, Mittelwerte der geschlossenen Schwingspiele, Residuum als Umkehrpunkte).
+    """
+    r = asarray(r, dtype=float)
+    ausschlaege, mittelwerte = [], []
+    while len(r) >= 4:
+        spanne = np_abs(diff(r))
+        treffer = flatnonzero((spanne[1:-1] <= spanne[:-2]) & (spanne[1:-1] <= spanne[2:]))
+        if len(treffer) == 0:
+            break
+        # Überlappende Treffer erst im nächsten Durchlauf
+        frei = ones(len(treffer), dtype=bool)
+        frei[1:] = diff(treffer) >= 3
+        treffer = treffer[frei]
+        oben, unten = r[treffer + 1], r[treffer + 2]
+        ausschlaege.append(np_abs(oben - unten) / 2)
+        mittelwerte.append((oben + unten) / 2)
+        bleibt = ones(len(r), dtype=bool)
+        bleibt[treffer + 1] = False
+        bleibt[treffer + 2] = False
+        r = r[bleibt]
+    if not ausschlaege:
+        return zeros(0), zeros(0), r
+    return concatenate(ausschlaege), concatenate(mittelwerte), r
+
+def wertebereich(bloecke):
+    """
+    Kleinster und größter Wert einer blockweise gelesenen Zeitreihe sowie deren Länge.
+
+    Returns:
+        tuple: (Minimum, Maximum, Anzahl der Werte).
+    """
+    minimum, maximum, anzahl = inf, -inf, 0
+    for block in bloecke:
+        if len(block):
+            minimum, maximum, anzahl = min(minimum, block.min()), max(maximum, block.max()), anzahl + len(block)
+    return minimum, maximum, anzahl
+
+def rainflow_kollektiv(bloecke, Phi=1.0, F_V=0.0, bereich=None, klassen=64):
+    """
+    Rainflow-Zählung einer blockweise gelieferten Betriebskraft F_A(t) in Schraubenkräften
+    F_S(t) = F_V + φ*F_A(t), klassiert in einer Ausschlag-Mittelwert-Matrix.
+
+    Je Block werden die Umkehrpunkte bestimmt, an das Residuum des vorigen Blocks angehängt und die
+    geschlossenen Schwingspiele gezählt; nur das Residuum wird weitergereicht. Das Residuum am Ende geht als
+    Halbschwingspiele ein.
+
+    Args:
+        bloecke (iterable): Blöcke der Betriebskraft F_A in N (z.B. zeitreihe_bloecke).
+        Phi (float, optional): Verspannungsfaktor φ.
+        F_V (float, optional): Vorspannkraft in N (verschiebt nur die Mittelwerte).
+        bereich (tuple, optional): (F_Amin, F_Amax) der Zeitreihe für die Klassengrenzen (siehe wertebereich).
+            Ohne Angabe werden die Klassengrenzen aus dem ersten Block geschätzt und Werte außerhalb
+            den Randklassen zugeordnet.
+        klassen (int, optional): Anzahl der Klassen für Ausschlag und Mittelwert.
+
+    Returns:
+        dict: "F_SAa" und "F_Sm" (Klassenmitten in N), "zyklen" (Matrix [Ausschlag, Mittelwert], Halbschwingspiele
+            zählen 0,5), "F_SAa_max" und "F_Sm_max" (größtes Schwingspiel, ungeklasst), "zyklen_gesamt", "n_werte".
+    """
+    residuum = zeros(0)
+    zyklen = zeros((klassen, klassen))
+    F_SAa_max, F_Sm_max, n_werte = 0.0, F_V, 0
+    kanten = None
+
+    def klassieren(ausschlag, mittel, gewicht):
+        nonlocal F_SAa_max, F_Sm_max
+        if len(ausschlag) == 0:
+            return
+        i = ausschlag.argmax()
+        if ausschlag[i] > F_SAa_max:
+            F_SAa_max, F_Sm_max = float(ausschlag[i]), float(mittel[i])
+        ausschlag = ausschlag.clip(kanten[0][0], kanten[0][-1])
+        mittel = mittel.clip(kanten[1][0], kanten[1][-1])
+        zyklen[:] += histogram2d(ausschlag, mittel, bins=kanten, weights=gewicht * ones(len(ausschlag)))[0]
+
+    for block in bloecke:
+        if len(block) == 0:
+            continue
+        n_werte += len(block)
+        F_S = F_V + Phi * asarray(block, dtype=float)
+        if kanten is None:
+            F_Amin, F_Amax = bereich if bereich is not None else (block.min(), block.max())
+            F_Smin, F_Smax = sorted((F_V + Phi * F_Amin, F_V + Phi * F_Amax))
+            kanten = (linspace(0, max((F_Smax - F_Smin) / 2, 1e-12), klassen + 1),
+                      linspace(F_Smin, max(F_Smax, F_Smin + 1e-12), klassen + 1))
+        ausschlag, mittel, residuum = rainflow(umkehrpunkte(concatenate((residuum, F_S))))
+        klassieren(ausschlag, mittel, 1.0)
+
+    if kanten is None:
+        raise ValueError("Die Zeitreihe enthält keine Werte")
+    klassieren(np_abs(diff(residuum)) / 2, (residuum[1:] + residuum[:-1]) / 2, 0.5)
+    mitte = lambda k: (k[1:] + k[:-1]) / 2
+    return {"F_SAa": mitte(kanten[0]), "F_Sm": mitte(kanten[1]), "zyklen": zyklen, "F_SAa_max": F_SAa_max,
+            "F_Sm_max": F_Sm_max, "zyklen_gesamt": float(zyklen.sum()), "n_werte": n_werte}
+
+def kollektiv_aus_datei(pfad, Phi=1.0, F_V=0.0, klassen=64, spalte=None, blockgroesse=BLOCKGROESSE):
+    """
+    Lastkollektiv der Schraubenkraft aus einer Zeitreihendatei in zwei Durchläufen mit konstantem Speicherbedarf
+    (Wertebereich für die Klassengrenzen, dann Rainflow-Zählung). Kann im WorkerPool laufen.
+
+    Returns:
+        dict: Siehe rainflow_kollektiv.
+    """
+    F_Amin, F_Amax, _ = wertebereich(zeitreihe_bloecke(pfad, spalte, blockgroesse))
+    return rainflow_kollektiv(zeitreihe_bloecke(pfad, spalte, blockgroesse), Phi, F_V, (F_Amin, F_Amax), klassen)
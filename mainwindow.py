@@ -16,7 +16,9 @@ from kraefte import KraefteWidget
 from werkstoff import WerkstoffWidget
 from dauerfestigkeit import DauerfestigkeitWidget
 from wirkungsgrad import WirkungsgradWidget
-from nachgiebigkeit import SvgWidget
+from nachgiebigkeit import SvgWidget, read_svg_data
+from dauerfestigkeit import FMTAB_PATHS_SCHAFT, FMTAB_PATHS_TAILLE, read_fmtab_sheet
+from worker import WorkerPool
 
 class PlotWindow(QMainWindow):
     """Separates Fenster zur Anzeige des Kraft-Weg-Diagramms."""
@@ -88,10 +90,16 @@ class PlotWindow(QMainWindow):
             delta_s = max(self.delta_s, 1e-12)
             delta_p = max(self.delta_p, 1e-12)
 
+            # Mit nichtlinearer Bauteilkennlinie gelten deren Arbeitspunkt und Kraftaufteilung
+            schaubild = self.kraefte_widget.kennlinie_schaubild()
+            if schaubild is not None:
+                F_V = schaubild["F_V"]
+
             # Derived values
-            F_SA = phi * F_A
-            F_PA = (1 - phi) * F_A
-            F_sp = F_Smax if F_Smax else (F_V + F_SA)
+            F_SA = phi * F_A if schaubild is None else schaubild["F_SA"]
+            F_PA = F_A - F_SA
+            # Mit Bauteilkennlinie die Schraubenkraft aus deren Arbeitspunkt, nicht das lineare F_Smax
+            F_sp = F_V + F_SA if schaubild is not None or not F_Smax else F_Smax
             F_V_minus_F_PA = F_V - F_PA
 
             # Displacements
@@ -142,9 +150,18 @@ class PlotWindow(QMainWindow):
                 x_cp_end = max(0.02, max_f_ext)
             x_cp = np.array([x_cp_start, x_cp_end])
             y_cp = F_V - (1.0 / delta_p) * (x_cp - f_V)
+            if schaubild is not None:
+                # Wahre Bauteilkennlinie statt der Geraden c_P (nur im sichtbaren Kraftbereich)
+                sichtbar = schaubild["F_P"] <= y_limit
+                x_cp, y_cp = schaubild["f_P"][sichtbar], schaubild["F_P"][sichtbar]
             # Clip c_P y values to the y_limit range for safety
             y_cp = np.clip(y_cp, -ABSOLUTE_Y_MAX, y_limit)
-            self.ax.plot(x_cp, y_cp, color='red', linewidth=3, label='c_P (Bauteil)', zorder=3)
+            self.ax.plot(x_cp, y_cp, color='red', linewidth=3, label='c_P (Bauteil)' if schaubild is None else 'Bauteil (Kennlinie)', zorder=3)
+
+            def y_teil(x):
+                if schaubild is not None:
+                    return np.clip(np.interp(x, schaubild["f_P"][::-1], schaubild["F_P"][::-1]), -ABSOLUTE_Y_MAX, y_limit)
+                return np.clip(F_V - (1.0 / delta_p) * (x - f_V), -ABSOLUTE_Y_MAX, y_limit)
 
             # === top horizontal line at F_sp (highlighted) ===
             if F_sp and F_sp > 0:
@@ -194,7 +211,7 @@ class PlotWindow(QMainWindow):
                     left = max(0.0, f_V - 0.05 * max_f_ext)
                 x_positions = np.linspace(right, left, n)
                 def y_on_cp(x):
-                    return np.clip(F_V - (1.0 / delta_p) * (x - f_V), -ABSOLUTE_Y_MAX, y_limit)
+                    return y_teil(x)
                 for (label, val, _), x_pos in zip(valid_sorted, x_positions):
                     base_y = y_on_cp(x_pos)
                     self.ax.annotate('', xy=(x_pos, top_y), xytext=(x_pos, base_y),
@@ -212,7 +229,7 @@ class PlotWindow(QMainWindow):
 
                 # Base on c_P line at this x
                 def y_on_cp_local(x):
-                    return np.clip(F_V - (1.0 / delta_p) * (x - f_V), -ABSOLUTE_Y_MAX, y_limit)
+                    return y_teil(x)
 
                 base_y = y_on_cp_local(x_seg)
 
@@ -293,7 +310,8 @@ class PlotWindow(QMainWindow):
             self.ax.legend(loc='upper left', fontsize=9, frameon=True)
 
             # draw the canvas (do NOT call tight_layout here, it would move our fixed axes)
-            self.canvas.draw()
+            # draw_idle bündelt mehrere Aktualisierungen zu einem Zeichenvorgang in der Event-Loop
+            self.canvas.draw_idle()
 
         except Exception as e:
             print(f"Error in update_plot: {e}")
@@ -338,6 +356,11 @@ class MainWindow(QMainWindow):
         self.calc_timer.setSingleShot(True)
         self.calc_timer.timeout.connect(self.calculate)
         self.pending_updates = set()
+
+        # Hintergrund-Worker für Tabellen und aufwendige Berechnungen; Schlüssel haben die Form "abschnitt/auftrag"
+        self.worker_pool = WorkerPool(self)
+        self.busy_jobs = {}
+        self.worker_pool.busyChanged.connect(self.set_section_busy)
         
         # Setze das Gebietsschema auf Deutsch
         german_locale = QLocale(QLocale.German)
@@ -432,9 +455,11 @@ class MainWindow(QMainWindow):
         self.gewinde_widget.changed_d.connect(lambda value: self.nachgiebigkeit_widget.update(value, "d"))
         self.gewinde_widget.changed_a_s.connect(lambda value: self.nachgiebigkeit_widget.update(value, "a_s"))
         self.nachgiebigkeit_widget.deltaValuesChanged.connect(self.kraefte_widget.update_delta_values)
-        self.nachgiebigkeit_widget.deltaValuesChanged.connect(self.update_input_fields)
+        self.nachgiebigkeit_widget.deltaValuesChanged.connect(lambda delta_s, delta_p, phi: self.update_input_fields({"delta_s", "delta_p", "Phi"}))
         self.wirkungsgrad_widget.changed_my.connect(lambda value: self.kraefte_widget.set_value("my", value))
-        self.kraefte_widget.valuesChanged.connect(self.update_input_fields)
+        self.kraefte_widget.paramsChanged.connect(self.update_input_fields)
+        self.kraefte_widget.paramsChanged.connect(
+            lambda changed: self.wirkungsgrad_widget.calculate_anziehen() if changed & {"F_Mmin", "F_Mmax", "delta_s", "delta_p"} else None)
 
         # Hinzufügen der scroll area zum Zentralen Layout 
         self.central_layout.addWidget(scroll_area)
@@ -509,6 +534,48 @@ class MainWindow(QMainWindow):
             self.plot_window.update_plot()
         self.plot_window.show()
 
+    def preload_reference_data(self):
+        """
+        Lädt nach dem Anzeigen des Fensters alle Referenzdaten parallel im WorkerPool vor.
+        Die SVG-Grafiken werden an ihre Widgets gebunden, sobald sie gelesen sind; die F_MTab-Tabellen
+        landen im Zwischenspeicher von read_fmtab_sheet, sodass die erste Vordimensionierung nicht mehr
+        auf die Excel-Dateien warten muss. Die Bilder aus Anhang A.1 dekodiert das WerkstoffWidget.
+        Tabelle 3.7 und 3.13 laden die Widgets bereits selbst.
+        """
+        for svg_widget in self.findChildren(SvgWidget):
+            self.worker_pool.submit(f"preload/{svg_widget.path}", read_svg_data, svg_widget.path, on_result=svg_widget.load_data)
+        for path in dict.fromkeys(FMTAB_PATHS_SCHAFT + FMTAB_PATHS_TAILLE):
+            self.worker_pool.submit(f"preload/{path}", read_fmtab_sheet, path)
+        self.werkstoff_widget.preload_images()
+
+    def set_section_busy(self, key, busy):
+        """
+        Zeigt für den Abschnitt eines Hintergrundauftrags eine Besetzt-Anzeige (Cursor und Statusleiste).
+
+        Args:
+            key (str): Schlüssel des Auftrags in der Form "abschnitt/auftrag", z.B. "dauerfestigkeit/fmtab".
+            busy (bool): True, wenn der Auftrag läuft.
+        """
+        section = key.split('/')[0]
+        jobs = self.busy_jobs.setdefault(section, set())
+        if busy:
+            jobs.add(key)
+        else:
+            jobs.discard(key)
+
+        widget = getattr(self, f"{section}_widget", None)
+        if widget is not None:
+            if jobs:
+                widget.setCursor(Qt.BusyCursor)
+            else:
+                widget.unsetCursor()
+
+        running = sorted(job for section_jobs in self.busy_jobs.values() for job in section_jobs)
+        if running:
+            self.statusBar().showMessage("Wird geladen: " + ", ".join(running))
+        else:
+            self.statusBar().clearMessage()
+
     def is_valid_float(self, text):
         """Check if the text can be converted to a valid float."""
         try:
@@ -550,15 +617,29 @@ class MainWindow(QMainWindow):
         except Exception as e:
             print(f"Error updating value: {e}")  # Debugging output
 
-    def update_input_fields(self):
+    def update_input_fields(self, changed=None):
         """
         Updates the input fields with the current values from KraefteWidget and NachgiebigkeitWidget.
         Optimized for better performance by avoiding unnecessary updates.
+
+        Args:
+            changed (set, optional): Menge der geänderten Parameter (z.B. aus KraefteWidget.paramsChanged).
+                Ist sie angegeben, werden nur die betroffenen Felder neu formatiert.
         """
+        if changed is None:
+            variables = list(self.input_fields)
+        else:
+            variables = [var for var in self.input_fields if var in changed]
+            # F_PA wird bei Bedarf aus F_A und Phi abgeleitet
+            if "F_PA" not in variables and changed & {"F_A", "Phi", "Phi_n"}:
+                variables.append("F_PA")
+            if not variables:
+                return
+
         # Block all signals temporarily for better performance
         self.blockSignals(True)
         
-        for var in self.input_fields:
+        for var in variables:
             input_field = self.input_fields[var]
             
             # Get current value in the field
@@ -642,9 +723,17 @@ class MainWindow(QMainWindow):
         if suppress_calculation:
             self.blockSignals(True)
             
-        # Clear all line edits
-        for line_edit in self.findChildren(QLineEdit):
-            line_edit.clear()
+        # Felder des KraefteWidget als eine Transaktion leeren (ein einziges paramsChanged mit allen Parametern),
+        # alle übrigen Felder ohne textChanged, damit nicht jedes Feld eine eigene Neuberechnung anstößt
+        kraefte_felder = set(self.kraefte_widget.line_edits.values())
+        with self.kraefte_widget.batch():
+            for param in self.kraefte_widget.line_edits:
+                self.kraefte_widget.set_value(param, None)
+            for line_edit in self.findChildren(QLineEdit):
+                if line_edit not in kraefte_felder:
+                    line_edit.blockSignals(True)
+                    line_edit.clear()
+                    line_edit.blockSignals(False)
             
         # Close any plot window
         if self.plot_window is not None:
@@ -658,6 +747,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         if self.plot_window is not None:
             self.plot_window.close()
+        self.worker_pool.wait(2000)
         print("Programm wird geschlossen")
         event.accept()
 
@@ -670,27 +760,30 @@ class MainWindow(QMainWindow):
         self.blockSignals(True)
         
         selected_example = self.example_selector.currentText()
+        self.nachgiebigkeit_widget.reset_bauteile()
         self.clear_tab(suppress_calculation=True)  # Clear previous values without triggering calculation
         
-        # Load the selected example
-        if selected_example == "F20":
-            self.load_example_1()
-        elif selected_example == "H19":
-            self.load_example_2()
-        elif selected_example == "F19":
-            self.load_example_3()
-        elif selected_example == "H22":
-            self.load_example_5()
-        elif selected_example == "Ü 3.1":
-            self.load_example_6()
-        elif selected_example == "Ü 3.5":
-            self.load_example_10()
-        elif selected_example == "Ü 3.7":
-            self.load_example_12()
+        # Load the selected example. Alle Kräfte-Änderungen werden in einer Transaktion
+        # gesammelt, damit die Diagramm-Eingaben nur einmal aktualisiert werden.
+        with self.kraefte_widget.batch():
+            if selected_example == "F20":
+                self.load_example_1()
+            elif selected_example == "H19":
+                self.load_example_2()
+            elif selected_example == "F19":
+                self.load_example_3()
+            elif selected_example == "H22":
+                self.load_example_5()
+            elif selected_example == "Ü 3.1":
+                self.load_example_6()
+            elif selected_example == "Ü 3.5":
+                self.load_example_10()
+            elif selected_example == "Ü 3.7":
+                self.load_example_12()
             
-        # Re-enable signals and perform a single calculation
-        self.blockSignals(False)
-        self.calculate()  # Recalculate all values
+            # Re-enable signals and perform a single calculation
+            self.blockSignals(False)
+            self.calculate()  # Recalculate all values
         self.update_input_fields()  # Update UI fields once
 
     def load_example_1(self):
@@ -997,10 +1090,11 @@ class MainWindow(QMainWindow):
             "Phi": "0.25"
         }
         
-        # Update all input fields with the optimal values
-        for var, value in optimal_values.items():
-            if var in self.input_fields:
-                self.input_fields[var].setText(value)
+        # Update all input fields with the optimal values (als eine Transaktion)
+        with self.kraefte_widget.batch():
+            for var, value in optimal_values.items():
+                if var in self.input_fields:
+                    self.input_fields[var].setText(value)
         
         # Trigger calculation
         self.calc_timer.start(100)
@@ -1044,6 +1138,8 @@ def main():
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
+    # Referenzdaten erst laden, wenn das Fenster sichtbar und bedienbar ist
+    QTimer.singleShot(0, window.preload_reference_data)
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
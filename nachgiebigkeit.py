@@ -1,10 +1,21 @@
-from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QGroupBox, QGraphicsView, QGraphicsScene, QSizePolicy, QMessageBox, QCheckBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QGroupBox, QGraphicsView, QGraphicsScene, QSizePolicy, QMessageBox, QCheckBox, QPushButton, QHBoxLayout, QCompleter
+from PyQt5.QtCore import Qt, QByteArray
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtSvg import QSvgWidget
 from PyQt5.QtCore import pyqtSignal
-from numpy import pi
+from numpy import pi, array, nan, flatnonzero, inf, isfinite
 from PyQt5.QtGui import QDoubleValidator
+from normteile import BOHRUNGSREIHEN, normteil_geometrie, ersatzlaenge_kopf, ersatzlaenge_mutter
+from stapel import Bauteilstapel
+from verformungskegel import VERBINDUNGSARTEN, nachgiebigkeit_kegel
+from fe_zwischenlage import fe_verfuegbar, fe_nachgiebigkeit
+from krafteinleitung import VERBINDUNGSTYPEN, krafteinleitungsfaktor, nachgiebigkeiten_n
+from werkstoffdaten import WERKSTOFFE, werkstoff_kennwerte
+from thermik import vorspannkraftaenderung
+
+# Standard-Bauteile des Stapels
+SCHRAUBENABSCHNITTE = ["Kopf", "Schaft", "freies Gewinde", "Mutter/Verschraubung"]
+ZWISCHENLAGEN = ["1 (z.B. Deckel)", "2 (z.B. Gehäuse)", "3 (z.B. Boden)", "4 (z.B. Hülse)"]
 
 class NachgiebigkeitWidget(QWidget):
     """
@@ -33,6 +44,8 @@ class NachgiebigkeitWidget(QWidget):
         deltaValuesChanged (pyqtSignal): Signal, das die neuen Delta-Werte übermittelt.
         svg_widget (SvgWidget): Widget zum Anzeigen einer SVG-Grafik.
         widgets (dict): Ein Wörterbuch, das die Bauteil-Widgets enthält.
+        show_bauteile (list): Die Namen der Bauteile in Stapelreihenfolge (erst Schraubenabschnitte, dann Zwischenlagen).
+        stapel (Bauteilstapel): E, A, l und δ aller Bauteile als NumPy-Arrays.
         delta_labels (dict): Ein Wörterbuch, das die Delta-Labels enthält.
     """
     deltaValuesChanged = pyqtSignal(float, float, float)
@@ -96,6 +109,13 @@ class NachgiebigkeitWidget(QWidget):
             scroll_layout.addWidget(unit_label, i, 2)
             self.line_edits[param] = line_edit
 
+        # Reihe der Durchgangsbohrung nach ISO 273 für die Normmaße
+        self.bohrungsreihe = QComboBox()
+        self.bohrungsreihe.addItems(BOHRUNGSREIHEN)
+        self.bohrungsreihe.setCurrentText("mittel")
+        self.bohrungsreihe.setToolTip("Durchgangsbohrung nach ISO 273")
+        scroll_layout.addWidget(self.bohrungsreihe, 5, 3)
+
         self.material_fall_label = QLabel("Fallunterschiedung Material:")
         self.material_fall = QComboBox()
         self.material_fall.addItems(["Stahl", "Grauguss", "Al-Legierung"])
@@ -108,6 +128,20 @@ class NachgiebigkeitWidget(QWidget):
         scroll_layout.addWidget(self.fall_ersatzquerschnitt_titel, 9, 0)
         scroll_layout.addWidget(self.fall_ersatzquerschnitt, 9, 1)
 
+        # Ersatzquerschnitt nach Fall A/B/C oder aus dem Verformungskegel für alle Zwischenlagen
+        self.ersatzmodell = QComboBox()
+        self.ersatzmodell.addItems(["Fall A/B/C", "Verformungskegel"])
+        if fe_verfuegbar():
+            self.ersatzmodell.addItem("FE (achsensymmetrisch)")
+        self.ersatzmodell.setToolTip("Verformungskegel: Kegel/Hülse schichtweise durch alle Zwischenlagen mit deren E-Moduln integriert (l und E je Zwischenlage erforderlich)<br>"
+                                     "FE: achsensymmetrisches FE-Modell der Zwischenlagen (benötigt scipy)")
+        self.ersatzmodell.currentIndexChanged.connect(self.calculate)
+        scroll_layout.addWidget(self.ersatzmodell, 8, 2)
+        self.verbindungsart = QComboBox()
+        self.verbindungsart.addItems(VERBINDUNGSARTEN)
+        self.verbindungsart.currentIndexChanged.connect(self.calculate)
+        scroll_layout.addWidget(self.verbindungsart, 9, 2)
+
         
         # Fallunterscheidung 1, 2, 3
 
@@ -142,6 +176,15 @@ class NachgiebigkeitWidget(QWidget):
         scroll_layout.addWidget(schraubenart_label, 12, 0)
         scroll_layout.addWidget(self.schraubenart, 12, 1)
 
+        # Normmaße für d_k, D_B, m und die Ersatzlängen von Kopf und Mutter
+        self.scheibe = QCheckBox("Scheiben")
+        self.scheibe.setToolTip("Scheiben nach ISO 7089 unter Kopf und Mutter (d<sub>k</sub> = Scheibenaußendurchmesser)")
+        scroll_layout.addWidget(self.scheibe, 12, 2)
+        normmasse_button = QPushButton("Normmaße übernehmen")
+        normmasse_button.setToolTip("Sechskantschraube ISO 4017, Innensechskantschraube ISO 4762, Mutter ISO 4032, Durchgangsbohrung ISO 273")
+        normmasse_button.clicked.connect(self.set_normmasse)
+        scroll_layout.addWidget(normmasse_button, 12, 3)
+
 
         # Gruppieren von Schraubenbauteilen
         self.group_box_schrauben = QGroupBox("Schraubenbauteile")
@@ -155,6 +198,15 @@ class NachgiebigkeitWidget(QWidget):
         self.group_box_zwischenlagen.setLayout(group_layout_zwischenlagen)
         scroll_layout.addWidget(self.group_box_zwischenlagen, 14, 0, 1, 3)
 
+        # Schaltflächen zum Erweitern und Verkleinern des Bauteilstapels
+        stapel_layout = QHBoxLayout()
+        for text, slot in [("+ Schraubenabschnitt", self.add_schraubenabschnitt), ("- Schraubenabschnitt", self.remove_schraubenabschnitt),
+                           ("+ Zwischenlage", self.add_zwischenlage), ("- Zwischenlage", self.remove_zwischenlage)]:
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            stapel_layout.addWidget(button)
+        scroll_layout.addLayout(stapel_layout, 15, 0, 1, 3)
+
          # Weitere widgets für delta_pn, delta_sn, und Phi
         eingaben_2 = [
             [0,"Nachgiebigkeit der Schraube \u03B4<sub>s</sub>", "mm/N", "delta_s", " "],
@@ -183,13 +235,58 @@ class NachgiebigkeitWidget(QWidget):
             self.delta_labels[param] = name_label
             self.line_edits[param] = line_edit
 
+        # Krafteinleitungsfaktor n aus Verbindungstyp und Lage der Krafteinleitung (Fall 2)
+        self.krafteinleitung_hinweis = QLabel("Fall 2: n aus Verbindungstyp, h und a<sub>k</sub> (Tabelle) oder die zur Schraube (\u03B4<sub>sn</sub>) gehörenden Teile mit einem Häkchen markieren")
+        self.krafteinleitung_hinweis.setWordWrap(True)
+        self.krafteinleitung_hinweis.setVisible(False)
+        scroll_layout.addWidget(self.krafteinleitung_hinweis, 24, 0, 1, 3)
+        self.verbindungstyp = QComboBox()
+        self.verbindungstyp.addItems(VERBINDUNGSTYPEN)
+        self.verbindungstyp.setToolTip("SV 1: Krafteinleitung nahe der Kopf-/Mutterauflage ... SV 6: Krafteinleitung nahe der Trennfuge")
+        self.verbindungstyp.currentIndexChanged.connect(self.calculate)
+        scroll_layout.addWidget(QLabel("Verbindungstyp"), 25, 0)
+        scroll_layout.addWidget(self.verbindungstyp, 25, 1)
+        eingaben_n = [
+            ["Höhe des Anschlusskörpers h", "mm", "h", ""],
+            ["Abstand der Krafteinleitung a<sub>k</sub>", "mm", "a_k", "Abstand der Krafteinleitung vom Rand der Kopfauflage"],
+            ["Länge des Anschlusskörpers l<sub>A</sub>", "mm", "l_A", "Ohne Eingabe l<sub>A</sub> = 0"],
+        ]
+        for i, (name, unit, param, verweis) in enumerate(eingaben_n, start=26):
+            line_edit = QLineEdit()
+            line_edit.setObjectName(param)
+            line_edit.setValidator(self.validator)
+            line_edit.setToolTip(verweis)
+            line_edit.editingFinished.connect(self.calculate)
+            scroll_layout.addWidget(QLabel(name), i, 0)
+            scroll_layout.addWidget(line_edit, i, 1)
+            scroll_layout.addWidget(QLabel(unit), i, 2)
+            self.line_edits[param] = line_edit
+
+        # Vorspannkraftänderung durch Temperatur (Werkstoffe der Bauteile, ohne Eingabe Stahl)
+        eingaben_th = [
+            ["Betriebstemperatur Schraube T<sub>S</sub>", "°C", "T_S", ""],
+            ["Betriebstemperatur Zwischenlagen T<sub>P</sub>", "°C", "T_P", ""],
+            ["Montagetemperatur T<sub>0</sub>", "°C", "T_0", "Ohne Eingabe 20 °C"],
+            ["Thermische Vorspannkraftänderung \u0394F<sub>Vth</sub>", "N", "delta_F_Vth", "Positiv: Zunahme der Vorspannkraft im Betrieb"],
+        ]
+        for i, (name, unit, param, verweis) in enumerate(eingaben_th, start=29):
+            line_edit = QLineEdit()
+            line_edit.setObjectName(param)
+            line_edit.setValidator(self.validator)
+            line_edit.setToolTip(verweis)
+            line_edit.editingFinished.connect(self.calculate)
+            scroll_layout.addWidget(QLabel(name), i, 0)
+            scroll_layout.addWidget(line_edit, i, 1)
+            scroll_layout.addWidget(QLabel(unit), i, 2)
+            self.line_edits[param] = line_edit
+
         # Initialisiere die GroupBox mit allen möglichen Widgets
         self.initialize_bauteile_widgets()                     
 
     def krafteinleitung(self):
         """
         Aktualisiert die Sichtbarkeit der Kontrollkästchen basierend auf der aktuellen Auswahl der Krafteinleitung.
-        Zeigt eine Informationsnachricht an, wenn die Krafteinleitung innerhalb der verspannten Teile oder in der Trennfuge erfolgt.
+        Blendet einen Hinweis ein, wenn die Krafteinleitung innerhalb der verspannten Teile oder in der Trennfuge erfolgt.
         """
         current_index = self.fall.currentIndex()
         if current_index == 0:
@@ -200,83 +297,165 @@ class NachgiebigkeitWidget(QWidget):
             for bauteil in self.show_bauteile:
                 elements = self.widgets[bauteil]
                 elements['check'].show()
-            QMessageBox.about(self, "Information", "Bitte alle Teile die zur Schraube (\u03B4<sub>sn</sub>)\n gehören mit einem Häkchen markieren")
+        self.krafteinleitung_hinweis.setVisible(current_index != 0)
 
     def initialize_bauteile_widgets(self):
         """
-        Initialisiert die Widgets für die Bauteile und fügt sie der Benutzeroberfläche hinzu.
+        Initialisiert den Bauteilstapel mit den Standard-Bauteilen und fügt deren Widgets der Benutzeroberfläche hinzu.
         Setzt die Standardansicht für die Bauteile.
         """
         self.widgets = {}
+        self.show_bauteile = []
+        self.stapel = Bauteilstapel()
+        self.bauteil_rows = 0
+        for bauteil in SCHRAUBENABSCHNITTE:
+            self.add_bauteil(bauteil, True)
+        for bauteil in ZWISCHENLAGEN:
+            self.add_bauteil(bauteil, False)
+
+        self.set_bauteile("Standard")  # Initialisiert zu "Standard"
+
+    def add_bauteil(self, bauteil, schraube):
+        """
+        Fügt dem Stapel einen Schraubenabschnitt oder eine Zwischenlage mit den Eingabefeldern E, A, l und δ hinzu.
+
+        Args:
+            bauteil (str): Der Name des Bauteils.
+            schraube (bool): True für Schraubenabschnitte, False für Zwischenlagen.
+        """
         l_notes="Schraubenkopflänge:<br> Sechskantschrauben: l<sub>k</sub>=0,5*d <br>Innensechskantschrauben: l<sub>k</sub>=0,4*d <br><br>Mutterkopflänge: m= Mutterhöhe<br>fürm/d=0,8=>l<sub>m</sub>=0,4*d<br>fürm/d=1,25=>l<sub>m</sub>=0,5*d<br>fürm/d=1,5=>l<sub>m</sub>=0,6*d"
         aers_notes=" A<sub>K</sub>=A<sub>Sch</sub>=A<sub>M</sub>= &pi;*d<sup>2</sup>/4<br>oder A<sub>s</sub><br>A<sub>ers</sub>:<br> Fall a :A=pi*(D<sub>A</sub><sup>2</sup>+D<sub>B</sub><sup>2</sup>)/4<br>Fall b: A=pi*(d<sub>K</sub><sup>2</sup>-D<sub>B</sub><sup>2</sup>)/4 <br> + pi*(D<sub>A</sub>/d<sub>k</sub>-1)*(d<sub>k</sub>*l/5+l<sup>2</sup>/100)/8<br><br>Fall c: Stahl:A=pi*((d<sub>k</sub>+l/10)<sup>2</sup>-D<sub>B</sub><sup>2</sup>)/4<br>Grauguss:A=pi*((d<sub>k</sub>+l/8)<sup>2</sup>-D<sub>B</sub><sup>2</sup>)/4<br>AL-Leg.:A=pi*((d<sub>k</sub>+l/6)<sup>2</sup>-D<sub>B</sub><sup>2</sup>)/4"
         labels = [["E","E-Modul aus Anhang A.1 "],["A", aers_notes], ["l",l_notes], ["δ","δ=1/c=l/(E*A)"]]
         units = ["N/mm²", "mm²", "mm", "mm/N"]
-        bauteile = ["Kopf", "Schaft", "freies Gewinde", "Mutter/Verschraubung", "1 (z.B. Deckel)", "2 (z.B. Gehäuse)", "3 (z.B. Boden)", "4 (z.B. Hülse)"]
-
-        # Zuordnen der Bauteile zu den entsprechenden GroupBoxes
-        for i, bauteil in enumerate(bauteile):
-            self.widgets[bauteil] = {}
-            check_box = QCheckBox()
-            check_box.stateChanged.connect(self.delta_calc)
-            bauteil_name = QLabel(bauteil)
-            self.widgets[bauteil]['check'] = check_box
-            self.widgets[bauteil]['name'] = bauteil_name
-
-            # Hier entscheiden, zu welcher GroupBox das Bauteil gehört
-            if bauteil in ["Kopf", "Schaft", "freies Gewinde", "Mutter/Verschraubung"]:
-                layout_to_use = self.group_box_schrauben.layout()
-            else:
-                layout_to_use = self.group_box_zwischenlagen.layout()
-
-            layout_to_use.addWidget(check_box, i, 0)
-            layout_to_use.addWidget(bauteil_name, i, 1)
-
-            for j, (label, verweis) in enumerate(labels):
-                name_label = QLabel(label)
-                line_edit = QLineEdit()
-                line_edit.setValidator(self.validator)
-                line_edit.setToolTip(verweis)
-                line_edit.setObjectName(f"{label.lower()}_{i+1}")
-                unit_label = QLabel(units[j])
-                self.widgets[bauteil][label] = (name_label, line_edit, unit_label)
-                layout_to_use.addWidget(name_label, i, j*3 + 2)
-                layout_to_use.addWidget(line_edit,  i, j*3 + 3)
-                layout_to_use.addWidget(unit_label, i, j*3 + 4)
-                line_edit.editingFinished.connect(self.delta_calc)
 
-        self.set_bauteile("Standard")  # Initialisiert zu "Standard"
+        index = self.stapel.add(bauteil, schraube)
+        self.show_bauteile.insert(index, bauteil)
+        self.bauteil_rows += 1
+        i = self.bauteil_rows
+
+        self.widgets[bauteil] = {}
+        check_box = QCheckBox()
+        check_box.stateChanged.connect(self.delta_calc)
+        check_box.setVisible(self.fall.currentIndex() != 0)
+        bauteil_name = QLabel(bauteil)
+        self.widgets[bauteil]['check'] = check_box
+        self.widgets[bauteil]['name'] = bauteil_name
+
+        # Hier entscheiden, zu welcher GroupBox das Bauteil gehört
+        if schraube:
+            layout_to_use = self.group_box_schrauben.layout()
+        else:
+            layout_to_use = self.group_box_zwischenlagen.layout()
 
-    def set_bauteile(self, text):
+        layout_to_use.addWidget(check_box, i, 0)
+        layout_to_use.addWidget(bauteil_name, i, 1)
+
+        for j, (label, verweis) in enumerate(labels):
+            name_label = QLabel(label)
+            line_edit = QLineEdit()
+            line_edit.setValidator(self.validator)
+            line_edit.setToolTip(verweis)
+            line_edit.setObjectName(f"{label.lower()}_{i}")
+            unit_label = QLabel(units[j])
+            self.widgets[bauteil][label] = (name_label, line_edit, unit_label)
+            layout_to_use.addWidget(name_label, i, j*3 + 2)
+            layout_to_use.addWidget(line_edit,  i, j*3 + 3)
+            layout_to_use.addWidget(unit_label, i, j*3 + 4)
+            line_edit.editingFinished.connect(self.delta_calc)
+
+        # Werkstoff für E(20 °C) und die Wärmedehnung
+        werkstoff_edit = QLineEdit()
+        werkstoff_edit.setPlaceholderText("Werkstoff")
+        werkstoff_edit.setToolTip("Werkstoff aus Anhang A.1 bzw. Festigkeitsklasse (ohne Eingabe Stahl, E = 210000 N/mm²)")
+        werkstoff_edit.setCompleter(QCompleter([row[0] for row in WERKSTOFFE], werkstoff_edit))
+        werkstoff_edit.editingFinished.connect(lambda bauteil=bauteil: self.werkstoff_changed(bauteil))
+        self.widgets[bauteil]['werkstoff'] = werkstoff_edit
+        layout_to_use.addWidget(werkstoff_edit, i, 14)
+
+    def remove_bauteil(self, bauteil):
         """
-        Aktualisiert die Sichtbarkeit der Widgets basierend auf der ausgewählten Bauteilanzahl.
-        
+        Entfernt ein Bauteil samt seinen Widgets aus dem Stapel.
+
         Args:
-            text (str): Der ausgewählte Text, der die Anzahl der Bauteile bestimmt.
-        """
-        # Blendet als erstes alle Widgets aus
-        for bauteil, elements in self.widgets.items():
-            elements['name'].hide()
-            elements['check'].hide()
-            if bauteil == "Schraube":
-                elements['calculation'].hide()
-                elements['line_edit'].hide()
-            else:
-                for label, widgets in elements.items():
-                    if label != 'name' and label != 'check':
-                        widgets[0].hide()  # QLabel
-                        widgets[1].hide()  # QLineEdit
-                        widgets[2].hide()  # QLabel Unit
+            bauteil (str): Der Name des Bauteils.
+        """
+        elements = self.widgets.pop(bauteil)
+        self.stapel.remove(bauteil)
+        self.show_bauteile.remove(bauteil)
+        for label, widgets in elements.items():
+            for widget in (widgets if isinstance(widgets, tuple) else (widgets,)):
+                widget.setParent(None)
+                widget.deleteLater()
+
+    def add_schraubenabschnitt(self):
+        """
+        Fügt einen weiteren Schraubenabschnitt hinzu (z.B. Dehnschaft oder zweiter Schaftdurchmesser).
+        """
+        self.add_bauteil(self.neuer_name("Abschnitt {}", int(self.stapel.schraube.sum()) + 1), True)
+        self.set_e_value(self.show_bauteile[int(self.stapel.schraube.sum()) - 1])
 
-        # Zeige Widgets basierend auf dem ausgewählten Typ an
-        self.show_bauteile = ["Kopf", "Schaft", "freies Gewinde", "Mutter/Verschraubung", "1 (z.B. Deckel)", "2 (z.B. Gehäuse)", "3 (z.B. Boden)", "4 (z.B. Hülse)"]
+    def add_zwischenlage(self):
+        """
+        Fügt eine weitere Zwischenlage hinzu (z.B. Scheibe, Dichtung oder weitere Platte).
+        """
+        self.add_bauteil(self.neuer_name("{} (Zwischenlage)", int((~self.stapel.schraube).sum()) + 1), False)
+        self.set_e_value(self.show_bauteile[-1])
+
+    def remove_schraubenabschnitt(self):
+        """
+        Entfernt den zuletzt hinzugefügten Schraubenabschnitt (die Standardabschnitte Kopf, Schaft, freies Gewinde
+        und Mutter/Verschraubung bleiben erhalten).
+        """
+        zusaetzlich = [bauteil for bauteil in self.show_bauteile[:int(self.stapel.schraube.sum())]
+                       if bauteil not in SCHRAUBENABSCHNITTE]
+        if zusaetzlich:
+            self.remove_bauteil(zusaetzlich[-1])
+            self.delta_calc()
+
+    def remove_zwischenlage(self):
+        """
+        Entfernt die letzte Zwischenlage (mindestens eine bleibt erhalten).
+        """
+        if (~self.stapel.schraube).sum() > 1:
+            self.remove_bauteil(self.show_bauteile[-1])
+            self.delta_calc()
+
+    def neuer_name(self, muster, nummer):
+        """
+        Gibt einen noch nicht vergebenen Bauteilnamen nach dem Muster zurück.
+        """
+        while muster.format(nummer) in self.widgets:
+            nummer += 1
+        return muster.format(nummer)
+
+    def reset_bauteile(self):
+        """
+        Stellt den Standard-Stapel (Kopf, Schaft, freies Gewinde, Mutter und Zwischenlagen 1-4) wieder her.
+        """
+        for bauteil in list(self.show_bauteile):
+            if bauteil not in SCHRAUBENABSCHNITTE + ZWISCHENLAGEN:
+                self.remove_bauteil(bauteil)
+        for bauteil in SCHRAUBENABSCHNITTE + ZWISCHENLAGEN:
+            if bauteil not in self.widgets:
+                self.add_bauteil(bauteil, bauteil in SCHRAUBENABSCHNITTE)
+        # Reihenfolge der Zwischenlagen wiederherstellen
+        for bauteil in ZWISCHENLAGEN:
+            if self.show_bauteile.index(bauteil) != len(SCHRAUBENABSCHNITTE) + ZWISCHENLAGEN.index(bauteil):
+                self.remove_bauteil(bauteil)
+                self.add_bauteil(bauteil, False)
 
+    def set_bauteile(self, text):
+        """
+        Aktualisiert die Sichtbarkeit der Widgets aller Bauteile im Stapel.
+        
+        Args:
+            text (str): Die gewählte Ansicht (derzeit nur "Standard").
+        """
         for bauteil in self.show_bauteile:
             elements = self.widgets[bauteil]
             elements['name'].show()
-            elements['check'].show()
             for label, widgets in elements.items():
-                if label != 'name' and label != 'check':
+                if label not in ('name', 'check', 'werkstoff'):
                     widgets[0].show()  # QLabel Name
                     widgets[1].show()  # QLineEdit
                     widgets[2].show()  # QLabel Unit
@@ -284,79 +463,45 @@ class NachgiebigkeitWidget(QWidget):
         self.krafteinleitung()
         self.set_e_values()
 
+    def bauteil_value(self, bauteil, param):
+        """
+        Gibt den Wert eines Bauteil-Eingabefeldes als float zurück (nan, wenn leer).
+        """
+        text = self.widgets[bauteil][param][1].text().replace(',', '.')
+        return float(text) if text else nan
+
     def delta_calc(self):
         """
         Berechnet die Nachgiebigkeit basierend auf den eingegebenen Werten.
+        Die Werte aller Bauteile werden in den Bauteilstapel (NumPy-Arrays) übernommen und dort
+        spaltenweise ergänzt und summiert; die Kontrollkästchen bilden die Maske für δ_sn und δ_pn.
         Aktualisiert die entsprechenden Felder und übermittelt die neuen Werte.
         """
-        deltas = []
-
-        # Sammelt Werte l, E, A aus den line edits
-        for bauteil in self.show_bauteile:
-            E_line_edit = self.widgets[bauteil]['E'][1]
-            A_line_edit = self.widgets[bauteil]['A'][1]
-            l_line_edit = self.widgets[bauteil]['l'][1]
-            delta_line_edit = self.widgets[bauteil]['δ'][1]
-
-            l_value = l_line_edit.text().replace(',', '.')
-            E_value = E_line_edit.text().replace(',', '.')
-            A_value = A_line_edit.text().replace(',', '.')
-            delta_value = delta_line_edit.text().replace(',', '.')
-
-            if l_value and E_value and A_value and not delta_value:
-                delta = float(l_value) / (float(E_value) * float(A_value))
-                delta_line_edit.setText(str(format(delta, ".4e")).replace('.', ','))
-            elif l_value and E_value and delta_value and not A_value:
-                A = float(l_value) / (float(E_value) * float(delta_value))
-                A_line_edit.setText(str(format(A, ".4e")).replace('.', ','))
-            elif l_value and A_value and delta_value and not E_value:
-                E = float(l_value) / (float(A_value) * float(delta_value))
-                E_line_edit.setText(str(format(E, ".4e")).replace('.', ','))
-            elif A_value and E_value and delta_value and not l_value:
-                l = float(E_value) * float(delta_value) * float(A_value)
-                l_line_edit.setText(str(format(l, ".4e")).replace('.', ','))
-
-            if delta_line_edit.text() != '':
-                deltas.append(float(delta_line_edit.text().replace(',', '.')))
-            else:
-                deltas.append("empty")
-
-        if "empty" not in deltas[:4]:
-            delta_schraube = sum(deltas[:4])
+        # Sammelt Werte E, A, l, δ aus den line edits
+        spalten = [("E", "E"), ("A", "A"), ("l", "l"), ("delta", "δ")]
+        for param, label in spalten:
+            self.stapel.set_values(param, [self.bauteil_value(bauteil, label) for bauteil in self.show_bauteile])
+        self.stapel.zugerechnet = array([self.widgets[bauteil]['check'].isChecked() for bauteil in self.show_bauteile], dtype=bool)
+
+        # Ergänzt je Bauteil den fehlenden Wert aus δ = l/(E*A)
+        neu = self.stapel.complete()
+        for param, label in spalten:
+            werte = getattr(self.stapel, param)
+            for i in flatnonzero(neu[param]):
+                line_edit = self.widgets[self.show_bauteile[i]][label][1]
+                line_edit.setText(str(format(werte[i], ".4e")).replace('.', ','))
+
+        delta_schraube = self.stapel.delta_s()
+        if delta_schraube is not None:
             self.set_value("delta_s", delta_schraube)
             self.calculate()
-        non_empty_count = sum(1 for value in deltas[4:] if value != "empty")    # Berechnet delta_p wenn mindestens zwei delta-Werte eingegeben wurden
-        if non_empty_count >= 2:                                                # z.B. Gehäuse und Deckel
-            delta_p = sum(value for value in deltas[4:] if value != "empty")
+        delta_p = self.stapel.delta_p()
+        if delta_p is not None:
             self.set_value("delta_p", delta_p)
             self.calculate()
         if self.fall.currentIndex() != 0:
             # Berechnet und gibt delta_sn und delta_pn aus
-            delta_sn = 0
-            delta_pn = 0
-
-            first_four_checked = all(self.widgets[self.show_bauteile[i]]['check'].isChecked() for i in range(4))
-
-            if first_four_checked and self.get_value("delta_s") != None:
-                delta_sn += self.get_value("delta_s")
-            else:
-                for i in range(4):
-                    if deltas[i] != "empty":
-                        if self.widgets[self.show_bauteile[i]]['check'].isChecked():
-                            delta_sn += deltas[i]
-                        else:
-                            delta_pn += deltas[i]
-
-            for i in range(4, len(self.show_bauteile)):
-                check_box = self.widgets[self.show_bauteile[i]]['check']
-                delta_value = deltas[i]
-
-                if delta_value != "empty":
-                    if check_box.isChecked():
-                        delta_sn += delta_value
-                    else:
-                        delta_pn += delta_value
-
+            delta_sn, delta_pn = self.stapel.delta_n(self.get_value("delta_s"))
             self.set_value("delta_sn", delta_sn)
             self.set_value("delta_pn", delta_pn)
             self.calculate()
@@ -384,16 +529,8 @@ class NachgiebigkeitWidget(QWidget):
 
         # Nochmals (hier und in update) die Fallunterscheidungen für die Länge Schraubenkopf und Mutter
         if d != 0.0 and d != None and m != None:
-            if self.schraubenart.currentText() == "Sechskantschraube":
-                self.set_bauteil_param('l', 'Kopf', d*0.5)
-            else:
-                self.set_bauteil_param('l', 'Kopf', d*0.4)
-            if m/d == 0.8:
-                self.set_bauteil_param('l', 'Mutter/Verschraubung', d*0.4)
-            elif m/d == 1.25:
-                self.set_bauteil_param('l', 'Mutter/Verschraubung', d*0.5)
-            elif m/d == 1.5:
-                self.set_bauteil_param('l', 'Mutter/Verschraubung', d*0.6)
+            self.set_bauteil_param('l', 'Kopf', ersatzlaenge_kopf(d, self.schraubenart.currentText()))
+            self.set_bauteil_param('l', 'Mutter/Verschraubung', float(ersatzlaenge_mutter(d, m)))
 
         # mit delta s und delta p Phi berechnen
         if (delta_s != 0 or delta_p != 0) and (delta_s != None and delta_p != None):
@@ -408,9 +545,15 @@ class NachgiebigkeitWidget(QWidget):
             self.set_value("Phi_n", Phi_n)
             self.deltaValuesChanged.emit(delta_sn, delta_pn, Phi_n)
         
+        h = self.get_value("h")
+        a_k = self.get_value("a_k")
         if self.fall.currentIndex() == 0 or self.fall.currentIndex() == 2:
              n = 1
              self.set_value("n", n)
+        elif h and a_k is not None:
+            # n aus der Tabelle für den Verbindungstyp
+            n = float(krafteinleitungsfaktor(self.verbindungstyp.currentIndex(), h, a_k, self.get_value("l_A") or 0.0))
+            self.set_value("n", n)
         elif Phi != None and Phi_n != None and Phi != 0:
             n = Phi_n / Phi
             self.set_value("n", n)
@@ -421,13 +564,15 @@ class NachgiebigkeitWidget(QWidget):
             n=1
             self.set_value("n", n)
 
-        if self.fall.currentIndex() == 1 and n!=1 and n!=None and (delta_s != 0 or delta_p != 0):
-            delta_sn = delta_s +(1-n)*delta_p 
-            delta_pn=n*delta_p
-            Phi_n=delta_p*n/ (delta_s + delta_p)
+        if self.fall.currentIndex() == 1 and n!=1 and n!=None and delta_s != None and delta_p != None and (delta_s != 0 or delta_p != 0):
+            zugerechnet = nachgiebigkeiten_n(delta_s, delta_p, n)
+            delta_sn = float(zugerechnet["delta_sn"])
+            delta_pn = float(zugerechnet["delta_pn"])
+            Phi_n = float(zugerechnet["Phi_n"])
             self.set_value("delta_sn", delta_sn)
             self.set_value("delta_pn", delta_pn)
             self.set_value("Phi_n", Phi_n)
+            self.deltaValuesChanged.emit(delta_sn, delta_pn, Phi_n)
 
 
 
@@ -455,7 +600,11 @@ class NachgiebigkeitWidget(QWidget):
         else:
             self.fall_ersatzquerschnitt.setText("weitere Eingaben erforderlich")
 
-        if self.fall_ersatzquerschnitt.text() == "Fall A":
+        self.thermik_calc()
+
+        if self.ersatzmodell.currentIndex() != 0:
+            self.update_ersatzmodell(d_k, D_A, D_B)
+        elif self.fall_ersatzquerschnitt.text() == "Fall A":
             self.A_ers = pi/4*(D_A**2-D_B**2)
             self.update_A_ers()
         elif self.fall_ersatzquerschnitt.text() == "Fall B":
@@ -473,6 +622,66 @@ class NachgiebigkeitWidget(QWidget):
                 self.update_A_ers()
 
         
+    def thermik_calc(self):
+        """
+        Berechnet ΔF_Vth aus δ_s, den Nachgiebigkeiten und Dicken der Zwischenlagen, den Werkstoffen und den Betriebstemperaturen.
+        Die Schraube erhält den Werkstoff des ersten Schraubenabschnitts mit Werkstoffangabe.
+        """
+        T_S = self.get_value("T_S")
+        T_P = self.get_value("T_P")
+        delta_s = self.get_value("delta_s")
+        if T_S is None or T_P is None or not delta_s:
+            return
+        schraube = [self.bauteil_werkstoff(bauteil) for bauteil, ist_schraube in zip(self.stapel.namen, self.stapel.schraube) if ist_schraube]
+        werkstoff_s = next((werkstoff for werkstoff in schraube if werkstoff), "8.8")
+        lagen = [bauteil for bauteil, ist_schraube in zip(self.stapel.namen, self.stapel.schraube)
+                 if not ist_schraube and self.bauteil_value(bauteil, 'l') > 0 and self.bauteil_value(bauteil, 'δ') > 0]
+        if not lagen:
+            return
+        ergebnis = vorspannkraftaenderung(delta_s, werkstoff_s,
+                                          [self.bauteil_value(bauteil, 'δ') for bauteil in lagen],
+                                          [self.bauteil_value(bauteil, 'l') for bauteil in lagen],
+                                          [self.bauteil_werkstoff(bauteil) or "S235JR" for bauteil in lagen],
+                                          T_S, T_P, self.get_value("T_0") or 20)
+        self.set_value("delta_F_Vth", float(ergebnis["delta_F_Vth"][0]))
+
+    def update_ersatzmodell(self, d_k, D_A, D_B):
+        """
+        Berechnet A und δ aller Zwischenlagen mit bekannter Länge l und E-Modul aus dem Verformungskegel bzw.
+        dem FE-Modell und überträgt sie in den Bauteilstapel. Ohne D_A wird eine unendlich ausgedehnte Zwischenlage angenommen.
+
+        Args:
+            d_k (float): Kopfdurchmesser (Außendurchmesser der Auflage).
+            D_A (float): Auflagendurchmesser bzw. Ersatz-Außendurchmesser der Zwischenlage.
+            D_B (float): Bohrungsdurchmesser.
+        """
+        if not d_k or not D_B:
+            return
+        # Nur Zwischenlagen mit bekannter Länge und E-Modul bilden den Stapel
+        lagen = [bauteil for bauteil, schraube in zip(self.stapel.namen, self.stapel.schraube)
+                 if not schraube and self.bauteil_value(bauteil, 'l') > 0 and self.bauteil_value(bauteil, 'E') > 0]
+        if not lagen or D_B >= d_k:
+            return
+        h = [self.bauteil_value(bauteil, 'l') for bauteil in lagen]
+        E = [self.bauteil_value(bauteil, 'E') for bauteil in lagen]
+        if self.ersatzmodell.currentText() == "Verformungskegel":
+            kegel = nachgiebigkeit_kegel(h, E, d_k, D_B, D_A or inf, self.verbindungsart.currentText())
+            self.fall_ersatzquerschnitt.setText(f"Verformungskegel (D<sub>A,Gr</sub> = {float(kegel['D_A_Gr']):.1f} mm)".replace('.', ','))
+        else:
+            kegel = fe_nachgiebigkeit(d_k, D_B, D_A or inf, h, E, verbindungsart=self.verbindungsart.currentText())
+            self.fall_ersatzquerschnitt.setText(f"FE ({kegel['elemente']} Elemente)")
+
+        geaendert = False
+        for i, bauteil in enumerate(lagen):
+            if not (isfinite(kegel["A"][i]) and kegel["delta"][i] > 0):
+                continue
+            vorher = (self.widgets[bauteil]['A'][1].text(), self.widgets[bauteil]['δ'][1].text())
+            self.set_bauteil_param('A', bauteil, float(kegel["A"][i]))
+            self.set_bauteil_param('δ', bauteil, float(kegel["delta"][i]))
+            geaendert |= vorher != (self.widgets[bauteil]['A'][1].text(), self.widgets[bauteil]['δ'][1].text())
+        if geaendert:
+            self.delta_calc()
+
     def update_A_ers(self):
         """
         Aktualisiert den Ersatzquerschnitt (A_ers) basierend auf den aktuellen Werten.
@@ -481,7 +690,8 @@ class NachgiebigkeitWidget(QWidget):
         bauteile_to_update = ["1 (z.B. Deckel)", "2 (z.B. Gehäuse)"]
 
         for bauteil in bauteile_to_update:
-            self.set_bauteil_param('A', bauteil, self.A_ers)
+            if bauteil in self.widgets:
+                self.set_bauteil_param('A', bauteil, self.A_ers)
 
     def set_checkbox_states(self, states):
         """
@@ -494,7 +704,7 @@ class NachgiebigkeitWidget(QWidget):
         
         # Durchlaufe die Liste der booleschen Zustände und die entsprechenden Kontrollkästchen.
         # Verwende die zip-Funktion, um die Schleife auf die kürzere der beiden Listen zu beschränken.
-        for state, key in zip(states, list(self.widgets.keys())):
+        for state, key in zip(states, self.show_bauteile):
             checkbox = self.widgets[key]['check']
             checkbox.setChecked(state)   #Setzt den Zustand der checkbox 
 
@@ -548,8 +758,10 @@ class NachgiebigkeitWidget(QWidget):
         Args:
             param (str): Der Name des Parameters, dessen Wert gesetzt werden soll.
             bauteil (str): Der Name des Bauteils, für das der Wert gesetzt werden soll.
-            value (float or int): Der Wert, der gesetzt werden soll.
+            value (float or int): Der Wert, der gesetzt werden soll. Fehlt das Bauteil im Stapel, geschieht nichts.
         """
+        if bauteil not in self.widgets:
+            return
         widgets = self.widgets[bauteil]
         line_edit = widgets[param][1]
         # Formatieren des Werts mit Komma als Dezimaltrennzeichen
@@ -568,14 +780,64 @@ class NachgiebigkeitWidget(QWidget):
             formatted_value = str(value)  # umgang mit andern Types
         line_edit.setText(formatted_value)
 
+    def set_normmasse(self):
+        """
+        Übernimmt d_k, D_B, m sowie die Ersatzlängen von Kopf und Mutter aus den Normteiltabellen für den aktuellen Durchmesser d.
+        """
+        d = self.get_value("d")
+        geometrie = normteil_geometrie(d, self.schraubenart.currentText(), self.bohrungsreihe.currentText(), self.scheibe.isChecked()) if d else None
+        if geometrie is None:
+            QMessageBox.warning(self, "Normmaße", f"Für d = {d} mm sind keine Normmaße hinterlegt (Regelgewinde M3 bis M48).")
+            return
+        self.set_value("d_k", geometrie["d_k"])
+        self.set_value("D_B", geometrie["D_B"])
+        self.set_value("m", geometrie["m"])
+        self.set_bauteil_param('l', 'Kopf', geometrie["l_K"])
+        self.set_bauteil_param('l', 'Mutter/Verschraubung', geometrie["l_M"])
+        self.calculate()
+
     def set_e_values(self):
         """
         Setzt alle E-Werte auf 210000.
         """
-        for bauteil, elements in self.widgets.items():
-            if 'E' in elements:
-                e_widget = elements['E'][1]  # QLineEdit für E-Wert
-                e_widget.setText("210000")
+        for bauteil in self.widgets:
+            self.set_e_value(bauteil)
+
+    def set_e_value(self, bauteil):
+        """
+        Setzt den E-Wert eines Bauteils auf den E-Modul seines Werkstoffs bei 20 °C (ohne Werkstoff 210000).
+        """
+        e_widget = self.widgets[bauteil]['E'][1]  # QLineEdit für E-Wert
+        werkstoff = self.bauteil_werkstoff(bauteil)
+        if werkstoff is None:
+            e_widget.setText("210000")
+        else:
+            self.set_bauteil_param('E', bauteil, werkstoff_kennwerte(werkstoff)["E"])
+
+    def bauteil_werkstoff(self, bauteil):
+        """
+        Gibt den eingetragenen Werkstoff eines Bauteils zurück oder None, wenn keiner oder ein unbekannter eingetragen ist.
+        """
+        name = self.widgets[bauteil]['werkstoff'].text().strip()
+        if not name:
+            return None
+        try:
+            werkstoff_kennwerte(name)
+        except ValueError:
+            return None
+        return name
+
+    def werkstoff_changed(self, bauteil):
+        """
+        Übernimmt den E-Modul des neuen Werkstoffs und berechnet δ des Bauteils und die Nachgiebigkeiten neu.
+        """
+        if self.widgets[bauteil]['werkstoff'].text().strip() and self.bauteil_werkstoff(bauteil) is None:
+            QMessageBox.warning(self, "Werkstoff", f"Werkstoff '{self.widgets[bauteil]['werkstoff'].text()}' ist nicht bekannt.")
+            return
+        self.set_e_value(bauteil)
+        # δ hängt vom E-Modul ab und wird aus E, A und l neu berechnet
+        self.widgets[bauteil]['δ'][1].clear()
+        self.delta_calc()
 
     def update(self, value, name):
         """
@@ -590,22 +852,35 @@ class NachgiebigkeitWidget(QWidget):
             self.set_bauteil_param('A', 'Kopf', pi * value**2 / 4)  # Assuming you have 'A' as the parameter for area in 'Kopf'
             self.set_bauteil_param('A', 'Schaft', pi * value**2 / 4)
             self.set_bauteil_param('A', 'Mutter/Verschraubung', pi * value**2 / 4)
-            if self.schraubenart.currentText() == "Sechskantschraube":
-                self.set_bauteil_param('l', 'Kopf', value * 0.5)
-            else:
-                self.set_bauteil_param('l', 'Kopf', value * 0.4)
+            self.set_bauteil_param('l', 'Kopf', ersatzlaenge_kopf(value, self.schraubenart.currentText()))
         elif name == "a_s":
             self.set_bauteil_param('A', 'freies Gewinde', value) # Update den Wert von A_ers Gewinde
 
+def read_svg_data(path):
+    """
+    Liest eine SVG-Datei als Bytes ein. Greift nicht auf Widgets zu und kann daher im WorkerPool laufen.
+
+    Args:
+        path (str): Pfad zur SVG-Datei.
+
+    Returns:
+        bytes: Der Inhalt der Datei.
+    """
+    with open(path, 'rb') as file:
+        return file.read()
+
 class SvgWidget(QSvgWidget):
     """
     Widget zum Anzeigen von SVG-Grafiken.
+    Die Grafik wird nicht im Konstruktor gelesen, sondern nach dem Start im Hintergrund
+    (siehe MainWindow.preload_reference_data) und dann mit load_data übernommen.
 
     Args:
         path (str): Pfad zur SVG-Datei.
         parent (QWidget, optional): Das Elternobjekt des Widgets.
 
     Attributes:
+        path (str): Pfad zur SVG-Datei.
         view (QGraphicsView): Grafikansicht für die SVG-Anzeige.
         scene (QGraphicsScene): Szene für die Grafikansicht.
     """
@@ -617,7 +892,8 @@ class SvgWidget(QSvgWidget):
             path (str): Pfad zur SVG-Datei.
             parent (QWidget, optional): Das Elternobjekt des Widgets.
         """
-        QSvgWidget.__init__(self, path, parent)
+        QSvgWidget.__init__(self, parent)
+        self.path = path
 
         self.view = QGraphicsView()
         self.view.setStyleSheet("background: transparent; border: none;")  # Setzt den Hintergrund der Ansicht auf transparent.
@@ -629,4 +905,13 @@ class SvgWidget(QSvgWidget):
         self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
 
         # Setzt die größe des Widgets
-        self.setFixedSize(500, 300)
\ No newline at end of file
+        self.setFixedSize(500, 300)
+
+    def load_data(self, data):
+        """
+        Zeigt die im Hintergrund gelesenen SVG-Daten an.
+
+        Args:
+            data (bytes): Inhalt der SVG-Datei aus read_svg_data.
+        """
+        self.load(QByteArray(data))
\ No newline at end of file
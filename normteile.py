@@ -0,0 +1,124 @@
+# Geometrie genormter Schrauben, Muttern, Durchgangsbohrungen und Scheiben (Regelgewinde, Maße in mm)
+from numpy import array, asarray, clip, interp, nan, searchsorted, where
+
+# Spalten: d, Sechskantschraube ISO 4017 (s, k, d_w), Zylinderschraube mit Innensechskant ISO 4762 (d_k, k),
+#          Mutter ISO 4032 (m), Durchgangsbohrung ISO 273 (fein, mittel, grob), Scheibe ISO 7089 (d_2, h)
+NORMTEILE = [
+    [3,  5.5,  2.0,  4.57,  5.5,  3,  2.4,  3.2,  3.4,  3.6,  7,  0.5],
+    [4,  7,    2.8,  5.88,  7,    4,  3.2,  4.3,  4.5,  4.8,  9,  0.8],
+    [5,  8,    3.5,  6.88,  8.5,  5,  4.7,  5.3,  5.5,  5.8,  10, 1.0],
+    [6,  10,   4.0,  8.88,  10,   6,  5.2,  6.4,  6.6,  7,    12, 1.6],
+    [8,  13,   5.3,  11.63, 13,   8,  6.8,  8.4,  9,    10,   16, 1.6],
+    [10, 16,   6.4,  14.63, 16,   10, 8.4,  10.5, 11,   12,   20, 2.0],
+    [12, 18,   7.5,  16.63, 18,   12, 10.8, 13,   13.5, 14.5, 24, 2.5],
+    [14, 21,   8.8,  19.64, 21,   14, 12.8, 15,   15.5, 16.5, 28, 2.5],
+    [16, 24,   10.0, 22.49, 24,   16, 14.8, 17,   17.5, 18.5, 30, 3.0],
+    [18, 27,   11.5, 25.34, 27,   18, 15.8, 19,   20,   21,   34, 3.0],
+    [20, 30,   12.5, 28.19, 30,   20, 18.0, 21,   22,   24,   37, 3.0],
+    [22, 34,   14.0, 31.71, 33,   22, 19.4, 23,   24,   26,   39, 3.0],
+    [24, 36,   15.0, 33.61, 36,   24, 21.5, 25,   26,   28,   44, 4.0],
+    [27, 41,   17.0, 38.00, 40,   27, 23.8, 28,   30,   32,   50, 4.0],
+    [30, 46,   18.7, 42.75, 45,   30, 25.6, 31,   33,   35,   56, 4.0],
+    [33, 50,   21.0, 46.55, 50,   33, 28.7, 34,   36,   38,   60, 5.0],
+    [36, 55,   22.5, 51.11, 54,   36, 31.0, 37,   39,   42,   66, 5.0],
+    [42, 65,   26.0, 59.95, 63,   42, 34.0, 43,   45,   48,   78, 8.0],
+    [48, 75,   30.0, 69.45, 72,   48, 38.0, 50,   52,   56,   92, 8.0],
+]
+
+SPALTEN = ["d", "s", "k", "d_w", "d_k_isk", "k_isk", "m", "D_B_fein", "D_B_mittel", "D_B_grob", "d_2", "h_S"]
+SCHRAUBENARTEN = ["Sechskantschraube", "Innensechskantschraube"]
+BOHRUNGSREIHEN = ["fein", "mittel", "grob"]
+
+# Spaltenweise Ablage, nach d sortiert (für searchsorted)
+TABELLE = {name: array([row[j] for row in NORMTEILE], dtype=float) for j, name in enumerate(SPALTEN)}
+
+# Ersatzlängen für die Nachgiebigkeit von Kopf und Mutter, bezogen auf d
+L_KOPF = {"Sechskantschraube": 0.5, "Innensechskantschraube": 0.4}
+M_D_STUETZSTELLEN = [0.8, 1.25, 1.5]
+L_M_STUETZSTELLEN = [0.4, 0.5, 0.6]
+
+def normgroesse_index(d):
+    """
+    Sucht die Zeile einer Normgröße (binäre Suche über die sortierten Nenndurchmesser).
+
+    Args:
+        d (array_like): Ein oder mehrere Nenndurchmesser in mm.
+
+    Returns:
+        tuple: (Zeilenindizes, Maske der gefundenen Normgrößen) als Arrays in der Form von d.
+    """
+    d = asarray(d, dtype=float)
+    index = clip(searchsorted(TABELLE["d"], d), 0, len(NORMTEILE) - 1)
+    return index, TABELLE["d"][index] == d
+
+def ersatzlaenge_kopf(d, schraubenart="Sechskantschraube"):
+    """
+    Ersatzlänge des Schraubenkopfs l_K (Sechskantschraube 0,5*d, Innensechskantschraube 0,4*d).
+    """
+    return L_KOPF[schraubenart] * d
+
+def ersatzlaenge_mutter(d, m):
+    """
+    Ersatzlänge der Mutter l_M aus dem Verhältnis m/d (0,8 -> 0,4*d, 1,25 -> 0,5*d, 1,5 -> 0,6*d).
+    Zwischen den Stützstellen wird linear interpoliert, außerhalb der Randwert verwendet.
+
+    Args:
+        d (array_like): Nenndurchmesser.
+        m (array_like): Mutterhöhe.
+
+    Returns:
+        array_like: Die Ersatzlänge l_M.
+    """
+    return interp(asarray(m) / asarray(d), M_D_STUETZSTELLEN, L_M_STUETZSTELLEN) * d
+
+def normteil_arrays(d, schraubenart="Sechskantschraube", reihe="mittel", scheibe=False):
+    """
+    Gibt die Geometrie für viele Nenndurchmesser auf einmal zurück (für Batch-Berechnungen).
+    Nicht genormte Durchmesser ergeben nan.
+
+    Args:
+        d (array_like): Die Nenndurchmesser in mm.
+        schraubenart (str): "Sechskantschraube" oder "Innensechskantschraube".
+        reihe (str): Reihe der Durchgangsbohrung nach ISO 273 ("fein", "mittel" oder "grob").
+        scheibe (bool): True, wenn unter Kopf und Mutter Scheiben nach ISO 7089 liegen. Dann gilt
+            der Scheibenaußendurchmesser als Auflagedurchmesser d_k.
+
+    Returns:
+        dict: "d_k", "D_B", "m", "l_K", "l_M" und "h_S" (Scheibendicke, 0 ohne Scheibe) als Arrays.
+    """
+    d = asarray(d, dtype=float)
+    index, gefunden = normgroesse_index(d)
+    if scheibe:
+        d_k = TABELLE["d_2"][index]
+    elif schraubenart == "Sechskantschraube":
+        d_k = TABELLE["d_w"][index]
+    else:
+        d_k = TABELLE["d_k_isk"][index]
+    m = TABELLE["m"][index]
+    geometrie = {
+        "d_k": d_k,
+        "D_B": TABELLE[f"D_B_{reihe}"][index],
+        "m": m,
+        "l_K": ersatzlaenge_kopf(d, schraubenart),
+        "l_M": ersatzlaenge_mutter(d, m),
+        "h_S": TABELLE["h_S"][index] if scheibe else 0 * d,
+    }
+    return {name: where(gefunden, werte, nan) for name, werte in geometrie.items()}
+
+def normteil_geometrie(d, schraubenart="Sechskantschraube", reihe="mittel", scheibe=False):
+    """
+    Gibt die Geometrie einer Normgröße zurück (siehe normteil_arrays).
+
+    Args:
+        d (float): Der Nenndurchmesser in mm.
+        schraubenart (str): "Sechskantschraube" oder "Innensechskantschraube".
+        reihe (str): Reihe der Durchgangsbohrung ("fein", "mittel" oder "grob").
+        scheibe (bool): True, wenn Scheiben verwendet werden.
+
+    Returns:
+        dict: Die Maße als float oder None, wenn d keine Normgröße ist.
+    """
+    _, gefunden = normgroesse_index(d)
+    if not gefunden:
+        return None
+    return {name: float(wert) for name, wert in normteil_arrays(d, schraubenart, reihe, scheibe).items()}
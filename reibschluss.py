@@ -0,0 +1,100 @@
+# Reibschlüssige Übertragung von Querkräften und Torsionsmomenten: erforderliche Klemmkraft und Rutschsicherheit (NumPy-vektorisiert)
+from numpy import argmin, asarray, errstate, inf, sqrt, where
+
+from schraubenbild import lastverteilung
+
+# Mindest-Rutschsicherheit S_G für ruhende und wechselnde Querbelastung
+S_G_MIN = {"ruhend": 1.2, "wechselnd": 1.8}
+
+def klemmkraft_querkraft(F_Q, my, q_F=1, M_Y=0.0, r_a=inf, q_M=None):
+    """
+    Mindestklemmkraft zur reibschlüssigen Übertragung einer Querkraft F_Q und eines Drehmoments M_Y
+    um die Schraubenachse über q_F bzw. q_M kraftübertragende Trennfugen:
+
+        F_KQerf = F_Q/(q_F*μ_Tmin) + M_Y/(q_M*r_a*μ_Tmin)
+
+    Args:
+        F_Q (array_like): Querkraft je Schraube in N.
+        my (array_like): Kleinste Haftreibungszahl der Trennfuge μ_Tmin.
+        q_F (array_like, optional): Anzahl der querkraftübertragenden Trennfugen.
+        M_Y (array_like, optional): Drehmoment um die Schraubenachse in N*mm.
+        r_a (array_like, optional): Reibradius für M_Y in mm.
+        q_M (array_like, optional): Anzahl der momentübertragenden Trennfugen, Standard q_F.
+
+    Returns:
+        array_like: F_KQerf in N.
+    """
+    q_M = q_F if q_M is None else q_M
+    F_Q, my, q_F, M_Y, r_a, q_M = (asarray(x, dtype=float) for x in (F_Q, my, q_F, M_Y, r_a, q_M))
+    return F_Q / (q_F * my) + M_Y / (q_M * r_a * my)
+
+def rutschsicherheit(F_KR, F_Q, my, q_F=1):
+    """
+    Rutschsicherheit S_G = F_KR*q_F*μ_Tmin/F_Q (inf ohne Querkraft, 0 bei klaffender Trennfuge).
+
+    Returns:
+        array_like: S_G.
+    """
+    F_KR, F_Q, my, q_F = (asarray(x, dtype=float) for x in (F_KR, F_Q, my, q_F))
+    with errstate(divide='ignore', invalid='ignore'):
+        return where(F_Q > 0, where(F_KR > 0, F_KR, 0) * q_F * my / F_Q, inf)
+
+def reibschluss_schraubenbild(x, y, F_KR, my, F_Qx=0.0, F_Qy=0.0, M_t=0.0, q_F=1, q_M=None, S_G_erf=S_G_MIN["ruhend"],
+                              schubsteifigkeit=None):
+    """
+    Reibschlüssige Querkraftübertragung eines Schraubenbilds (z.B. Wellenkupplung auf einem Lochkreis),
+    vektorisiert über die Schrauben und über Lastfälle (Lasten als Arrays gleicher Form).
+
+    Querkraft und Torsionsmoment werden wie in lastverteilung auf die Schrauben verteilt. Der Anteil aus F_Q
+    verteilt sich auf q_F, der aus M_t auf q_M Trennfugen; je Schraube gilt
+
+        F_KQerf,i = |F_Q,i/q_F + F_t,i/q_M|/μ_Tmin,  S_G,i = F_KR,i/F_KQerf,i
+
+    Für die ganze Verbindung (alle Schrauben rutschen gemeinsam) werden die Tragfähigkeiten
+    F_R = Σ F_KR,i*q_F*μ und M_R = Σ F_KR,i*q_M*μ*r_i (r_i: Abstand vom Ursprung) und die lineare Interaktion
+    S_G,ges = 1/(F_Q/F_R + M_t/M_R) ausgewiesen.
+
+    Args:
+        x, y (array_like): Koordinaten der Schrauben in mm.
+        F_KR (array_like): Restklemmkraft je Schraube in N (z.B. aus betriebskraefte).
+        my (array_like): Kleinste Haftreibungszahl der Trennfugen.
+        F_Qx, F_Qy, M_t (array_like, optional): Querkräfte in N und Torsionsmoment in N*mm im Ursprung.
+        q_F (array_like, optional): Anzahl der querkraftübertragenden Trennfugen.
+        q_M (array_like, optional): Anzahl der momentübertragenden Trennfugen, Standard q_F.
+        S_G_erf (float, optional): Geforderte Rutschsicherheit (S_G_MIN).
+        schubsteifigkeit (array_like, optional): Siehe lastverteilung.
+
+    Returns:
+        dict: Je Schraube "F_Q" (Betrag), "F_KQerf" (einschließlich S_G_erf), "S_G"; "massgebend" (Index der Schraube
+            mit der kleinsten Rutschsicherheit), "S_G_min", "F_R", "M_R" und "S_G_ges" je Lastfall.
+    """
+    q_M = q_F if q_M is None else q_M
+    querkraft = lastverteilung(x, y, F_Qx=F_Qx, F_Qy=F_Qy, schubsteifigkeit=schubsteifigkeit)
+    torsion = lastverteilung(x, y, M_t=M_t, schubsteifigkeit=schubsteifigkeit)
+    q_F, q_M, my = (asarray(v, dtype=float) for v in (q_F, q_M, my))
+    F_x = querkraft["F_Qx"] / q_F + torsion["F_Qx"] / q_M
+    F_y = querkraft["F_Qy"] / q_F + torsion["F_Qy"] / q_M
+    je_fuge = sqrt(F_x**2 + F_y**2)
+    F_KQerf = je_fuge / my
+    F_KR = asarray(F_KR, dtype=float) + 0 * F_KQerf
+    with errstate(divide='ignore', invalid='ignore'):
+        S_G = where(F_KQerf > 0, where(F_KR > 0, F_KR, 0) / F_KQerf, inf)
+
+        x, y = asarray(x, dtype=float), asarray(y, dtype=float)
+        tragend = where(F_KR > 0, F_KR, 0) * my
+        F_R = (tragend * q_F).sum(axis=-1)
+        M_R = (tragend * q_M * sqrt(x**2 + y**2)).sum(axis=-1)
+        F_Q = sqrt(asarray(F_Qx, dtype=float)**2 + asarray(F_Qy, dtype=float)**2)
+        ausnutzung = F_Q / F_R + where(M_R > 0, abs(asarray(M_t, dtype=float)) / M_R, where(asarray(M_t) != 0, inf, 0))
+        S_G_ges = where(ausnutzung > 0, 1 / ausnutzung, inf)
+    massgebend = argmin(S_G, axis=-1)
+    return {
+        "F_Q": sqrt((querkraft["F_Qx"] + torsion["F_Qx"])**2 + (querkraft["F_Qy"] + torsion["F_Qy"])**2),
+        "F_KQerf": S_G_erf * F_KQerf,
+        "S_G": S_G,
+        "massgebend": massgebend,
+        "S_G_min": S_G.min(axis=-1),
+        "F_R": F_R,
+        "M_R": M_R,
+        "S_G_ges": S_G_ges,
+    }
@@ -0,0 +1,146 @@
+# Vorspannkraftverlust durch Kriechen/Relaxation der verspannten Teile über der Betriebszeit (adaptive Zeitintegration, NumPy-vektorisiert)
+from numpy import abs as np_abs
+from numpy import (
+    asarray,
+    broadcast_arrays,
+    clip,
+    errstate,
+    full,
+    inf,
+    isfinite,
+    maximum,
+    minimum,
+    where,
+    zeros,
+)
+
+# Schrittweitensteuerung des Bogacki-Shampine-Verfahrens 3(2)
+SICHERHEIT = 0.9
+FAKTOR_MIN, FAKTOR_MAX = 0.2, 5.0
+
+def kriechdehnrate(sigma, eps, B, n, m=1.0):
+    """
+    Kriechdehnrate nach Norton-Bailey in der Dehnungsverfestigungsform. Aus ε = B*σ^n*t^m bei konstanter
+    Spannung folgt
+
+        dε/dt = m*B^(1/m)*σ^(n/m)*ε^((m-1)/m)
+
+    (m = 1: stationäres Kriechen nach Norton, m < 1: Primärkriechen, z.B. Dichtungen und Kunststoffe).
+
+    Args:
+        sigma (array_like): Druckspannung im kriechenden Teil in N/mm².
+        eps (array_like): Bisherige Kriechdehnung.
+        B (array_like): Kriechkoeffizient in 1/(h^m*(N/mm²)^n) bei Betriebstemperatur.
+        n (array_like): Spannungsexponent.
+        m (array_like, optional): Zeitexponent.
+
+    Returns:
+        array_like: dε/dt in 1/h.
+    """
+    sigma, eps, B, n, m = (asarray(x, dtype=float) for x in (sigma, eps, B, n, m))
+    with errstate(divide='ignore', invalid='ignore', over='ignore'):
+        rate = m * B ** (1 / m) * sigma ** (n / m) * eps ** ((m - 1) / m)
+    return where((sigma > 0) & isfinite(rate), rate, 0.0)
+
+def vorspannkraftverlust(F_V0, delta_ges, l_kr, A_kr, B, n, m=1.0, F_PA=0.0, F_Kerf=0.0, t_ende=87600.0,
+                         zeiten=None, rtol=1e-5, atol=1e-12):
+    """
+    Verlauf der Vorspannkraft, wenn die verspannten Teile (z.B. Aluminium, Kunststoff, Dichtungen) auf der
+    Länge l_kr kriechen. Die Kriechverkürzung wirkt wie ein Setzbetrag (F_Z = f_Z/(δ_s + δ_p)):
+
+        F_V(t) = F_V0 - l_kr*ε(t)/(δ_s + δ_p),  σ = (F_V - F_PA)/A_kr,  dε/dt siehe kriechdehnrate
+
+    Integriert wird mit dem eingebetteten Runge-Kutta-Verfahren 3(2) nach Bogacki-Shampine. Jede Verbindung
+    hat ihre eigene Zeit und Schrittweite, alle Verbindungen werden in jedem Schritt gemeinsam als Arrays
+    gerechnet. Der Zeitpunkt, zu dem F_KR = F_V - F_PA die erforderliche Restklemmkraft F_Kerf erreicht,
+    wird im Schritt linear interpoliert, der Verlauf zu den Ausgabezeiten kubisch.
+
+    Args:
+        F_V0 (array_like): Vorspannkraft nach dem Setzen zu Beginn des Betriebs in N.
+        delta_ges (array_like): Nachgiebigkeit δ_s + δ_p in mm/N.
+        l_kr (array_like): Kriechende Länge (Dicke der kriechenden Teile) in mm.
+        A_kr (array_like): Druckbelastete Fläche der kriechenden Teile in mm².
+        B, n, m (array_like): Kriechparameter, siehe kriechdehnrate.
+        F_PA (array_like, optional): Entlastung der verspannten Teile im Betrieb (1-φ)*F_A in N.
+        F_Kerf (array_like, optional): Erforderliche Restklemmkraft in N.
+        t_ende (float, optional): Betrachtete Betriebszeit in h, Standard 10 Jahre.
+        zeiten (array_like, optional): Ausgabezeiten in h für den Verlauf F_V(t).
+        rtol, atol (float, optional): Relative und absolute Toleranz für ε.
+
+    Returns:
+        dict: "t_Kerf" in h (inf, wenn F_Kerf bis t_ende nicht unterschritten wird), "F_V" und "F_KR" bei t_ende,
+            "verlust" in N (höchstens bis F_KR = 0), "schritte" je Verbindung und mit zeiten "F_V_zeiten" der Form
+            (Verbindungen, Zeiten).
+    """
+    F_V0, delta_ges, l_kr, A_kr, B, n, m, F_PA, F_Kerf = broadcast_arrays(
+        *(asarray(x, dtype=float) for x in (F_V0, delta_ges, l_kr, A_kr, B, n, m, F_PA, F_Kerf)))
+    form = F_V0.shape
+    F_V0, delta_ges, l_kr, A_kr, B, n, m, F_PA, F_Kerf = (
+        x.ravel() for x in (F_V0, delta_ges, l_kr, A_kr, B, n, m, F_PA, F_Kerf))
+    anzahl = F_V0.size
+
+    def rate(eps, i):
+        F_V = F_V0[i] - l_kr[i] * eps / delta_ges[i]
+        return kriechdehnrate((F_V - F_PA[i]) / A_kr[i], eps, B[i], n[i], m[i])
+
+    # Kriechdehnung, bei der die Teile spannungsfrei sind (F_V = F_PA); darüber hinaus kriechen sie nicht
+    eps_max = maximum(F_V0 - F_PA, 0) * delta_ges / l_kr
+
+    # Start kurz nach t = 0 mit ε aus der Zeitverfestigungsform (dε/dt ist für m < 1 bei ε = 0 singulär)
+    t0 = 1e-9 * t_ende
+    sigma0 = maximum(F_V0 - F_PA, 0) / A_kr
+    with errstate(over='ignore'):
+        eps = minimum(B * sigma0 ** n * t0 ** m, eps_max)
+    t = full(anzahl, t0)
+    h = full(anzahl, t0)
+    k1 = rate(eps, slice(None))
+    schritte = zeros(anzahl, dtype=int)
+
+    # Kriechdehnung, bei der F_KR = F_Kerf erreicht ist
+    eps_Kerf = (F_V0 - F_PA - F_Kerf) * delta_ges / l_kr
+    t_Kerf = where(eps_Kerf <= eps, 0.0, inf)
+
+    if zeiten is not None:
+        zeiten = asarray(zeiten, dtype=float)
+        eps_zeiten = eps[:, None] + 0 * zeiten
+
+    aktiv = t < t_ende
+    while aktiv.any():
+        i = aktiv.nonzero()[0]
+        h_i = minimum(h[i], t_ende - t[i])
+        y, k1_i = eps[i], k1[i]
+        k2 = rate(y + h_i / 2 * k1_i, i)
+        k3 = rate(y + 3 * h_i / 4 * k2, i)
+        y_neu = minimum(y + h_i * (2 * k1_i + 3 * k2 + 4 * k3) / 9, eps_max[i])
+        k4 = rate(y_neu, i)
+        fehler = np_abs(h_i * (-5 * k1_i / 72 + k2 / 12 + k3 / 9 - k4 / 8)) / (atol + rtol * np_abs(y_neu))
+        angenommen = fehler <= 1
+
+        j = i[angenommen]
+        y_alt, y_neu, h_j = eps[j], y_neu[angenommen], h_i[angenommen]
+        with errstate(divide='ignore', invalid='ignore'):
+            erreicht = ~isfinite(t_Kerf[j]) & (y_neu >= eps_Kerf[j])
+            t_Kerf[j[erreicht]] = (t[j] + h_j * clip((eps_Kerf[j] - y_alt) / (y_neu - y_alt), 0, 1))[erreicht]
+            if zeiten is not None:
+                im_schritt = (zeiten > t[j, None]) & (zeiten <= (t[j] + h_j)[:, None])
+                # Kubische Hermite-Interpolation mit den Steigungen k1 und k4 an den Schrittgrenzen
+                s = (zeiten - t[j, None]) / h_j[:, None]
+                zwischen = ((2 * s**3 - 3 * s**2 + 1) * y_alt[:, None] + (s**3 - 2 * s**2 + s) * (h_j * k1[j])[:, None]
+                            + (3 * s**2 - 2 * s**3) * y_neu[:, None] + (s**3 - s**2) * (h_j * k4[angenommen])[:, None])
+                eps_zeiten[j] = where(im_schritt, minimum(zwischen, eps_max[j, None]), eps_zeiten[j])
+        t[j] += h_j
+        eps[j] = y_neu
+        k1[j] = k4[angenommen]
+        schritte[j] += 1
+
+        with errstate(divide='ignore'):
+            faktor = clip(SICHERHEIT * fehler ** (-1 / 3), FAKTOR_MIN, FAKTOR_MAX)
+        h[i] = h_i * where(fehler > 0, faktor, FAKTOR_MAX)
+        aktiv = t < t_ende * (1 - 1e-12)
+
+    F_V = F_V0 - l_kr * eps / delta_ges
+    ergebnis = {"t_Kerf": t_Kerf.reshape(form), "F_V": F_V.reshape(form), "F_KR": (F_V - F_PA).reshape(form),
+                "verlust": (F_V0 - F_V).reshape(form), "schritte": schritte.reshape(form)}
+    if zeiten is not None:
+        ergebnis["F_V_zeiten"] = (F_V0[:, None] - l_kr[:, None] * eps_zeiten / delta_ges[:, None]).reshape(form + zeiten.shape)
+    return ergebnis
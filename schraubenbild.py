@@ -0,0 +1,164 @@
+# Mehrschraubenverbindungen: Schraubenbilder (Kreisflansch, Rechteck, Koordinaten) und Lastverteilung auf die Schrauben (NumPy-vektorisiert)
+from numpy import (
+    arange,
+    argmax,
+    argmin,
+    asarray,
+    broadcast_to,
+    cos,
+    meshgrid,
+    ones_like,
+    pi,
+    sin,
+    sqrt,
+)
+from numpy.linalg import pinv
+
+from schraubenkraefte import betriebskraefte, festigkeitsnachweis
+
+ANORDNUNGEN = ["Einzelschraube", "Kreisflansch", "Rechteck", "Koordinaten"]
+
+def kreisflansch(n, D_L, winkel=0.0):
+    """
+    Schrauben gleichmäßig auf einem Lochkreis.
+
+    Args:
+        n (int): Anzahl der Schrauben.
+        D_L (float): Lochkreisdurchmesser in mm.
+        winkel (float, optional): Lage der ersten Schraube in Grad, von der x-Achse aus gezählt.
+
+    Returns:
+        tuple: (x, y) der Schraubenmitten in mm.
+    """
+    phi = (winkel + 360 * arange(int(n)) / int(n)) * pi / 180
+    return D_L / 2 * cos(phi), D_L / 2 * sin(phi)
+
+def rechteckbild(n_x, n_y, t_x, t_y):
+    """
+    Rechteckiges Schraubenbild aus n_x Spalten und n_y Reihen, Mitte im Ursprung.
+
+    Args:
+        n_x (int): Schrauben je Reihe.
+        n_y (int): Anzahl der Reihen.
+        t_x (float): Teilung in x-Richtung in mm.
+        t_y (float): Teilung in y-Richtung in mm.
+
+    Returns:
+        tuple: (x, y) der Schraubenmitten in mm, reihenweise.
+    """
+    x, y = meshgrid((arange(int(n_x)) - (int(n_x) - 1) / 2) * t_x, (arange(int(n_y)) - (int(n_y) - 1) / 2) * t_y)
+    return x.ravel(), y.ravel()
+
+def schwerpunkt(x, y, gewicht):
+    """
+    Mit den Steifigkeiten gewichteter Schwerpunkt des Schraubenbilds.
+
+    Returns:
+        tuple: (x_S, y_S) in mm.
+    """
+    return (gewicht * x).sum() / gewicht.sum(), (gewicht * y).sum() / gewicht.sum()
+
+def lastverteilung(x, y, F_A=0.0, M_x=0.0, M_y=0.0, F_Qx=0.0, F_Qy=0.0, M_t=0.0, steifigkeit=None, schubsteifigkeit=None):
+    """
+    Verteilt äußere Lasten auf die Schrauben eines Schraubenbilds unter starren Flanschen.
+
+    Die Schraubenkräfte sind proportional zur Steifigkeit und zur Verschiebung aus Parallelverschiebung und
+    Verdrehung um den gewichteten Schwerpunkt (x_S, y_S):
+
+        F_A,i = k_i*(a + b*u_i + c*v_i) mit u_i = x_i - x_S, v_i = y_i - y_S
+        ΣF_A,i = F_A,  ΣF_A,i*y_i = M_x,  -ΣF_A,i*x_i = M_y
+
+    Querkräfte werden nach der Schubsteifigkeit aufgeteilt, das Torsionsmoment um den Schubschwerpunkt
+    erzeugt Kräfte senkrecht zum Hebelarm r_i mit F_t,i = q_i*r_i*M_t/Σq*r².
+
+    Die Lasten greifen im Ursprung an und dürfen Arrays gleicher Form sein (z.B. Lastfälle), die Ergebnisse
+    haben dann die Form (Lastfälle, Schrauben). Momente um eine Achse, auf der alle Schrauben liegen
+    (z.B. M_x bei einer einzelnen Reihe auf der x-Achse), können nicht übertragen werden und bleiben unberücksichtigt.
+
+    Args:
+        x (array_like): x-Koordinaten der Schrauben in mm.
+        y (array_like): y-Koordinaten der Schrauben in mm.
+        F_A (array_like, optional): Axialkraft in N (Zug positiv).
+        M_x (array_like, optional): Biegemoment um die x-Achse in N*mm (Zug bei y > 0).
+        M_y (array_like, optional): Biegemoment um die y-Achse in N*mm (Zug bei x < 0).
+        F_Qx (array_like, optional): Querkraft in x-Richtung in N.
+        F_Qy (array_like, optional): Querkraft in y-Richtung in N.
+        M_t (array_like, optional): Torsionsmoment um die Schraubenachse in N*mm.
+        steifigkeit (array_like, optional): Axiale Steifigkeiten k_i, z.B. 1/(δ_s + δ_p), Standard gleich.
+        schubsteifigkeit (array_like, optional): Schubsteifigkeiten q_i, Standard gleich.
+
+    Returns:
+        dict: "F_A", "F_Qx", "F_Qy" und "F_Q" (Betrag) je Schraube in N.
+    """
+    x = asarray(x, dtype=float)
+    y = asarray(y, dtype=float)
+    k = ones_like(x) if steifigkeit is None else broadcast_to(asarray(steifigkeit, dtype=float), x.shape)
+    q = ones_like(x) if schubsteifigkeit is None else broadcast_to(asarray(schubsteifigkeit, dtype=float), x.shape)
+    F_A, M_x, M_y, F_Qx, F_Qy, M_t = (asarray(last, dtype=float)[..., None] for last in (F_A, M_x, M_y, F_Qx, F_Qy, M_t))
+
+    # Axialkräfte: Parallelverschiebung und Verkippung um den gewichteten Schwerpunkt
+    x_S, y_S = schwerpunkt(x, y, k)
+    u, v = x - x_S, y - y_S
+    J_inv = pinv([[(k * u * u).sum(), (k * u * v).sum()], [(k * u * v).sum(), (k * v * v).sum()]])
+    S_u = -M_y - F_A * x_S
+    S_v = M_x - F_A * y_S
+    b = J_inv[0, 0] * S_u + J_inv[0, 1] * S_v
+    c = J_inv[1, 0] * S_u + J_inv[1, 1] * S_v
+    F_A_i = k * (F_A / k.sum() + b * u + c * v)
+
+    # Querkräfte: direkter Anteil und Torsion um den Schubschwerpunkt
+    x_Q, y_Q = schwerpunkt(x, y, q)
+    u, v = x - x_Q, y - y_Q
+    J_p = (q * (u**2 + v**2)).sum()
+    M_tS = M_t - x_Q * F_Qy + y_Q * F_Qx
+    t = M_tS / J_p if J_p > 0 else 0 * M_tS
+    F_Qx_i = q * (F_Qx / q.sum() - t * v)
+    F_Qy_i = q * (F_Qy / q.sum() + t * u)
+    return {"F_A": F_A_i, "F_Qx": F_Qx_i, "F_Qy": F_Qy_i, "F_Q": sqrt(F_Qx_i**2 + F_Qy_i**2)}
+
+def schraubenbild_berechnen(x, y, Phi, F_Mmax, A_s, d, F_A=0.0, M_x=0.0, M_y=0.0, F_Qx=0.0, F_Qy=0.0, M_t=0.0,
+                            alpha_A=1.0, F_Z=0.0, lastverhaeltnis=0.0, my=None, R_p02=None, A_p=None, p_Gzul=None,
+                            tau_t=0.0, k_tau=0.5, schlussgewalzt=False, steifigkeit=None, q_F=1):
+    """
+    Verteilt die äußeren Lasten auf die Schrauben und rechnet für alle Schrauben (und Lastfälle) gleichzeitig
+    die Kräfte- und Festigkeitskette der Einzelschraube (betriebskraefte, festigkeitsnachweis).
+
+    Die Schraubenkennwerte (Phi, F_Mmax, A_s, d, ...) gelten für alle Schrauben oder werden je Schraube als
+    Array übergeben. Die dynamische Belastung schwingt zwischen F_Au = lastverhaeltnis*F_Ao und F_Ao.
+
+    Args:
+        x (array_like): x-Koordinaten der Schrauben in mm.
+        y (array_like): y-Koordinaten der Schrauben in mm.
+        Phi (array_like): Verspannungsfaktor φ.
+        F_Mmax (array_like): Maximale Montagevorspannkraft in N.
+        A_s (array_like): Spannungsquerschnitt in mm².
+        d (array_like): Nenndurchmesser in mm.
+        F_A, M_x, M_y, F_Qx, F_Qy, M_t (array_like, optional): Äußere Lasten wie in lastverteilung.
+        alpha_A (array_like, optional): Anziehfaktor α_A.
+        F_Z (array_like, optional): Setzkraft in N.
+        lastverhaeltnis (float, optional): Verhältnis F_Au/F_Ao, Standard 0 (schwellend).
+        my (array_like, optional): Reibwert der Trennfuge (für F_KQerf).
+        R_p02, A_p, p_Gzul, tau_t, k_tau, schlussgewalzt: Siehe festigkeitsnachweis.
+        steifigkeit (array_like, optional): Axiale Steifigkeiten der Schrauben, Standard 1/(δ_s + δ_p) gleich.
+        q_F (array_like, optional): Anzahl der querkraftübertragenden Trennfugen (für F_KQerf).
+
+    Returns:
+        dict: Alle Größen aus lastverteilung, betriebskraefte und festigkeitsnachweis mit der Form (..., Schrauben)
+            sowie "massgebend" mit den Indizes der maßgebenden Schraube je Kriterium
+            ("F_Smax", "sigma_a" und "p" größter Wert, "F_KR" kleinster Wert bzw. kleinste Reserve F_KR - F_KQerf).
+    """
+    lasten = lastverteilung(x, y, F_A, M_x, M_y, F_Qx, F_Qy, M_t, steifigkeit)
+    kraefte = betriebskraefte(Phi, F_Mmax, lasten["F_A"], alpha_A, F_Z, lastverhaeltnis * lasten["F_A"], lasten["F_Q"], my, q_F)
+    festigkeit = festigkeitsnachweis(kraefte["F_Smax"], kraefte["F_SAa"], kraefte["F_Sm"], A_s, d, R_p02, A_p, p_Gzul,
+                                     tau_t, k_tau, schlussgewalzt)
+    ergebnis = {**lasten, **kraefte, **festigkeit}
+
+    reserve = kraefte["F_KR"] - kraefte["F_KQerf"] if "F_KQerf" in kraefte else kraefte["F_KR"]
+    ergebnis["massgebend"] = {
+        "F_Smax": argmax(kraefte["F_Smax"], axis=-1),
+        "F_KR": argmin(reserve, axis=-1),
+        "sigma_a": argmax(festigkeit["sigma_a"], axis=-1),
+    }
+    if "p" in festigkeit:
+        ergebnis["massgebend"]["p"] = argmax(festigkeit["p"], axis=-1)
+    return ergebnis
@@ -0,0 +1,104 @@
+# Kräfte- und Festigkeitskette der Einzelschraube (KraefteWidget/DauerfestigkeitWidget), NumPy-vektorisiert über beliebig viele Schrauben
+from numpy import abs as np_abs
+from numpy import asarray, errstate, nan, pi, sqrt, where
+
+
+def betriebskraefte(Phi, F_Mmax, F_A, alpha_A=1.0, F_Z=0.0, F_Au=None, F_Q=0.0, my=None, q_F=1):
+    """
+    Schraubenkräfte aus Montagevorspannkraft und Betriebskraft für viele Schrauben in einem Aufruf
+    (alle Argumente dürfen Arrays sein, z.B. eine Spalte je Schraube eines Schraubenbilds):
+
+        F_Mmin = F_Mmax/α_A (3.23),  F_V = F_Mmin - F_Z (Bild 3.27)
+        F_SA = φ*F_A,  F_PA = F_A - F_SA,  F_Smax = F_Mmax + F_SA (Bild 3.27)
+        F_KR = F_Mmin - F_Z - (1-φ)*F_A (kleinste Restklemmkraft, wie F_Kerf in Bild 3.27)
+        F_SAa = φ*(F_Ao - F_Au)/2 (3.37),  F_Sm = F_V + φ*(F_Ao + F_Au)/2 (3.36)
+
+    Args:
+        Phi (array_like): Verspannungsfaktor φ (bzw. φ_n).
+        F_Mmax (array_like): Maximale Montagevorspannkraft in N.
+        F_A (array_like): Axiale Betriebskraft je Schraube in N (Obergrenze F_Ao der dynamischen Belastung).
+        alpha_A (array_like, optional): Anziehfaktor α_A.
+        F_Z (array_like, optional): Setzkraft in N.
+        F_Au (array_like, optional): Untergrenze der Betriebskraft in N, Standard 0 (schwellende Belastung).
+        F_Q (array_like, optional): Querkraft je Schraube in N.
+        my (array_like, optional): Reibwert der Trennfuge für die zur Übertragung von F_Q erforderliche Klemmkraft.
+        q_F (array_like, optional): Anzahl der querkraftübertragenden Trennfugen.
+
+    Returns:
+        dict: "F_Mmin", "F_V", "F_SA", "F_PA", "F_Smax", "F_KR", "F_SAa", "F_Sm" in N und, mit my, "F_KQerf" = F_Q/(q_F*μ).
+    """
+    Phi, F_Mmax, F_A, alpha_A, F_Z = (asarray(x, dtype=float) for x in (Phi, F_Mmax, F_A, alpha_A, F_Z))
+    F_Au = 0 * F_A if F_Au is None else asarray(F_Au, dtype=float)
+    F_Mmin = F_Mmax / alpha_A
+    F_V = F_Mmin - F_Z
+    F_SA = Phi * F_A
+    ergebnis = {
+        "F_Mmin": F_Mmin,
+        "F_V": F_V,
+        "F_SA": F_SA,
+        "F_PA": F_A - F_SA,
+        "F_Smax": F_Mmax + F_SA,
+        "F_KR": F_V - (1 - Phi) * F_A,
+        "F_SAa": Phi * (F_A - F_Au) / 2,
+        "F_Sm": F_V + Phi * (F_A + F_Au) / 2,
+    }
+    if my is not None:
+        ergebnis["F_KQerf"] = asarray(F_Q, dtype=float) / (asarray(q_F, dtype=float) * asarray(my, dtype=float))
+    return ergebnis
+
+def festigkeitsnachweis(F_Smax, F_SAa, F_Sm, A_s, d, R_p02=None, A_p=None, p_Gzul=None, tau_t=0.0, k_tau=0.5,
+                        schlussgewalzt=False, A_0=None):
+    """
+    Statischer und dynamischer Nachweis sowie Flächenpressung für viele Schrauben in einem Aufruf:
+
+        σ_z = F_Smax/A_s (3.48),  σ_vs = sqrt(σ_z² + 3*(k_τ*τ_t)²) (3.47)
+        σ_a = |F_SAa|/A_s (3.50),  σ_ASV = 0,85*(150/d + 45) (3.51)
+        σ_ASG = (2 - F_Sm/F_02min)*σ_ASV mit F_02min = R_p0,2*A_0 (3.52)
+        p = F_Smax/A_p (3.55)
+
+    Args:
+        F_Smax (array_like): Maximale Schraubenkraft in N.
+        F_SAa (array_like): Schraubenausschlagskraft in N.
+        F_Sm (array_like): Mittlere Schraubenkraft in N (nur für schlussgewalzte Schrauben).
+        A_s (array_like): Spannungsquerschnitt in mm².
+        d (array_like): Nenndurchmesser in mm.
+        R_p02 (array_like, optional): Dehngrenze in N/mm².
+        A_p (array_like, optional): Auflagefläche in mm².
+        p_Gzul (array_like, optional): Zulässige Grenzflächenpressung in N/mm².
+        tau_t (array_like, optional): Torsionsspannung aus dem Anziehen in N/mm².
+        k_tau (array_like, optional): Reduktionskoeffizient k_τ, Standard 0,5.
+        schlussgewalzt (bool, optional): True für schlussgewalzte/gerollte Schrauben (SG).
+        A_0 (array_like, optional): Maßgebender Querschnitt für F_02min (Taillenschrauben), Standard A_s.
+
+    Returns:
+        dict: "sigma_z", "sigma_vs", "sigma_a", "sigma_A", "S_D" = σ_A/σ_a und, soweit die Eingaben vorliegen,
+            "p" und "S_p" = p_Gzul/p. Mit R_p02 zusätzlich "S_F" = R_p0,2/σ_vs.
+    """
+    F_Smax, F_SAa, A_s, d = (asarray(x, dtype=float) for x in (F_Smax, F_SAa, A_s, d))
+    sigma_z = F_Smax / A_s
+    sigma_a = np_abs(F_SAa) / A_s
+    sigma_A = 0.85 * (150 / d + 45)
+    if schlussgewalzt and R_p02 is not None:
+        F_02min = asarray(R_p02, dtype=float) * (A_s if A_0 is None else asarray(A_0, dtype=float))
+        sigma_A = (2 - asarray(F_Sm, dtype=float) / F_02min) * sigma_A
+    sigma_A = sigma_A + 0 * sigma_a  # gleiche Form wie σ_a, auch wenn σ_A nur von d abhängt
+    sigma_vs = sqrt(sigma_z**2 + 3 * (asarray(k_tau) * asarray(tau_t))**2)
+    with errstate(divide='ignore', invalid='ignore'):
+        ergebnis = {"sigma_z": sigma_z, "sigma_vs": sigma_vs, "sigma_a": sigma_a, "sigma_A": sigma_A,
+                    "S_D": where(sigma_a > 0, sigma_A / sigma_a, nan)}
+        if R_p02 is not None:
+            ergebnis["S_F"] = asarray(R_p02, dtype=float) / sigma_vs
+        if A_p is not None:
+            ergebnis["p"] = F_Smax / asarray(A_p, dtype=float)
+            if p_Gzul is not None:
+                ergebnis["S_p"] = asarray(p_Gzul, dtype=float) / ergebnis["p"]
+    return ergebnis
+
+def auflageflaeche(d_k, D_B):
+    """
+    Auflagefläche A_p = π*(d_k² - D_B²)/4.
+
+    Returns:
+        array_like: A_p in mm².
+    """
+    return pi * (asarray(d_k) ** 2 - asarray(D_B) ** 2) / 4
@@ -0,0 +1,80 @@
+# Setzbeträge f_Z für Gewinde, Kopf-/Mutterauflagen und innere Trennfugen (Tabelle, NumPy-vektorisiert)
+from numpy import (
+    array,
+    asarray,
+    broadcast_arrays,
+    clip,
+    interp,
+    isfinite,
+    log,
+    searchsorted,
+    stack,
+    where,
+)
+
+BELASTUNGEN = ["Zug/Druck", "Schub"]
+TRENNSTELLEN = ["Gewinde", "Kopf-/Mutterauflage", "innere Trennfuge"]
+
+# Obergrenzen der Rautiefenbereiche R_z in µm (R_z < 10, 10 ≤ R_z < 40, 40 ≤ R_z < 160)
+RAUTIEFE_GRENZEN = array([10.0, 40.0, 160.0])
+# Stützstellen für die Interpolation über R_z (geometrische Bereichsmitten)
+RAUTIEFE_STUETZSTELLEN = array([5.0, 20.0, 80.0])
+
+# Setzbeträge in µm je Trennstelle: Tabelle[Belastung][Rautiefenbereich] = [Gewinde, Kopf-/Mutterauflage, innere Trennfuge]
+SETZTABELLEN = {
+    "Stahl": {
+        "Zug/Druck": array([[3, 2.5, 1.5], [3, 3, 2], [3, 4, 3]], dtype=float),
+        "Schub": array([[3, 3, 2], [3, 4.5, 2.5], [3, 6.5, 3.5]], dtype=float),
+    },
+}
+
+def setztabelle_registrieren(werkstoff, zug_druck, schub):
+    """
+    Hinterlegt eigene Setzbeträge für einen Werkstoff (z.B. aus Versuchen für Aluminium-Trennfugen).
+
+    Args:
+        werkstoff (str): Name, unter dem die Tabelle in setzbetrag ausgewählt wird.
+        zug_druck (array_like): 3x3 Setzbeträge in µm für Zug/Druck, Zeilen wie RAUTIEFE_GRENZEN, Spalten wie TRENNSTELLEN.
+        schub (array_like): 3x3 Setzbeträge in µm für Schub.
+
+    Raises:
+        ValueError: Wenn eine Tabelle nicht die Form 3x3 hat.
+    """
+    tabelle = {"Zug/Druck": asarray(zug_druck, dtype=float), "Schub": asarray(schub, dtype=float)}
+    if any(werte.shape != (len(RAUTIEFE_GRENZEN), len(TRENNSTELLEN)) for werte in tabelle.values()):
+        raise ValueError("Setztabellen müssen je Belastung 3x3 Werte haben (Rautiefenbereiche x Trennstellen)")
+    SETZTABELLEN[werkstoff] = tabelle
+
+def setzbetrag(R_z, gewinde, kopf_mutterauflagen, trennfugen, belastung="Zug/Druck", werkstoff="Stahl", interpolieren=False):
+    """
+    Setzbetrag f_Z = Σ f_ZF über alle Trennstellen einer oder vieler Verbindungen (alle Argumente dürfen Arrays sein).
+
+    Args:
+        R_z (array_like): Gemittelte Rautiefe in µm.
+        gewinde (array_like): Anzahl Gewinde.
+        kopf_mutterauflagen (array_like): Anzahl Kopf- oder Mutterauflagen.
+        trennfugen (array_like): Anzahl innerer Trennfugen.
+        belastung (str oder array_like, optional): "Zug/Druck" oder "Schub", auch je Verbindung.
+        werkstoff (str, optional): Schlüssel in SETZTABELLEN.
+        interpolieren (bool, optional): True: zwischen den Bereichsmitten logarithmisch über R_z interpolieren
+            statt der Stufen der Tabelle.
+
+    Returns:
+        tuple: (f_Z in µm, Maske der gültigen Eingaben). Für R_z außerhalb 0 ≤ R_z < 160 µm ist f_Z nan.
+    """
+    tabelle = SETZTABELLEN[werkstoff]
+    R_z, gewinde, kopf_mutterauflagen, trennfugen = broadcast_arrays(*(asarray(x, dtype=float) for x in (R_z, gewinde, kopf_mutterauflagen, trennfugen)))
+    bereich = searchsorted(RAUTIEFE_GRENZEN, R_z, side='right')
+    gueltig = isfinite(R_z) & (R_z >= 0) & (bereich < len(RAUTIEFE_GRENZEN))
+    schub = asarray(belastung) == "Schub"
+
+    if interpolieren:
+        x = log(clip(R_z, RAUTIEFE_STUETZSTELLEN[0], RAUTIEFE_STUETZSTELLEN[-1]))
+        werte = {name: stack([interp(x, log(RAUTIEFE_STUETZSTELLEN), spalte) for spalte in werte_belastung.T], axis=-1)
+                 for name, werte_belastung in tabelle.items()}
+    else:
+        index = clip(bereich, 0, len(RAUTIEFE_GRENZEN) - 1)
+        werte = {name: werte_belastung[index] for name, werte_belastung in tabelle.items()}
+    f_ZF = where(schub[..., None], werte["Schub"], werte["Zug/Druck"])
+    f_Z = f_ZF[..., 0] * gewinde + f_ZF[..., 1] * kopf_mutterauflagen + f_ZF[..., 2] * trennfugen
+    return where(gueltig, f_Z, float('nan')), gueltig
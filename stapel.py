@@ -0,0 +1,139 @@
+# Stapel aus Schraubenabschnitten und verspannten Teilen mit Nachgiebigkeiten in NumPy-Arrays
+from numpy import append, array, asarray, delete, isnan, nan, nansum, zeros
+
+
+class Bauteilstapel:
+    """
+    Beliebig viele Schraubenabschnitte (Kopf, Schaft, Gewinde, Mutter, ...) und verspannte Teile
+    (Deckel, Gehäuse, Scheiben, Dichtungen, Hülsen, ...) mit je E, A, l und δ = l/(E*A).
+    Fehlende Werte sind nan. Die Reihenfolge entspricht der Anzeige: erst alle Schraubenabschnitte, dann die Zwischenlagen.
+
+    Attributes:
+        namen (list): Die Namen der Abschnitte.
+        schraube (ndarray): Maske der Schraubenabschnitte (True) bzw. Zwischenlagen (False).
+        zugerechnet (ndarray): Maske der Abschnitte, die bei Krafteinleitung im Bauteil der Schraube zugerechnet werden (δ_sn).
+        E (ndarray): E-Moduln in N/mm².
+        A (ndarray): Querschnitte in mm².
+        l (ndarray): Längen in mm.
+        delta (ndarray): Nachgiebigkeiten in mm/N.
+    """
+    PARAMETER = ("E", "A", "l", "delta")
+
+    def __init__(self):
+        self.namen = []
+        self.schraube = zeros(0, dtype=bool)
+        self.zugerechnet = zeros(0, dtype=bool)
+        self.E = zeros(0)
+        self.A = zeros(0)
+        self.l = zeros(0)
+        self.delta = zeros(0)
+
+    def __len__(self):
+        return len(self.namen)
+
+    def add(self, name, schraube, E=nan, A=nan, l=nan, delta=nan):
+        """
+        Fügt einen Abschnitt am Ende seiner Gruppe ein (Schraubenabschnitte vor den Zwischenlagen).
+
+        Args:
+            name (str): Eindeutiger Name des Abschnitts.
+            schraube (bool): True für Schraubenabschnitte, False für Zwischenlagen.
+
+        Returns:
+            int: Die Position des neuen Abschnitts.
+        """
+        if name in self.namen:
+            raise ValueError(f"Abschnitt '{name}' ist bereits vorhanden")
+        i = int(self.schraube.sum()) if schraube else len(self.namen)
+        self.namen.insert(i, name)
+        self.schraube = self._insert(self.schraube, i, schraube)
+        self.zugerechnet = self._insert(self.zugerechnet, i, False)
+        for param, value in zip(self.PARAMETER, (E, A, l, delta)):
+            setattr(self, param, self._insert(getattr(self, param), i, value))
+        return i
+
+    @staticmethod
+    def _insert(values, i, value):
+        return append(values[:i], append(asarray([value], dtype=values.dtype), values[i:]))
+
+    def remove(self, name):
+        """
+        Entfernt einen Abschnitt.
+        """
+        i = self.namen.index(name)
+        del self.namen[i]
+        for attr in ("schraube", "zugerechnet", *self.PARAMETER):
+            setattr(self, attr, delete(getattr(self, attr), i))
+
+    def index(self, name):
+        """
+        Gibt die Position eines Abschnitts zurück.
+        """
+        return self.namen.index(name)
+
+    def set_values(self, param, values):
+        """
+        Setzt eine ganze Spalte (z.B. aus den Eingabefeldern eingelesen).
+
+        Args:
+            param (str): "E", "A", "l" oder "delta".
+            values (array_like): Ein Wert je Abschnitt, nan für leere Felder.
+        """
+        setattr(self, param, array(values, dtype=float))
+
+    def complete(self):
+        """
+        Ergänzt je Abschnitt den einen fehlenden Wert aus δ = l/(E*A), wenn die drei anderen bekannt sind.
+
+        Returns:
+            dict: Je Parameter die Maske der neu berechneten Werte.
+        """
+        fehlt = {param: isnan(getattr(self, param)) for param in self.PARAMETER}
+        anzahl = sum(fehlt.values())
+        neu = {param: fehlt[param] & (anzahl == 1) for param in self.PARAMETER}
+        E, A, l, delta = self.E, self.A, self.l, self.delta
+        self.delta = self.delta.copy()
+        self.A = self.A.copy()
+        self.E = self.E.copy()
+        self.l = self.l.copy()
+        self.delta[neu["delta"]] = (l / (E * A))[neu["delta"]]
+        self.A[neu["A"]] = (l / (E * delta))[neu["A"]]
+        self.E[neu["E"]] = (l / (A * delta))[neu["E"]]
+        self.l[neu["l"]] = (E * delta * A)[neu["l"]]
+        return neu
+
+    def delta_s(self):
+        """
+        Nachgiebigkeit der Schraube als Summe über alle Schraubenabschnitte, oder None, solange ein Abschnitt fehlt.
+        """
+        werte = self.delta[self.schraube]
+        if len(werte) == 0 or isnan(werte).any():
+            return None
+        return float(werte.sum())
+
+    def delta_p(self):
+        """
+        Nachgiebigkeit der Zwischenlage als Summe über alle bekannten Zwischenlagen, oder None, wenn keine bekannt ist.
+        """
+        werte = self.delta[~self.schraube]
+        if isnan(werte).all():
+            return None
+        return float(nansum(werte))
+
+    def delta_n(self, delta_s=None):
+        """
+        Der Schraube bzw. der Zwischenlage zugerechnete Nachgiebigkeit bei Krafteinleitung innerhalb der verspannten Teile.
+
+        Args:
+            delta_s (float, optional): Vorgegebenes δ_s; wird verwendet, wenn alle Schraubenabschnitte zugerechnet sind.
+
+        Returns:
+            tuple: (delta_sn, delta_pn)
+        """
+        bekannt = ~isnan(self.delta)
+        maske_sn = self.zugerechnet & bekannt
+        maske_pn = ~self.zugerechnet & bekannt
+        if delta_s is not None and self.schraube.any() and self.zugerechnet[self.schraube].all():
+            maske_sn = maske_sn & ~self.schraube
+            return delta_s + float(self.delta[maske_sn].sum()), float(self.delta[maske_pn].sum())
+        return float(self.delta[maske_sn].sum()), float(self.delta[maske_pn].sum())
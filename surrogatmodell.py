@@ -0,0 +1,245 @@
+# Surrogatmodell für die Nachgiebigkeit der Zwischenlage: Stützstellenplan, Interpolation, Fehlerschranken und Ablage auf der Festplatte
+import hashlib
+import inspect
+import os
+from functools import lru_cache
+
+from numpy import abs as np_abs
+from numpy import (
+    array,
+    array_equal,
+    asarray,
+    broadcast_arrays,
+    clip,
+    exp,
+    geomspace,
+    inf,
+    isfinite,
+    linspace,
+    load,
+    log,
+    meshgrid,
+    savez,
+    searchsorted,
+    sqrt,
+    stack,
+    where,
+    zeros,
+)
+from numpy.random import default_rng
+
+from fe_zwischenlage import fe_nachgiebigkeit
+from verformungskegel import nachgiebigkeit_kegel
+
+# Dimensionslose Stützstellen: x_1 = D_B/d_k, x_2 = d_k/D_A (0 = unendlich ausgedehnt), x_3 = l/d_k
+STUETZSTELLEN = (
+    linspace(0.45, 0.9, 7),
+    array([0.0, 0.15, 0.3, 0.45, 0.6, 0.75, 0.9, 1.0]),
+    geomspace(0.1, 5.0, 12),
+)
+# Standardablage der berechneten Surrogatmodelle
+VERZEICHNIS = os.path.join("stor", "cache")
+
+def _kegel(d_k, D_B, D_A, l, verbindungsart, nu):
+    return nachgiebigkeit_kegel(asarray(l)[..., None], 1.0, d_k, D_B, D_A, verbindungsart)["delta_p"]
+
+def _fe(d_k, D_B, D_A, l, verbindungsart, nu):
+    d_k, D_B, D_A, l = broadcast_arrays(d_k, D_B, D_A, l)
+    werte = [fe_nachgiebigkeit(a, b, c, [h], [1.0], nu, verbindungsart)["delta_p"]
+             for a, b, c, h in zip(d_k.ravel(), D_B.ravel(), D_A.ravel(), l.ravel())]
+    return asarray(werte).reshape(l.shape)
+
+# Detailmodelle: δ_p*E für eine homogene Zwischenlage (E = 1), vektorisiert über d_k, D_B, D_A und l
+MODELLE = {"Verformungskegel": _kegel, "FE": _fe}
+
+def _modellversion():
+    """
+    Prüfsumme über den Quelltext der Detailmodelle (Verformungskegel, FE-Netz und -Elemente) und dieses Moduls.
+    Jede Änderung daran macht die auf der Festplatte abgelegten Surrogatmodelle ungültig.
+    """
+    pruefsumme = hashlib.sha256()
+    for funktion in (nachgiebigkeit_kegel, fe_nachgiebigkeit, _modellversion):
+        try:
+            with open(inspect.getsourcefile(funktion), "rb") as datei:
+                pruefsumme.update(datei.read())
+        except (OSError, TypeError):
+            # ohne Quelltext (z.B. gepackte Anwendung) den Bytecode verwenden
+            pruefsumme.update(funktion.__code__.co_code)
+    return pruefsumme.hexdigest()
+
+# Version der Detailmodelle, mit der die .npz-Dateien gespeichert und beim Laden verglichen werden
+MODELLVERSION = _modellversion()
+
+def _koordinaten(d_k, D_B, D_A, l):
+    """
+    Dimensionslose Koordinaten (x_1, x_2, log x_3) einer Geometrie.
+    """
+    d_k, D_B, D_A, l = broadcast_arrays(*(asarray(x, dtype=float) for x in (d_k, D_B, D_A, l)))
+    return stack([D_B / d_k, d_k / D_A, log(l / d_k)], axis=-1)
+
+def _interpolieren(gitter, werte, punkte):
+    """
+    Multilineare Interpolation auf einem regelmäßigen Gitter, vektorisiert über beliebig viele Punkte.
+    Punkte außerhalb werden auf den Rand des Gitters gesetzt.
+
+    Returns:
+        tuple: (interpolierte Werte, Maske der Punkte außerhalb des Gitters)
+    """
+    ausserhalb = zeros(punkte.shape[:-1], dtype=bool)
+    indizes, anteile = [], []
+    for achse, g in enumerate(gitter):
+        x = punkte[..., achse]
+        ausserhalb |= (x < g[0] - 1e-12) | (x > g[-1] + 1e-12)
+        x = clip(x, g[0], g[-1])
+        i = clip(searchsorted(g, x) - 1, 0, len(g) - 2)
+        indizes.append(i)
+        anteile.append((x - g[i]) / (g[i + 1] - g[i]))
+    ergebnis = 0.0
+    for ecke in range(2 ** len(gitter)):
+        gewicht = 1.0
+        index = []
+        for achse in range(len(gitter)):
+            oben = (ecke >> achse) & 1
+            gewicht = gewicht * (anteile[achse] if oben else 1 - anteile[achse])
+            index.append(indizes[achse] + oben)
+        ergebnis = ergebnis + gewicht * werte[tuple(index)]
+    return ergebnis, ausserhalb
+
+class Surrogatmodell:
+    """
+    Schnelles Ersatzmodell für δ_p einer homogenen Zwischenlage (Ring D_B..D_A der Dicke l unter der Auflage d_k).
+
+    Das Detailmodell wird auf einem dimensionslosen Stützstellenplan (D_B/d_k, d_k/D_A, l/d_k) ausgewertet.
+    Da δ_p*E*d_k nur von diesen Verhältnissen abhängt, genügt ein dreidimensionales Gitter; interpoliert wird
+    log(δ_p*E*d_k) multilinear. Die Fehlerschranken stammen aus zufälligen Prüfpunkten, an denen das
+    Detailmodell direkt gerechnet wird.
+
+    Attributes:
+        modell (str): "Verformungskegel" oder "FE".
+        verbindungsart (str): "Durchsteckverbindung" oder "Einschraubverbindung".
+        nu (float): Querkontraktionszahl (nur FE).
+        gitter (tuple): Die Stützstellen je Koordinate (x_3 logarithmisch).
+        werte (ndarray): log(δ_p*E*d_k) an den Stützstellen.
+        fehler_max (float): Größte relative Abweichung an den Prüfpunkten.
+        fehler_rms (float): Mittlere quadratische relative Abweichung an den Prüfpunkten.
+    """
+    def __init__(self, modell="Verformungskegel", verbindungsart="Durchsteckverbindung", nu=0.3, stuetzstellen=STUETZSTELLEN):
+        self.modell = modell
+        self.verbindungsart = verbindungsart
+        self.nu = nu
+        self.gitter = (asarray(stuetzstellen[0], dtype=float), asarray(stuetzstellen[1], dtype=float), log(stuetzstellen[2]))
+        self.werte = None
+        self.fehler_max = None
+        self.fehler_rms = None
+
+    def _detail(self, x_1, x_2, x_3):
+        """
+        Wertet das Detailmodell an dimensionslosen Punkten aus (d_k = 10 mm, E = 1) und gibt log(δ_p*E*d_k) zurück.
+        """
+        d_k = 10.0
+        x_2 = asarray(x_2)
+        D_A = where(x_2 > 0, d_k / where(x_2 > 0, x_2, 1.0), inf)
+        delta = MODELLE[self.modell](d_k, asarray(x_1) * d_k, D_A, asarray(x_3) * d_k, self.verbindungsart, self.nu)
+        return log(asarray(delta) * d_k)
+
+    def erstellen(self, pruefpunkte=50, seed=0):
+        """
+        Rechnet das Detailmodell auf allen Stützstellen und an zufälligen Prüfpunkten und bestimmt die Fehlerschranken.
+
+        Args:
+            pruefpunkte (int, optional): Anzahl der Prüfpunkte.
+            seed (int, optional): Startwert des Zufallsgenerators (reproduzierbare Prüfpunkte).
+
+        Returns:
+            Surrogatmodell: self.
+        """
+        x_1, x_2, x_3 = meshgrid(*self.gitter, indexing='ij')
+        self.werte = self._detail(x_1, x_2, exp(x_3))
+
+        zufall = default_rng(seed)
+        punkte = stack([zufall.uniform(g[0], g[-1], pruefpunkte) for g in self.gitter], axis=-1)
+        exakt = exp(self._detail(punkte[:, 0], punkte[:, 1], exp(punkte[:, 2])))
+        naeherung = exp(_interpolieren(self.gitter, self.werte, punkte)[0])
+        abweichung = np_abs(naeherung / exakt - 1)
+        self.fehler_max = float(abweichung.max())
+        self.fehler_rms = float(sqrt((abweichung**2).mean()))
+        return self
+
+    def auswerten(self, d_k, D_B, D_A, l, E):
+        """
+        Nachgiebigkeit vieler Geometrien in einem Aufruf (alle Argumente dürfen Arrays sein).
+
+        Args:
+            d_k (array_like): Außendurchmesser der Auflage in mm.
+            D_B (array_like): Bohrungsdurchmesser in mm.
+            D_A (array_like): Außendurchmesser der Zwischenlage in mm (inf für unendlich ausgedehnt).
+            l (array_like): Dicke der Zwischenlage in mm.
+            E (array_like): E-Modul in N/mm².
+
+        Returns:
+            dict: "delta_p" in mm/N und "extrapoliert" (Maske der Geometrien außerhalb des Stützstellenplans,
+                dort gilt der Randwert und keine Fehlerschranke).
+        """
+        punkte = _koordinaten(d_k, D_B, D_A, l)
+        werte, ausserhalb = _interpolieren(self.gitter, self.werte, punkte)
+        return {"delta_p": exp(werte) / (asarray(E) * asarray(d_k)), "extrapoliert": ausserhalb | ~isfinite(punkte).all(axis=-1)}
+
+    def delta_p(self, d_k, D_B, D_A, l, E):
+        """
+        Nachgiebigkeit der Zwischenlage in mm/N (siehe auswerten).
+        """
+        return self.auswerten(d_k, D_B, D_A, l, E)["delta_p"]
+
+    def speichern(self, pfad):
+        """
+        Speichert Stützstellen, Werte und Fehlerschranken als .npz-Datei.
+        """
+        verzeichnis = os.path.dirname(pfad)
+        if verzeichnis:
+            os.makedirs(verzeichnis, exist_ok=True)
+        savez(pfad, x_1=self.gitter[0], x_2=self.gitter[1], x_3=self.gitter[2], werte=self.werte,
+              fehler=array([self.fehler_max, self.fehler_rms]), nu=self.nu, version=MODELLVERSION)
+
+    def laden(self, pfad):
+        """
+        Lädt ein gespeichertes Surrogatmodell, wenn es zu den Stützstellen, ν und der Version der Detailmodelle
+        (MODELLVERSION) passt. Veraltete Dateien werden verworfen und neu berechnet.
+
+        Returns:
+            bool: True, wenn die Datei verwendet wurde.
+        """
+        if not os.path.exists(pfad):
+            return False
+        with load(pfad) as daten:
+            if "version" not in daten.files or str(daten["version"]) != MODELLVERSION:
+                return False
+            gitter = (daten["x_1"], daten["x_2"], daten["x_3"])
+            if not all(array_equal(a, b) for a, b in zip(gitter, self.gitter)) or float(daten["nu"]) != self.nu:
+                return False
+            self.werte = daten["werte"]
+            self.fehler_max, self.fehler_rms = (float(x) for x in daten["fehler"])
+        return True
+
+@lru_cache(maxsize=8)
+def surrogat(modell="Verformungskegel", verbindungsart="Durchsteckverbindung", nu=0.3, verzeichnis=VERZEICHNIS):
+    """
+    Gibt ein Surrogatmodell zurück: aus dem Speicher, von der Festplatte oder neu berechnet (und dann abgelegt).
+
+    Args:
+        modell (str, optional): "Verformungskegel" oder "FE" (benötigt scipy).
+        verbindungsart (str, optional): "Durchsteckverbindung" oder "Einschraubverbindung".
+        nu (float, optional): Querkontraktionszahl (nur FE).
+        verzeichnis (str, optional): Ablageort der .npz-Dateien.
+
+    Returns:
+        Surrogatmodell: Das einsatzbereite Modell mit Fehlerschranken.
+    """
+    ersatz = Surrogatmodell(modell, verbindungsart, nu)
+    pfad = os.path.join(verzeichnis, f"surrogat_{modell}_{verbindungsart}_{nu:g}.npz".replace(' ', '_'))
+    if not ersatz.laden(pfad):
+        ersatz.erstellen()
+        try:
+            ersatz.speichern(pfad)
+        except OSError:
+            pass  # ohne Schreibrechte wird nur im Speicher gehalten
+    return ersatz
@@ -0,0 +1,55 @@
+# Vorspannkraftänderung durch Temperatur (Wärmedehnung und E-Modul-Abfall), vektorisiert über Temperaturverläufe
+from numpy import asarray, atleast_1d, broadcast_to
+
+from werkstoffdaten import temperatur_arrays
+
+
+def vorspannkraftaenderung(delta_s, werkstoff_s, delta_p, l_p, werkstoffe_p, T_S, T_P, T_0=20, F_V=None):
+    """
+    Änderung der Vorspannkraft zwischen Montage (T_0) und Betrieb für beliebig viele Temperaturpunkte.
+
+    Thermisch (unterschiedliche Wärmedehnung von Schraube und Zwischenlagen über die Klemmlänge l_K = Σ l_p):
+
+        ΔF_Vth = (Σ l_p,i*ε_p,i(T_P) - l_K*ε_S(T_S)) / (δ_S*E_S(T_0)/E_S(T_S) + Σ δ_p,i*E_p,i(T_0)/E_p,i(T_P))
+
+    Positive Werte erhöhen die Vorspannkraft (z.B. Aluminiumgehäuse mit Stahlschraube bei Erwärmung).
+    Mit F_V wird zusätzlich der Abfall durch die kleineren E-Moduln bei Betriebstemperatur berechnet:
+
+        ΔF_VE = F_V*((δ_S + δ_P)/(δ_S,T + δ_P,T) - 1)
+
+    Args:
+        delta_s (float): Nachgiebigkeit der Schraube bei T_0 in mm/N.
+        werkstoff_s (str): Werkstoff der Schraube (Name oder Festigkeitsklasse).
+        delta_p (array_like): Nachgiebigkeiten der Zwischenlagen bei T_0 in mm/N.
+        l_p (array_like): Dicken der Zwischenlagen in mm.
+        werkstoffe_p (list): Werkstoffe der Zwischenlagen.
+        T_S (array_like): Temperatur(en) der Schraube in °C, Form (N,).
+        T_P (array_like): Temperatur(en) der Zwischenlagen in °C, Form (N,) oder (N, Zwischenlagen).
+        T_0 (float, optional): Montagetemperatur in °C.
+        F_V (float, optional): Vorspannkraft bei T_0 in N.
+
+    Returns:
+        dict: "delta_F_Vth" und "delta_F_VE" (0 ohne F_V) in N sowie "delta_s_T" und "delta_p_T" in mm/N, jeweils Form (N,).
+    """
+    delta_p = atleast_1d(asarray(delta_p, dtype=float))
+    l_p = atleast_1d(asarray(l_p, dtype=float))
+    T_S = atleast_1d(asarray(T_S, dtype=float))
+    T_P = asarray(T_P, dtype=float)
+    if T_P.ndim < 2:
+        T_P = atleast_1d(T_P)[:, None]
+    anzahl = max(len(T_S), T_P.shape[0])
+    T_S = broadcast_to(T_S, (anzahl,))
+    T_P = broadcast_to(T_P, (anzahl, len(l_p)))
+
+    schraube = temperatur_arrays([werkstoff_s], T_S, T_0)
+    lagen = temperatur_arrays(list(werkstoffe_p), T_P, T_0)
+    l_K = l_p.sum()
+
+    delta_s_T = delta_s / schraube["E_verhaeltnis"][:, 0]
+    delta_p_T = (delta_p / lagen["E_verhaeltnis"]).sum(axis=1)
+    spiel = (l_p * lagen["dehnung"]).sum(axis=1) - l_K * schraube["dehnung"][:, 0]
+    delta_F_Vth = spiel / (delta_s_T + delta_p_T)
+    delta_F_VE = 0 * delta_F_Vth
+    if F_V is not None:
+        delta_F_VE = F_V * ((delta_s + delta_p.sum()) / (delta_s_T + delta_p_T) - 1)
+    return {"delta_F_Vth": delta_F_Vth, "delta_F_VE": delta_F_VE, "delta_s_T": delta_s_T, "delta_p_T": delta_p_T}
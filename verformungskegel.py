@@ -0,0 +1,120 @@
+# Nachgiebigkeit der verspannten Teile aus dem Verformungskegel (Kegel + Hülse) für mehrschichtige Zwischenlagen (NumPy-vektorisiert)
+from numpy import (
+    asarray,
+    clip,
+    cumsum,
+    errstate,
+    inf,
+    isnan,
+    log,
+    maximum,
+    minimum,
+    nansum,
+    pi,
+    where,
+    zeros_like,
+)
+
+VERBINDUNGSARTEN = ["Durchsteckverbindung", "Einschraubverbindung"]
+
+# Obergrenze des Durchmesserverhältnisses y = D_A/d_W im Kegelwinkel (wie Fall C: D_A > 3*d_k gilt als unendlich ausgedehnt)
+Y_MAX = 3.0
+
+def kegelwinkel(l_K, d_W, D_A, verbindungsart="Durchsteckverbindung"):
+    """
+    Tangens des Kegelwinkels φ des Verformungskegels:
+
+        Durchsteckverbindung: tan φ_D = 0,362 + 0,032*ln(β_L/2) + 0,153*ln(y)
+        Einschraubverbindung: tan φ_E = 0,348 + 0,013*ln(β_L)   + 0,193*ln(y)
+
+    mit β_L = l_K/d_W und y = D_A/d_W (begrenzt auf 1 ≤ y ≤ Y_MAX).
+
+    Args:
+        l_K (array_like): Klemmlänge in mm.
+        d_W (array_like): Außendurchmesser der Kopfauflage in mm.
+        D_A (array_like): Ersatz-Außendurchmesser der Zwischenlage in mm (inf für unendlich ausgedehnte Platten).
+        verbindungsart (str, optional): "Durchsteckverbindung" oder "Einschraubverbindung".
+
+    Returns:
+        array_like: tan φ.
+    """
+    beta_L = asarray(l_K, dtype=float) / d_W
+    y = clip(asarray(D_A, dtype=float) / d_W, 1.0, Y_MAX)
+    if verbindungsart == "Durchsteckverbindung":
+        return 0.362 + 0.032 * log(beta_L / 2) + 0.153 * log(y)
+    return 0.348 + 0.013 * log(beta_L) + 0.193 * log(y)
+
+def grenzdurchmesser(l_K, d_W, tan_phi, verbindungsart="Durchsteckverbindung"):
+    """
+    Grenzdurchmesser D_A,Gr = d_W + w*l_K*tan φ (w = 1 Durchsteck-, w = 2 Einschraubverbindung).
+    Ab D_A ≥ D_A,Gr bildet sich der Verformungskegel vollständig aus, darunter schließt eine Hülse an.
+    """
+    w = 1 if verbindungsart == "Durchsteckverbindung" else 2
+    return d_W + w * l_K * tan_phi
+
+def _integral(a, b, d_W, d_h, D_A, tan_phi):
+    """
+    ∫ dz/A(z) über die Tiefe a..b unter der Auflage, A(z) = π/4*(D(z)² - d_h²) mit D(z) = min(d_W + 2*z*tan φ, D_A).
+    """
+    # Tiefe, in der der Kegel den Außendurchmesser D_A erreicht (0: reine Hülse, inf: reiner Kegel)
+    with errstate(divide='ignore', invalid='ignore'):
+        s_c = clip((D_A - d_W) / (2 * tan_phi), 0, inf)
+    a_k, b_k = minimum(a, s_c), minimum(b, s_c)
+    D_a = d_W + 2 * a_k * tan_phi
+    D_b = d_W + 2 * b_k * tan_phi
+    kegel = log((D_b - d_h) * (D_a + d_h) / ((D_b + d_h) * (D_a - d_h))) / (pi * d_h * tan_phi)
+    with errstate(invalid='ignore'):
+        huelse = where(b > s_c, (maximum(b, s_c) - maximum(a, s_c)) / (pi / 4 * (D_A**2 - d_h**2)), 0.0)
+    return kegel + huelse
+
+def nachgiebigkeit_kegel(h, E, d_W, d_h, D_A=inf, verbindungsart="Durchsteckverbindung"):
+    """
+    Integriert den Verformungskegel schichtweise durch einen Stapel verspannter Teile mit je eigenem E-Modul.
+
+    Bei Durchsteckverbindungen öffnen sich zwei Kegel von Kopf- und Mutterauflage bis zur Mitte der Klemmlänge,
+    bei Einschraubverbindungen ein Kegel von der Kopfauflage über die ganze Klemmlänge bis zum Einschraubgewinde.
+    Ist D_A kleiner als der Kegeldurchmesser, wird mit einer Hülse (D_A, d_h) weitergerechnet; für D_A ≤ d_W
+    ergibt sich die reine Hülse (entspricht Fall A).
+
+    Die Schichten stehen in der letzten Achse von h und E (von der Kopfauflage aus); d_W, d_h und D_A
+    werden darüber gebroadcastet, sodass viele Verbindungen in einem Aufruf berechnet werden.
+    Schichten mit h = 0 oder nan werden übersprungen.
+
+    Args:
+        h (array_like): Schichtdicken in mm, Form (..., Schichten).
+        E (array_like): E-Moduln der Schichten in N/mm², Form (..., Schichten).
+        d_W (array_like): Außendurchmesser der Kopfauflage in mm (d_k).
+        d_h (array_like): Bohrungsdurchmesser in mm (D_B).
+        D_A (array_like, optional): Ersatz-Außendurchmesser in mm, Standard unendlich.
+        verbindungsart (str, optional): "Durchsteckverbindung" oder "Einschraubverbindung".
+
+    Returns:
+        dict: "delta_p" (mm/N), "delta" und "A" je Schicht (Ersatzquerschnitt A_i = h_i/(E_i*δ_i)),
+            "tan_phi" und "D_A_Gr".
+    """
+    h = asarray(h, dtype=float)
+    h = where(isnan(h), 0.0, h)
+    E = asarray(E, dtype=float)
+    d_W = asarray(d_W, dtype=float)[..., None]
+    d_h = asarray(d_h, dtype=float)[..., None]
+    D_A = asarray(D_A, dtype=float)[..., None]
+
+    z_2 = cumsum(h, axis=-1)
+    z_1 = z_2 - h
+    l_K = z_2[..., -1:]
+    tan_phi = kegelwinkel(l_K, d_W, D_A, verbindungsart)
+
+    # Trennebene der beiden Kegel; oberhalb wird die Tiefe von der Kopf-, unterhalb von der Mutterauflage gemessen
+    mitte = l_K / 2 if verbindungsart == "Durchsteckverbindung" else l_K
+    oben = _integral(minimum(z_1, mitte), minimum(z_2, mitte), d_W, d_h, D_A, tan_phi)
+    unten = _integral(l_K - maximum(z_2, mitte), l_K - maximum(z_1, mitte), d_W, d_h, D_A, tan_phi)
+    with errstate(divide='ignore', invalid='ignore'):
+        delta = where(h > 0, (oben + unten) / E, 0.0)
+        A = where(h > 0, h / (E * delta), zeros_like(h) * float('nan'))
+    return {
+        "delta_p": nansum(delta, axis=-1),
+        "delta": delta,
+        "A": A,
+        "tan_phi": tan_phi[..., 0],
+        "D_A_Gr": grenzdurchmesser(l_K, d_W, tan_phi, verbindungsart)[..., 0],
+    }
@@ -0,0 +1,202 @@
+# Zulässige Montagevorspannkraft F_Mzul und Anziehdrehmoment M_A (analytisch, NumPy-vektorisiert)
+import re
+
+from numpy import abs as np_abs
+from numpy import arctan, asarray, cos, isnan, nan, nanmax, pi, sqrt, tan, where
+
+from gewindedaten import gewinde_kennwerte
+from normteile import TABELLE, normgroesse_index, normteil_arrays
+
+# Mindestdehngrenze R_p0,2 nach ISO 898-1, wie sie den F_MTab-Tabellen zugrunde liegt (8.8: d ≤ 16 / d > 16)
+R_P02_MIN = {8.8: (640, 660), 10.9: (940, 940), 12.9: (1100, 1100)}
+# Ausnutzungsgrad der Mindestdehngrenze in den Tabellen
+NY_TAB = 0.9
+
+def r_p02_min(festigkeitsklasse, d):
+    """
+    Mindestdehngrenze R_p0,2 einer Festigkeitsklasse für den Nenndurchmesser d.
+
+    Args:
+        festigkeitsklasse (float): 8.8, 10.9 oder 12.9.
+        d (array_like): Nenndurchmesser.
+
+    Returns:
+        array_like: R_p0,2 in N/mm².
+    """
+    klein, gross = R_P02_MIN[festigkeitsklasse]
+    return where(asarray(d) <= 16, klein, gross)
+
+def reibdurchmesser_kopf(d):
+    """
+    Wirksamer Reibdurchmesser der Kopfauflage D_Km = (s + D_B)/2 einer Sechskantschraube mit mittlerer Durchgangsbohrung.
+
+    Args:
+        d (array_like): Nenndurchmesser.
+
+    Returns:
+        array_like: D_Km in mm (nan für nicht genormte Durchmesser).
+    """
+    d = asarray(d, dtype=float)
+    index, gefunden = normgroesse_index(d)
+    return where(gefunden, (TABELLE["s"][index] + normteil_arrays(d)["D_B"]) / 2, nan)
+
+def vorspannkraft_zulaessig(A_0, d_0, d_2, P, R_p02, my_G, ny=NY_TAB):
+    """
+    Zulässige Montagevorspannkraft aus der Vergleichsspannung für Zug und Gewindetorsion:
+
+        F_Mzul = A_0 * ν * R_p0,2 / sqrt(1 + 3 * (3/2 * d_2/d_0 * (P/(π*d_2) + 1,155*μ_G))²)
+
+    Alle Argumente dürfen NumPy-Arrays gleicher (oder broadcastbarer) Form sein.
+
+    Args:
+        A_0 (array_like): Maßgebender Querschnitt (A_s bei Schaftschrauben, A_T bei Taillenschrauben).
+        d_0 (array_like): Zugehöriger Durchmesser (d_s bzw. d_T).
+        d_2 (array_like): Flankendurchmesser.
+        P (array_like): Teilung.
+        R_p02 (array_like): Dehngrenze in N/mm².
+        my_G (array_like): Reibungszahl im Gewinde.
+        ny (array_like, optional): Ausnutzungsgrad der Dehngrenze, Standard 0,9.
+
+    Returns:
+        array_like: F_Mzul in N.
+    """
+    torsion = 3 / 2 * d_2 / d_0 * (P / (pi * d_2) + 1.155 * my_G)
+    return A_0 * ny * R_p02 / sqrt(1 + 3 * torsion**2)
+
+def reibungswinkel(my_G, beta=60):
+    """
+    Modifizierter Reibungswinkel ρ' = arctan(μ/cos(β/2)) (3.5).
+
+    Args:
+        my_G (array_like): Reibungszahl im Gewinde.
+        beta (float, optional): Flankenwinkel in Grad, Standard 60°.
+
+    Returns:
+        array_like: ρ' im Bogenmaß.
+    """
+    return arctan(asarray(my_G) / cos(beta * pi / 180 / 2))
+
+def gewindemoment(F_M, d_2, alpha, roh_strich):
+    """
+    Gewindemoment M_G = F_M * d_2/2 * tan(α + ρ').
+
+    Returns:
+        array_like: M_G in N*mm.
+    """
+    return F_M * d_2 / 2 * tan(alpha + roh_strich)
+
+def kopfreibungsmoment(F_M, my_K, D_Km):
+    """
+    Kopfreibungsmoment M_K = F_M * μ_K * D_Km/2.
+
+    Returns:
+        array_like: M_K in N*mm.
+    """
+    return F_M * my_K * D_Km / 2
+
+def anziehdrehmoment(F_M, d_2, P, my_G, D_Km, my_K):
+    """
+    Anziehdrehmoment M_A = M_G + M_K = F_M * (d_2/2*tan(φ + ρ') + D_Km/2*μ_K) mit dem Steigungswinkel
+    φ = arctan(P/(π*d_2)) und ρ' = arctan(μ_G/cos 30°), wie im Abschnitt Anziehen.
+    Die Näherung 0,16*P + 0,58*d_2*μ_G für das Gewindemoment weicht davon um weniger als 1 % ab.
+
+    Args:
+        F_M (array_like): Montagevorspannkraft in N.
+        d_2 (array_like): Flankendurchmesser in mm.
+        P (array_like): Teilung in mm.
+        my_G (array_like): Reibungszahl im Gewinde.
+        D_Km (array_like): Wirksamer Reibdurchmesser der Kopfauflage in mm.
+        my_K (array_like): Reibungszahl in der Kopfauflage.
+
+    Returns:
+        array_like: M_A in N*mm.
+    """
+    d_2 = asarray(d_2, dtype=float)
+    return gewindemoment(F_M, d_2, arctan(P / (pi * d_2)), reibungswinkel(my_G)) + kopfreibungsmoment(F_M, my_K, D_Km)
+
+def montagewerte(d, P, festigkeitsklasse, my_G, my_K=None, ny=NY_TAB, taille=False, R_p02=None, D_Km=None):
+    """
+    Berechnet F_Mzul und M_A für Regel- und Feingewinde (ISO-Spitzgewinde), vektorisiert über alle Argumente.
+    Mit den Standardwerten entspricht das Ergebnis den F_MTab-Tabellen (ν = 0,9, μ_K = μ_G, R_p0,2 nach ISO 898-1,
+    Taillenschrauben mit d_T = 0,9*d_3, D_Km aus Schlüsselweite und mittlerer Durchgangsbohrung).
+
+    Args:
+        d (array_like): Nenndurchmesser.
+        P (array_like): Teilung.
+        festigkeitsklasse (float): 8.8, 10.9 oder 12.9 (wird nur ohne R_p02 benötigt).
+        my_G (array_like): Reibungszahl im Gewinde.
+        my_K (array_like, optional): Reibungszahl in der Kopfauflage, Standard μ_G.
+        ny (array_like, optional): Ausnutzungsgrad der Dehngrenze.
+        taille (bool, optional): True für Taillenschrauben.
+        R_p02 (array_like, optional): Abweichende Dehngrenze in N/mm².
+        D_Km (array_like, optional): Abweichender Reibdurchmesser der Kopfauflage in mm.
+
+    Returns:
+        dict: "F_Mzul" in N und "M_A" in N*m (nan, wenn D_Km für nicht genormte Durchmesser fehlt).
+    """
+    d = asarray(d, dtype=float)
+    P = asarray(P, dtype=float)
+    gewinde = gewinde_kennwerte("ISO-Spitzgewinde", d, P)
+    if taille:
+        d_0 = 0.9 * gewinde["d_3"]
+        A_0 = pi * d_0**2 / 4
+    else:
+        d_0 = gewinde["d_s"]
+        A_0 = gewinde["A_s"]
+    if R_p02 is None:
+        R_p02 = r_p02_min(festigkeitsklasse, d)
+    if my_K is None:
+        my_K = my_G
+    if D_Km is None:
+        D_Km = reibdurchmesser_kopf(d)
+    F_Mzul = vorspannkraft_zulaessig(A_0, d_0, gewinde["d_2"], P, R_p02, my_G, ny)
+    M_A = anziehdrehmoment(F_Mzul, gewinde["d_2"], P, my_G, D_Km, my_K) / 1000
+    return {"F_Mzul": F_Mzul, "M_A": M_A}
+
+def vergleich_fmtab(excel_path, taille=False, skalierung=1.0):
+    """
+    Vergleicht die analytischen Werte mit einer F_MTab-Tabelle (Aufbau wie in lookup_fmtab).
+
+    Args:
+        excel_path (str): Pfad zur Excel-Datei.
+        taille (bool, optional): True für die Tabelle der Taillenschrauben.
+        skalierung (float, optional): Faktor Tabelleneinheit -> N (z.B. 1000 bei kN).
+
+    Returns:
+        tuple: (größte relative Abweichung, Anzahl der verglichenen Werte)
+    """
+    from dauerfestigkeit import read_fmtab_sheet
+    df, columns = read_fmtab_sheet(excel_path)
+
+    # Je Reibungszahl wird die erste passende Spalte verwendet (wie in lookup_fmtab)
+    my_columns = {}
+    for i, column in enumerate(columns):
+        try:
+            my = float(column.replace(',', '.'))
+        except ValueError:
+            continue
+        if my > 0:
+            my_columns.setdefault(my, i)
+
+    abweichungen = []
+    for row_index, abm in df['Abm.'].items():
+        match = re.fullmatch(r"M(\d+(?:,\d+)?)x(\d+(?:,\d+)?)", str(abm))
+        if match is None:
+            continue
+        d, P = (float(x.replace(',', '.')) for x in match.groups())
+        for diff, festigkeitsklasse in enumerate([8.8, 10.9, 12.9]):
+            if row_index + diff >= len(df):
+                break
+            row = df.iloc[row_index + diff]
+            for my, column_index in my_columns.items():
+                try:
+                    tabelle = float(row.iloc[column_index]) * skalierung
+                except (TypeError, ValueError):
+                    continue
+                if isnan(tabelle) or tabelle == 0:
+                    continue
+                F_Mzul = montagewerte(d, P, festigkeitsklasse, my, taille=taille)["F_Mzul"]
+                abweichungen.append(float(np_abs(F_Mzul - tabelle) / tabelle))
+    if not abweichungen:
+        return nan, 0
+    return float(nanmax(abweichungen)), len(abweichungen)
@@ -1,9 +1,83 @@
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QLabel, QLineEdit, QHBoxLayout,
-    QPushButton, QDialog, QTableWidget, QTableWidgetItem, QVBoxLayout,QGridLayout,QScrollArea
+    QPushButton, QDialog, QTableWidget, QTableWidgetItem, QVBoxLayout,QGridLayout,QScrollArea,
+    QCompleter, QHeaderView, QAbstractItemView
 )
-from PyQt5.QtGui import QPixmap
-from PyQt5.QtCore import Qt
+from collections import OrderedDict
+from math import isnan
+from PyQt5.QtGui import QPixmap, QImageReader
+from PyQt5.QtCore import Qt, QEvent
+from werkstoffdaten import WERKSTOFFE, get_werkstoff, search_werkstoffe, werkstoff_kennwerte
+
+# Scans aus Anhang A.1 und deren maximale (logische) Anzeigegröße im Pop-up
+IMAGE_PATHS = ['stor/0365.jpg', 'stor/0366.jpg', 'stor/0367.jpg', 'stor/0368.jpg']
+MAX_IMAGE_WIDTH = 2500
+MAX_IMAGE_HEIGHT = 1500
+IMAGE_CACHE_BYTES = 128 * 1024 * 1024
+
+def decode_image(path, max_width, max_height):
+    """
+    Dekodiert ein Bild direkt in der benötigten Größe (Seitenverhältnis bleibt erhalten).
+    Verwendet nur QImage und kann daher im WorkerPool laufen.
+
+    Args:
+        path (str): Pfad zur Bilddatei.
+        max_width (int): Maximale Breite in Pixeln.
+        max_height (int): Maximale Höhe in Pixeln.
+
+    Returns:
+        QImage: Das skalierte Bild.
+    """
+    reader = QImageReader(path)
+    size = reader.size()
+    if size.isValid():
+        size.scale(max_width, max_height, Qt.KeepAspectRatio)
+        reader.setScaledSize(size)
+    image = reader.read()
+    if image.isNull():
+        raise OSError(f"{path}: {reader.errorString()}")
+    return image
+
+class PixmapCache:
+    """
+    Zwischenspeicher für Pixmaps mit Speicherobergrenze.
+    Wird die Grenze überschritten, werden die am längsten nicht benutzten Einträge verworfen (LRU).
+
+    Args:
+        max_bytes (int): Maximaler Speicherbedarf aller Pixmaps in Bytes.
+    """
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.pixmaps = OrderedDict()
+        self.size = 0
+
+    def get(self, key):
+        """
+        Gibt die Pixmap zu key zurück (oder None) und markiert sie als zuletzt benutzt.
+        """
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        """
+        Legt eine Pixmap ab und verdrängt bei Bedarf die ältesten Einträge.
+        """
+        if key in self.pixmaps:
+            self.size -= self.cost(self.pixmaps.pop(key))
+        self.pixmaps[key] = pixmap
+        self.size += self.cost(pixmap)
+        while self.size > self.max_bytes and len(self.pixmaps) > 1:
+            _, old_pixmap = self.pixmaps.popitem(last=False)
+            self.size -= self.cost(old_pixmap)
+
+    @staticmethod
+    def cost(pixmap):
+        """
+        Speicherbedarf einer Pixmap in Bytes.
+        """
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
 
 
 class WerkstoffWidget(QWidget):
@@ -15,9 +89,11 @@ class WerkstoffWidget(QWidget):
         festigkeitsklasse (str): Die Festigkeitsklasse des Werkstoffs.
         R_p02 (float): Nennstreckgrenze des Werkstoffs.
         R_m (float): Nennzugfestigkeit des Werkstoffs.
-        festigkeitsklasse_lineedit (QLineEdit): Eingabefeld für die Festigkeitsklasse.
+        E (float): E-Modul des Werkstoffs.
+        alpha_T (float): Wärmeausdehnungskoeffizient des Werkstoffs.
+        festigkeitsklasse_lineedit (QLineEdit): Eingabefeld für die Festigkeitsklasse bzw. den Werkstoff.
         festigkeitsklasse_result_label (QLabel): Label zur Anzeige der Berechnungsergebnisse.
-        show_table_button (QPushButton): Button zum Anzeigen der Werkstoffdatentabelle.
+        show_table_button (QPushButton): Button zum Anzeigen der Werkstoffdatenbank.
     """
     def __init__(self, parent=None):
         """
@@ -32,6 +108,14 @@ class WerkstoffWidget(QWidget):
         self.festigkeitsklasse = None
         self.R_p02 = None
         self.R_m = None
+        self.E = None
+        self.alpha_T = None
+
+        # Pop-ups und dekodierte Bilder werden zwischen den Aufrufen wiederverwendet
+        self.pixmap_cache = PixmapCache(IMAGE_CACHE_BYTES)
+        self.table_dialog = None
+        self.image_labels = []
+        self.database_dialog = None
 
         # Layout einrichten
         layout = QVBoxLayout()
@@ -41,8 +125,11 @@ class WerkstoffWidget(QWidget):
          
         self.festigkeitsklasse_lineedit = QLineEdit()
         self.festigkeitsklasse_lineedit.setObjectName("festigkeitsklasse_lineedit")
-        self.festigkeitsklasse_lineedit.setToolTip("a.b (Bsp.: 12.9) <br>R<sub>m</sub>=a*100 <br>R<sub>e</sub>=b*R<sub>m</sub>/10")
+        self.festigkeitsklasse_lineedit.setToolTip("a.b (Bsp.: 12.9) <br>R<sub>m</sub>=a*100 <br>R<sub>e</sub>=b*R<sub>m</sub>/10 <br>oder Werkstoff aus der Datenbank (Bsp.: A2-70)")
         self.festigkeitsklasse_lineedit.editingFinished.connect(self.calculate)
+        completer = QCompleter([row[0] for row in WERKSTOFFE], self.festigkeitsklasse_lineedit)
+        completer.setCaseSensitivity(Qt.CaseInsensitive)
+        self.festigkeitsklasse_lineedit.setCompleter(completer)
         self.festigkeitsklasse_result_label = QLabel("")
 
         festigkeitsklasse_layout = QHBoxLayout()
@@ -51,42 +138,40 @@ class WerkstoffWidget(QWidget):
         festigkeitsklasse_layout.addWidget(self.festigkeitsklasse_result_label)
         layout.addLayout(festigkeitsklasse_layout)
 
-        # Button hinzufügen, um Tabelle anzuzeigen
-        self.show_table_button = QPushButton("Anhang A.1 Werkstoffdaten anzeigen")
-        self.show_table_button.clicked.connect(self.show_table_popup)
+        # Button hinzufügen, um die Werkstoffdatenbank anzuzeigen
+        self.show_table_button = QPushButton("Werkstoffdaten (Anhang A.1) anzeigen")
+        self.show_table_button.clicked.connect(self.show_database_popup)
+        # Spätestens beim Überfahren des Buttons werden die Scans im Hintergrund dekodiert
+        self.show_table_button.installEventFilter(self)
         layout.addWidget(self.show_table_button)
 
         self.setLayout(layout)
 
     def calculate(self):
         """
-        Berechnet die Nennzugfestigkeit und Nennstreckgrenze basierend auf der eingegebenen Festigkeitsklasse.
+        Ermittelt Nennzugfestigkeit, Nennstreckgrenze, E-Modul und Wärmeausdehnung des eingegebenen Werkstoffs.
+        Bekannte Werkstoffe kommen aus der Werkstoffdatenbank, andere Festigkeitsklassen a.b werden umgerechnet.
         Aktualisiert die entsprechenden Labels mit den berechneten Werten.
         Ruft die Berechnung der Dauerfestigkeit auf.
         """
-        self.festigkeitsklasse = self.festigkeitsklasse_lineedit.text().replace(',', '.')
+        self.festigkeitsklasse = self.festigkeitsklasse_lineedit.text().replace(',', '.').strip()
         if not self.festigkeitsklasse:
             self.festigkeitsklasse_result_label.setText("")
             return
 
         try:
-            # Split the festigkeitsklasse (e.g., "12.9" into ["12", "9"])
-            parts = self.festigkeitsklasse.split('.')
-            if len(parts) != 2:
-                raise ValueError("Festigkeitsklasse muss im Format 'X.Y' sein (z.B. 12.9)")
-
-            # Convert to floats
-            first_part = float(parts[0])  # e.g., 12 from "12.9"
-            second_part = float(parts[1])  # e.g., 9 from "12.9"
-
-            # Calculate R_m and R_p02
-            self.R_m = first_part * 100  # e.g., 12 * 100 = 1200
-            self.R_p02 = second_part * 10 * first_part  # e.g., 9 * 10 * 12 = 1080
+            werkstoff = werkstoff_kennwerte(self.festigkeitsklasse)
+            self.R_m = werkstoff["R_m"]
+            self.R_p02 = werkstoff["R_p02"]
+            self.E = werkstoff["E"]
+            self.alpha_T = werkstoff["alpha_T"]
 
             # Update the display
+            R_p02_text = "-" if isnan(self.R_p02) else f"{self.R_p02:.0f}"
             self.festigkeitsklasse_result_label.setText(
                 f"Nennzugfestigkeit R<sub>m</sub>: {self.R_m:.0f}\n"
-                f"Nennstreckgrenze R<sub>eL/p0,2</sub>: {self.R_p02:.0f}"
+                f"Nennstreckgrenze R<sub>eL/p0,2</sub>: {R_p02_text}\n"
+                f"E: {self.E:.0f}"
             )
 
             # Trigger Dauerfestigkeit calculation
@@ -95,9 +180,145 @@ class WerkstoffWidget(QWidget):
         except ValueError as e:
             self.festigkeitsklasse_result_label.setText("ungültige Eingabe")
 
+    def eventFilter(self, obj, event):
+        """
+        Startet das Dekodieren der Bilder, sobald die Maus den Tabellen-Button erreicht.
+        """
+        if obj is self.show_table_button and event.type() == QEvent.Enter:
+            self.preload_images()
+        return super().eventFilter(obj, event)
+
+    def image_scale(self):
+        """
+        Gibt das Pixelverhältnis des aktuellen Bildschirms zurück (z.B. 2 bei HiDPI).
+        """
+        return self.screen().devicePixelRatio()
+
+    def preload_images(self):
+        """
+        Dekodiert alle noch nicht zwischengespeicherten Bilder aus Anhang A.1 im WorkerPool.
+        Die Auflösung richtet sich nach dem Pixelverhältnis des Bildschirms.
+        """
+        scale = self.image_scale()
+        for path in IMAGE_PATHS:
+            key = f"werkstoff/{path}"
+            if self.pixmap_cache.get((path, scale)) is not None or self.mainwindow.worker_pool.is_busy(key):
+                continue
+            self.mainwindow.worker_pool.submit(key, decode_image, path, int(MAX_IMAGE_WIDTH * scale), int(MAX_IMAGE_HEIGHT * scale),
+                                               on_result=lambda image, path=path, scale=scale: self.image_loaded(path, scale, image))
+
+    def image_loaded(self, path, scale, image):
+        """
+        Übernimmt ein im Hintergrund dekodiertes Bild in den Zwischenspeicher und zeigt es an, falls das Pop-up offen ist.
+
+        Args:
+            path (str): Pfad zur Bilddatei.
+            scale (float): Pixelverhältnis, für das dekodiert wurde.
+            image (QImage): Das dekodierte Bild.
+        """
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(scale)
+        self.pixmap_cache.put((path, scale), pixmap)
+        if self.table_dialog is not None and self.table_dialog.isVisible() and scale == self.image_scale():
+            self.image_labels[IMAGE_PATHS.index(path)].setPixmap(pixmap)
+
+    def show_database_popup(self):
+        """
+        Zeigt ein Pop-up-Fenster mit der durchsuchbaren Werkstoffdatenbank an.
+        Ein Doppelklick auf eine Zeile übernimmt den Werkstoff.
+        """
+        if self.database_dialog is None:
+            self.create_database_dialog()
+        self.database_search.clear()
+        self.filter_database("")
+        self.database_dialog.exec_()
+
+    def create_database_dialog(self):
+        """
+        Erstellt das Pop-up-Fenster mit Suchfeld und Tabelle der Werkstoffdatenbank.
+        """
+        dialog = QDialog(self)
+        dialog.setWindowTitle("A.1 Werkstoffdaten")
+        dialog.resize(700, 500)
+        layout = QVBoxLayout(dialog)
+
+        self.database_search = QLineEdit()
+        self.database_search.setPlaceholderText("Suchen (Bsp.: 10.9, A4, EN AW)")
+        self.database_search.textChanged.connect(self.filter_database)
+        layout.addWidget(self.database_search)
+
+        self.database_table = QTableWidget(0, 6)
+        self.database_table.setHorizontalHeaderLabels(["Werkstoff", "Art", "R_m [N/mm²]", "R_p0,2 [N/mm²]", "E [N/mm²]", "α_T [10⁻⁶/K]"])
+        self.database_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.database_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.database_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.database_table.cellDoubleClicked.connect(self.database_row_selected)
+        layout.addWidget(self.database_table)
+
+        # Die Scans enthalten weitere Werkstoffe und Kennwerte, die nicht in der Datenbank stehen
+        scans_button = QPushButton("Scans aus Anhang A.1 anzeigen")
+        scans_button.clicked.connect(self.show_table_popup)
+        layout.addWidget(scans_button)
+
+        self.database_dialog = dialog
+
+    def filter_database(self, text):
+        """
+        Zeigt in der Tabelle alle Werkstoffe an, deren Name mit dem Suchtext beginnt.
+
+        Args:
+            text (str): Der Suchtext.
+        """
+        names = search_werkstoffe(text) if text.strip() else [row[0] for row in WERKSTOFFE]
+        self.database_table.setRowCount(len(names))
+        for i, name in enumerate(names):
+            werkstoff = get_werkstoff(name)
+            values = [
+                werkstoff["Name"], werkstoff["Art"],
+                f"{werkstoff['R_m']:.0f}",
+                "-" if isnan(werkstoff["R_p02"]) else f"{werkstoff['R_p02']:.0f}",
+                f"{werkstoff['E']:.0f}",
+                f"{werkstoff['alpha_T'] * 1e6:.1f}",
+            ]
+            for j, value in enumerate(values):
+                self.database_table.setItem(i, j, QTableWidgetItem(value))
+
+    def database_row_selected(self, row, column):
+        """
+        Übernimmt den Werkstoff der doppelt angeklickten Zeile und schließt das Pop-up.
+        """
+        self.festigkeitsklasse_lineedit.setText(self.database_table.item(row, 0).text())
+        self.calculate()
+        self.database_dialog.accept()
+
     def show_table_popup(self):
         """
-        Zeigt ein Pop-up-Fenster mit einer Tabelle der Werkstoffdaten an.
+        Zeigt ein Pop-up-Fenster mit den Scans der Werkstofftabellen aus Anhang A.1 an.
+        Das Fenster wird nur beim ersten Aufruf erzeugt; die Bilder kommen aus dem Zwischenspeicher
+        oder werden nachgereicht, sobald sie im Hintergrund dekodiert sind.
+        """
+        if self.table_dialog is None:
+            self.create_table_dialog()
+
+        scale = self.image_scale()
+        for path, label in zip(IMAGE_PATHS, self.image_labels):
+            pixmap = self.pixmap_cache.get((path, scale))
+            if pixmap is not None:
+                label.setPixmap(pixmap)
+            else:
+                label.setText("Bild wird geladen ...")
+        self.preload_images()
+
+        # Zeigt den Dialog an
+        self.table_dialog.exec_()
+
+        # Nach dem Schließen halten nur noch der Zwischenspeicher die Bilder, damit dessen Obergrenze greift
+        for label in self.image_labels:
+            label.clear()
+
+    def create_table_dialog(self):
+        """
+        Erstellt das Pop-up-Fenster mit je einem Label pro Bild aus Anhang A.1.
         """
         # Erstellt ein pop-up Fenster
         dialog = QDialog(self)
@@ -114,44 +335,16 @@ class WerkstoffWidget(QWidget):
         scroll_area.setWidgetResizable(True)
         scroll_area.setWidget(scroll_content)
 
-        # Maximale Breite und Höhe der Bilder
-        max_width = 2500
-        max_height = 1500
-
-        # Liste der Bildpfade
-        image_paths = ['stor/0365.jpg', 'stor/0366.jpg', 'stor/0367.jpg', 'stor/0368.jpg']
-
-        for i, image_path in enumerate(image_paths):
-            pixmap = QPixmap(image_path)
-            # Bild skalieren, wobei das Seitenverhältnis beibehalten wird
-            scaled_pixmap = pixmap.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        self.image_labels = []
+        for i, image_path in enumerate(IMAGE_PATHS):
             label = QLabel()
-            label.setPixmap(scaled_pixmap)
             label.setAlignment(Qt.AlignCenter)
             scroll_layout.addWidget(label, i, 0, Qt.AlignCenter)
+            self.image_labels.append(label)
 
         # Scrollbereich zum Layout hinzufügen
         layout.addWidget(scroll_area)
 
         # Setzt das Layout für den Dialog
         dialog.setLayout(layout)
-
-        # Zeigt den Dialog an
-        dialog.exec_()
-            
-
-                
-            
-
-        """
-            # Erstellt eine Tabelle
-            table = QTableWidget(4, 3)  # 4 rows, 3 columns for this example
-            table.setHorizontalHeaderLabels(["Werkstoff Kurzzeichen", "Mittlere Festigkeitswerte / N/mm^2", "Eigs. und Verwendungsbeispiele"])
-            
-            # Füllt die Tabelle mit zufälligen Werten
-            for i in range(4):
-                for j in range(3):
-                    table.setItem(i, j, QTableWidgetItem(f"Item {i+1},{j+1}"))
-
-            
-            """
\ No newline at end of file
+        self.table_dialog = dialog
@@ -0,0 +1,225 @@
+# Strukturierte Werkstoffdaten (Auszug aus Anhang A.1, ISO 898-1 und ISO 3506-1)
+from bisect import bisect_left
+
+from numpy import array, asarray, broadcast_to, interp, nan, unique, zeros
+
+# Spalten: Name, Art, Zugfestigkeit R_m [N/mm²], Streck-/Dehngrenze R_p02 [N/mm²], E-Modul [N/mm²], Wärmeausdehnungskoeffizient alpha_T [1/K]
+# Für Festigkeitsklassen sind die Nennwerte angegeben (R_m = a*100, R_p02 = a*b*10), nan = kein Kennwert vorhanden.
+WERKSTOFFE = [
+    ["4.6", "Festigkeitsklasse", 400, 240, 210000, 11.5e-6],
+    ["4.8", "Festigkeitsklasse", 400, 320, 210000, 11.5e-6],
+    ["5.6", "Festigkeitsklasse", 500, 300, 210000, 11.5e-6],
+    ["5.8", "Festigkeitsklasse", 500, 400, 210000, 11.5e-6],
+    ["6.8", "Festigkeitsklasse", 600, 480, 210000, 11.5e-6],
+    ["8.8", "Festigkeitsklasse", 800, 640, 210000, 11.5e-6],
+    ["9.8", "Festigkeitsklasse", 900, 720, 210000, 11.5e-6],
+    ["10.9", "Festigkeitsklasse", 1000, 900, 210000, 11.5e-6],
+    ["12.9", "Festigkeitsklasse", 1200, 1080, 210000, 11.5e-6],
+    ["A2-50", "Nichtrostend", 500, 210, 200000, 16.0e-6],
+    ["A2-70", "Nichtrostend", 700, 450, 200000, 16.0e-6],
+    ["A2-80", "Nichtrostend", 800, 600, 200000, 16.0e-6],
+    ["A4-50", "Nichtrostend", 500, 210, 200000, 16.0e-6],
+    ["A4-70", "Nichtrostend", 700, 450, 200000, 16.0e-6],
+    ["A4-80", "Nichtrostend", 800, 600, 200000, 16.0e-6],
+    ["S235JR", "Stahl", 360, 235, 210000, 11.5e-6],
+    ["E295", "Stahl", 470, 295, 210000, 11.5e-6],
+    ["C45E", "Stahl", 700, 490, 210000, 11.5e-6],
+    ["42CrMo4", "Stahl", 1000, 750, 210000, 11.5e-6],
+    ["EN-GJL-250", "Gusseisen", 250, nan, 110000, 10.0e-6],
+    ["EN-GJS-400-15", "Gusseisen", 400, 250, 169000, 12.5e-6],
+    ["EN AW-6082 T6", "Aluminium", 310, 260, 70000, 23.4e-6],
+    ["EN AW-5754", "Aluminium", 190, 80, 70000, 23.7e-6],
+    ["EN AC-AlSi9Cu3", "Aluminium", 240, 140, 75000, 21.0e-6],
+    ["TiAl6V4", "Titan", 900, 830, 110000, 8.6e-6],
+]
+
+SPALTEN = ["Name", "Art", "R_m", "R_p02", "E", "alpha_T"]
+
+def normalize(name):
+    """
+    Vereinheitlicht einen Werkstoffnamen für Index und Suche (Großschreibung, '.' statt ',', ohne Leerzeichen).
+
+    Args:
+        name (str): Der eingegebene Name, z.B. "12,9" oder "a2-70".
+
+    Returns:
+        str: Der normalisierte Name.
+    """
+    return name.strip().upper().replace(',', '.').replace(' ', '')
+
+# Index für direkten Zugriff und sortierte Schlüssel für die Präfixsuche
+INDEX = {normalize(row[0]): row for row in WERKSTOFFE}
+SCHLUESSEL = sorted(INDEX)
+
+def get_werkstoff(name):
+    """
+    Gibt die Kennwerte eines Werkstoffs aus der Tabelle zurück.
+
+    Args:
+        name (str): Name oder Festigkeitsklasse, z.B. "10.9", "A4-70" oder "EN AW-6082 T6".
+
+    Returns:
+        dict: Die Kennwerte mit den Schlüsseln aus SPALTEN oder None, wenn der Werkstoff unbekannt ist.
+    """
+    row = INDEX.get(normalize(name))
+    if row is None:
+        return None
+    return dict(zip(SPALTEN, row))
+
+def search_werkstoffe(prefix):
+    """
+    Sucht alle Werkstoffe, deren Name mit prefix beginnt (binäre Suche über die sortierten Schlüssel).
+
+    Args:
+        prefix (str): Der Anfang des Namens, z.B. "A2" oder "EN A".
+
+    Returns:
+        list: Die Originalnamen der Treffer in alphabetischer Reihenfolge.
+    """
+    prefix = normalize(prefix)
+    treffer = []
+    i = bisect_left(SCHLUESSEL, prefix)
+    while i < len(SCHLUESSEL) and SCHLUESSEL[i].startswith(prefix):
+        treffer.append(INDEX[SCHLUESSEL[i]][0])
+        i += 1
+    return treffer
+
+def festigkeitsklasse_kennwerte(festigkeitsklasse):
+    """
+    Berechnet R_m und R_p02 aus einer Festigkeitsklasse a.b nach ISO 898-1 (R_m = a*100, R_p02 = a*b*10).
+
+    Args:
+        festigkeitsklasse (str): Die Festigkeitsklasse, z.B. "12.9".
+
+    Returns:
+        tuple: (R_m, R_p02)
+
+    Raises:
+        ValueError: Wenn die Eingabe nicht im Format 'X.Y' ist.
+    """
+    parts = normalize(festigkeitsklasse).split('.')
+    if len(parts) != 2:
+        raise ValueError("Festigkeitsklasse muss im Format 'X.Y' sein (z.B. 12.9)")
+    first_part = float(parts[0])
+    second_part = float(parts[1])
+    return first_part * 100, second_part * 10 * first_part
+
+def werkstoff_kennwerte(name):
+    """
+    Gibt die Kennwerte eines Werkstoffs zurück. Unbekannte Festigkeitsklassen werden nach ISO 898-1
+    umgerechnet; E-Modul und Wärmeausdehnung gelten dann für Stahl.
+
+    Args:
+        name (str): Name oder Festigkeitsklasse.
+
+    Returns:
+        dict: Die Kennwerte mit den Schlüsseln aus SPALTEN.
+
+    Raises:
+        ValueError: Wenn der Werkstoff weder in der Tabelle steht noch als Festigkeitsklasse lesbar ist.
+    """
+    werkstoff = get_werkstoff(name)
+    if werkstoff is not None:
+        return werkstoff
+    R_m, R_p02 = festigkeitsklasse_kennwerte(name)
+    return {"Name": name, "Art": "Festigkeitsklasse", "R_m": R_m, "R_p02": R_p02, "E": 210000, "alpha_T": 11.5e-6}
+
+def werkstoff_arrays(names):
+    """
+    Gibt die Kennwerte vieler Werkstoffe spaltenweise als NumPy-Arrays zurück (für Batch-Berechnungen).
+    Unbekannte Namen ergeben nan.
+
+    Args:
+        names (list): Die Werkstoffnamen bzw. Festigkeitsklassen.
+
+    Returns:
+        dict: "R_m", "R_p02", "E" und "alpha_T" als Arrays der Länge len(names).
+    """
+    cache = {}
+    rows = []
+    for name in names:
+        if name not in cache:
+            try:
+                werkstoff = werkstoff_kennwerte(name)
+                cache[name] = [werkstoff["R_m"], werkstoff["R_p02"], werkstoff["E"], werkstoff["alpha_T"]]
+            except ValueError:
+                cache[name] = [nan, nan, nan, nan]
+        rows.append(cache[name])
+    werte = array(rows, dtype=float).reshape(len(rows), 4)
+    return {"R_m": werte[:, 0], "R_p02": werte[:, 1], "E": werte[:, 2], "alpha_T": werte[:, 3]}
+
+# Temperaturabhängigkeit je Werkstoffart (Richtwerte): Faktoren auf E(20 °C) bzw. auf den mittleren
+# Wärmeausdehnungskoeffizienten alpha_T zwischen 20 °C und T, Stützstellen in °C
+TEMPERATUREN = [-100, 20, 100, 200, 300]
+TEMPERATURFAKTOREN = {
+    # Art: (E(T)/E(20 °C), alpha_T(T)/alpha_T(20 °C))
+    "Festigkeitsklasse": ([1.03, 1.0, 0.97, 0.93, 0.89], [0.90, 1.0, 1.03, 1.09, 1.14]),
+    "Stahl": ([1.03, 1.0, 0.97, 0.93, 0.89], [0.90, 1.0, 1.03, 1.09, 1.14]),
+    "Nichtrostend": ([1.04, 1.0, 0.97, 0.93, 0.90], [0.90, 1.0, 1.00, 1.04, 1.07]),
+    "Gusseisen": ([1.02, 1.0, 0.97, 0.93, 0.88], [0.90, 1.0, 1.02, 1.08, 1.12]),
+    "Aluminium": ([1.05, 1.0, 0.96, 0.90, 0.80], [0.87, 1.0, 1.02, 1.06, 1.10]),
+    "Titan": ([1.04, 1.0, 0.96, 0.91, 0.86], [0.92, 1.0, 1.00, 1.03, 1.06]),
+}
+
+def e_modul(name, T):
+    """
+    E-Modul eines Werkstoffs bei der Temperatur T (linear zwischen den Stützstellen interpoliert,
+    außerhalb -100 °C bis 300 °C der Randwert).
+
+    Args:
+        name (str): Name oder Festigkeitsklasse.
+        T (array_like): Temperatur(en) in °C.
+
+    Returns:
+        array_like: E(T) in N/mm².
+
+    Raises:
+        ValueError: Wenn der Werkstoff unbekannt ist.
+    """
+    werkstoff = werkstoff_kennwerte(name)
+    return werkstoff["E"] * interp(T, TEMPERATUREN, TEMPERATURFAKTOREN[werkstoff["Art"]][0])
+
+def ausdehnungskoeffizient(name, T):
+    """
+    Mittlerer Wärmeausdehnungskoeffizient eines Werkstoffs zwischen 20 °C und T.
+
+    Returns:
+        array_like: alpha_T(T) in 1/K.
+    """
+    werkstoff = werkstoff_kennwerte(name)
+    return werkstoff["alpha_T"] * interp(T, TEMPERATUREN, TEMPERATURFAKTOREN[werkstoff["Art"]][1])
+
+def waermedehnung(name, T, T_0=20):
+    """
+    Thermische Dehnung zwischen der Montagetemperatur T_0 und der Temperatur T:
+    ε = alpha_T(T)*(T - 20 °C) - alpha_T(T_0)*(T_0 - 20 °C).
+
+    Returns:
+        array_like: ε (dimensionslos).
+    """
+    T = asarray(T, dtype=float)
+    return ausdehnungskoeffizient(name, T) * (T - 20) - ausdehnungskoeffizient(name, T_0) * (T_0 - 20)
+
+def temperatur_arrays(names, T, T_0=20):
+    """
+    E(T)/E(T_0) und die thermische Dehnung für viele Bauteile und viele Temperaturen in einem Aufruf.
+    Jeder Werkstoff wird nur einmal nachgeschlagen.
+
+    Args:
+        names (list): Werkstoffnamen der Bauteile (Länge B).
+        T (array_like): Temperaturen in °C, Form (N,) oder (N, B).
+        T_0 (float, optional): Montagetemperatur in °C.
+
+    Returns:
+        dict: "E_verhaeltnis" (E(T)/E(T_0)) und "dehnung", jeweils Form (N, B).
+    """
+    T = asarray(T, dtype=float)
+    T = broadcast_to(T[:, None] if T.ndim == 1 else T, (T.shape[0], len(names)))
+    E_verhaeltnis = zeros(T.shape)
+    dehnung = zeros(T.shape)
+    namen = array(names, dtype=object)
+    for name in unique(namen):
+        spalten = namen == name
+        E_verhaeltnis[:, spalten] = e_modul(name, T[:, spalten]) / e_modul(name, T_0)
+        dehnung[:, spalten] = waermedehnung(name, T[:, spalten], T_0)
+    return {"E_verhaeltnis": E_verhaeltnis, "dehnung": dehnung}
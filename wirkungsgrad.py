@@ -1,6 +1,8 @@
 from PyQt5.QtWidgets import QWidget, QGridLayout, QLabel, QLineEdit, QComboBox, QGroupBox, QGraphicsView, QGraphicsScene, QSizePolicy, QApplication
 from PyQt5.QtCore import pyqtSignal
-from numpy import pi,tan, arctan, cos
+from numpy import pi,tan, arctan, cos, isnan
+from anziehen import anziehtabelle
+from vorspannung import reibdurchmesser_kopf
 
 class WirkungsgradWidget(QWidget):
 
@@ -18,6 +20,11 @@ class WirkungsgradWidget(QWidget):
         roh_strich(float): modifizierter Reibungswinkel
         eta(float):Wirkungsgrad \u03B7
         eta_strich(float):Wirkungsgrad \u03B7'
+        my_K(float): Reibwert der Kopfauflage \u03BC<sub>K</sub>
+        M_Amin(float): Anziehdrehmoment für F<sub>Mmin</sub>
+        M_Amax(float): Anziehdrehmoment für F<sub>Mmax</sub>
+        theta_min(float): Drehwinkel bis F<sub>Mmin</sub>
+        theta_max(float): Drehwinkel bis F<sub>Mmax</sub>
 
     Attributes:
         validator (QDoubleValidator): Validator für Eingabefelder. Erlaubt nur Gleitkommazahlen in einem bestimmten Bereich.
@@ -107,6 +114,20 @@ class WirkungsgradWidget(QWidget):
         ]  
         k=add_line_edits(eingabe2, k, scroll_layout)
 
+        self.lable3=QLabel("""<p style="font-size:8pt;">Anziehdrehmoment und Drehwinkel</p>""")
+        scroll_layout.addWidget(self.lable3, k, 0, 1, 3)
+        k+=1
+
+        eingabe3= [
+            [0,"Reibwert Kopfauflage \u03BC<sub>K</sub>","","my_K","Ohne Eingabe gilt \u03BC<sub>K</sub> = \u03BC"],
+            [0,"Anziehdrehmoment M<sub>A min</sub>","Nm","M_Amin","M<sub>A</sub>=F<sub>M</sub>*(d<sub>2</sub>/2*tan(\u03B1+\u03C1')+\u03BC<sub>K</sub>*D<sub>Km</sub>/2)<br>mit D<sub>Km</sub>=(d<sub>k</sub>+D<sub>B</sub>)/2 und F<sub>M</sub>=F<sub>Mmin</sub>"],
+            [0,"Anziehdrehmoment M<sub>A max</sub>","Nm","M_Amax","M<sub>A</sub>=F<sub>M</sub>*(d<sub>2</sub>/2*tan(\u03B1+\u03C1')+\u03BC<sub>K</sub>*D<sub>Km</sub>/2)<br>mit D<sub>Km</sub>=(d<sub>k</sub>+D<sub>B</sub>)/2 und F<sub>M</sub>=F<sub>Mmax</sub>"],
+            [0,"Drehwinkel \u03B8<sub>min</sub>","°","theta_min","Drehwinkel ab Fügepunkt bis F<sub>Mmin</sub><br>\u03B8=360°*F<sub>M</sub>*(\u03B4<sub>s</sub>+\u03B4<sub>p</sub>)/P<sub>h</sub>"],
+            [0,"Drehwinkel \u03B8<sub>max</sub>","°","theta_max","Drehwinkel ab Fügepunkt bis F<sub>Mmax</sub><br>\u03B8=360°*F<sub>M</sub>*(\u03B4<sub>s</sub>+\u03B4<sub>p</sub>)/P<sub>h</sub>"]
+        ]
+        k=add_line_edits(eingabe3, k, scroll_layout)
+        self.line_edits["my_K"].setPlaceholderText("= \u03BC")
+
         self.calculate()
     
     def calculate(self):
@@ -170,11 +191,57 @@ class WirkungsgradWidget(QWidget):
                 eta_strich=tan(alpha+roh_strich)/tan(alpha)
                 self.set_value("eta_strich", eta_strich)
 
+        self.calculate_anziehen()
+
         # Am Ende der Kalkulation werden die Signal-Werte nochmals ausgelesen und an die anderen Widgets übergeben
         my = self.get_value("my")
         if my != None:
             self.changed_my.emit(my)  # Emittiert neuen my-Wert
 
+    def calculate_anziehen(self):
+        """
+        Berechnet Anziehdrehmoment und Drehwinkel für F<sub>Mmin</sub> und F<sub>Mmax</sub> aus Gewinde (d_2, \u03B1, P_h),
+        Reibung (\u03C1', \u03BC_K), Kopfauflage (d_k, D_B) und Nachgiebigkeiten (\u03B4_s, \u03B4_p).
+        Wird auch aufgerufen, wenn sich Montagekräfte oder Nachgiebigkeiten im KraefteWidget ändern.
+        """
+        if not hasattr(self.mainwindow, "kraefte_widget"):
+            return  # Die übrigen Widgets werden erst nach diesem erzeugt
+        d = self.get_gewinde("d")
+        d_2 = self.get_gewinde("d_2")
+        alpha = self.get_gewinde("alpha")
+        p_h = self.get_gewinde("p_h")
+        if p_h == None:
+            p_h = self.get_gewinde("P")
+        roh_strich = self.get_value("roh_strich")
+        my = self.get_value("my")
+        my_K = self.get_value("my_K")
+        if my_K == None:
+            my_K = my
+        d_k = self.get_nachgiebigkeit("d_k")
+        D_B = self.get_nachgiebigkeit("D_B")
+        F_Mmin = self.get_kraefte("F_Mmin")
+        F_Mmax = self.get_kraefte("F_Mmax")
+        delta_s = self.get_kraefte("delta_s")
+        delta_p = self.get_kraefte("delta_p")
+
+        if d_k != None and D_B != None:
+            D_Km = (d_k + D_B) / 2
+        elif d != None:
+            D_Km = float(reibdurchmesser_kopf(d))  # Normmaße einer Sechskantschraube
+        else:
+            D_Km = None
+
+        if None in (d_2, alpha, p_h, roh_strich, my_K, D_Km) or isnan(D_Km) or p_h == 0:
+            return
+        delta = (delta_s if delta_s != None else 0, delta_p if delta_p != None else 0)
+        for suffix, F_M in (("min", F_Mmin), ("max", F_Mmax)):
+            if F_M == None:
+                continue
+            tabelle = anziehtabelle(d_2, p_h, alpha, roh_strich, D_Km, my_K, F_M, F_M, *delta)
+            self.set_value(f"M_A{suffix}", float(tabelle["M_Amax"]))
+            if delta_s != None and delta_p != None:
+                self.set_value(f"theta_{suffix}", float(tabelle["theta_max"]))
+
     def get_value(self, param):
         """
         Gibt den Wert eines bestimmten Parameters aus den Eingabefeldern zurück.
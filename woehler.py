@@ -0,0 +1,82 @@
+# Zeitfestigkeit von Schrauben: Wöhlerlinien für SV/SG und Schadensakkumulation nach Miner (NumPy-vektorisiert)
+from numpy import asarray, errstate, inf, where
+
+# Eckschwingspielzahl, untere Grenze des Zeitfestigkeitsbereichs und Neigung k der Wöhlerlinie
+N_D = 2e6
+N_MIN = 1e4
+NEIGUNG = {"Schlussvergütet SV": 3, "Schlussgewalzte/gerollte SG": 6}
+# Verlauf unterhalb der Dauerfestigkeit: original (keine Schädigung), elementar (Neigung k), modifiziert (Haibach, 2k-1)
+MINER = ["Miner original", "Miner elementar", "Miner modifiziert (Haibach)"]
+
+def zeitfestigkeit(N, sigma_A, k=3, N_D=N_D):
+    """
+    Ertragbare Ausschlagsspannung im Zeitfestigkeitsbereich N_MIN <= N <= N_D:
+
+        σ_AZSV = σ_ASV*(N_D/N)^(1/3),  σ_AZSG = σ_ASG*(N_D/N)^(1/6)
+
+    Args:
+        N (array_like): Schwingspielzahl.
+        sigma_A (array_like): Dauerfestigkeit σ_ASV bzw. σ_ASG in N/mm².
+        k (array_like, optional): Neigung der Wöhlerlinie (NEIGUNG).
+        N_D (float, optional): Eckschwingspielzahl.
+
+    Returns:
+        array_like: σ_AZ in N/mm² (für N > N_D gleich σ_A).
+    """
+    N, sigma_A, k = (asarray(x, dtype=float) for x in (N, sigma_A, k))
+    return sigma_A * (N_D / N.clip(N_MIN, N_D)) ** (1 / k)
+
+def bruchschwingspielzahl(sigma_a, sigma_A, k=3, miner=MINER[1], N_D=N_D):
+    """
+    Ertragbare Schwingspielzahl einer Ausschlagsspannung aus der Wöhlerlinie N = N_D*(σ_A/σ_a)^k.
+    Unterhalb von σ_A gilt je nach Miner-Variante N = inf (original), die verlängerte Wöhlerlinie (elementar)
+    oder die Neigung 2k-1 (modifiziert nach Haibach).
+
+    Args:
+        sigma_a (array_like): Ausschlagsspannung in N/mm².
+        sigma_A (array_like): Dauerfestigkeit in N/mm².
+        k (array_like, optional): Neigung der Wöhlerlinie.
+        miner (str, optional): Eintrag aus MINER.
+        N_D (float, optional): Eckschwingspielzahl.
+
+    Returns:
+        array_like: N in der Form von sigma_a.
+    """
+    sigma_a, sigma_A, k = (asarray(x, dtype=float) for x in (sigma_a, sigma_A, k))
+    with errstate(divide='ignore', invalid='ignore'):
+        verhaeltnis = sigma_A / sigma_a
+        N = N_D * verhaeltnis ** k
+        if miner == MINER[0]:
+            N = where(sigma_a <= sigma_A, inf, N)
+        elif miner == MINER[2]:
+            N = where(sigma_a <= sigma_A, N_D * verhaeltnis ** (2 * k - 1), N)
+    return where(sigma_a > 0, N, inf)
+
+def schaedigung(sigma_a, n, sigma_A, k=3, miner=MINER[1], D_zul=1.0, N_D=N_D):
+    """
+    Schadenssumme nach Miner über ein klassiertes Lastkollektiv, vektorisiert über die Klassen (letzte Achse)
+    und beliebig viele Verbindungen (vordere Achsen):
+
+        D = Σ n_i/N_i,  Lebensdauer = D_zul/D (Anzahl der Durchläufe des Kollektivs)
+
+    Args:
+        sigma_a (array_like): Ausschlagsspannung je Klasse in N/mm², Form (..., Klassen).
+        n (array_like): Schwingspielzahl je Klasse, Form (..., Klassen).
+        sigma_A (array_like): Dauerfestigkeit in N/mm², je Verbindung (..., 1) oder je Klasse.
+        k (array_like, optional): Neigung der Wöhlerlinie (NEIGUNG).
+        miner (str, optional): Eintrag aus MINER.
+        D_zul (float, optional): Zulässige Schadenssumme.
+        N_D (float, optional): Eckschwingspielzahl.
+
+    Returns:
+        dict: "D_i" je Klasse, "D" je Verbindung, "lebensdauer" (Durchläufe bis D_zul), "N_gesamt" und
+            "n_kurzzeit" (Schwingspiele mit N < N_MIN, außerhalb des Zeitfestigkeitsbereichs).
+    """
+    n = asarray(n, dtype=float)
+    N = bruchschwingspielzahl(sigma_a, sigma_A, k, miner, N_D)
+    D_i = n / N
+    D = D_i.sum(axis=-1)
+    with errstate(divide='ignore'):
+        lebensdauer = where(D > 0, D_zul / D, inf)
+    return {"D_i": D_i, "D": D, "lebensdauer": lebensdauer, "N_gesamt": n.sum(axis=-1),
+            "n_kurzzeit": where(N < N_MIN, n, 0).sum(axis=-1)}
@@ -0,0 +1,169 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+
+class WorkerSignals(QObject):
+    """
+    Signale eines Hintergrundauftrags. Sie werden im Worker-Thread emittiert und über eine
+    Queued-Connection im GUI-Thread an den WorkerPool zugestellt.
+
+    Attributes:
+        finished (pyqtSignal): Auftragsnummer und Ergebnis der Funktion.
+        error (pyqtSignal): Auftragsnummer und aufgetretene Exception.
+    """
+    finished = pyqtSignal(int, object)
+    error = pyqtSignal(int, object)
+
+
+class Worker(QRunnable):
+    """
+    Führt eine Funktion mit ihren Argumenten im QThreadPool aus.
+
+    Args:
+        job_id (int): Fortlaufende Nummer des Auftrags.
+        fn (callable): Die auszuführende Funktion. Sie darf keine Widgets anfassen.
+        args (tuple): Positionsargumente für fn.
+        kwargs (dict): Schlüsselwortargumente für fn.
+    """
+    def __init__(self, job_id, fn, args, kwargs):
+        super().__init__()
+        self.job_id = job_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Führt die Funktion aus und meldet Ergebnis oder Fehler über die Signale.
+        """
+        try:
+            try:
+                result = self.fn(*self.args, **self.kwargs)
+            except Exception as e:  # noqa: BLE001 - jeder Fehler wird über das Signal gemeldet
+                self.signals.error.emit(self.job_id, e)
+            else:
+                self.signals.finished.emit(self.job_id, result)
+        except RuntimeError:
+            pass  # Programm wird beendet, die Signale sind bereits gelöscht
+
+
+class WorkerPool(QObject):
+    """
+    Schicht für rechenintensive oder dateilastige Aufgaben (Excel-Tabellen, Sweeps) außerhalb des GUI-Threads.
+
+    Jeder Auftrag gehört zu einem Schlüssel (z.B. "fmtab" oder "werkstoff"). Wird für denselben Schlüssel
+    ein neuer Auftrag eingereicht, gilt der vorherige als veraltet: Ist er noch nicht gestartet, wird er aus
+    der Warteschlange genommen, sonst wird sein Ergebnis verworfen. Ergebnisse und Fehler werden immer im
+    GUI-Thread an die übergebenen Callbacks geliefert.
+
+    Ein Thread des globalen Pools bleibt für die Oberfläche (z.B. Matplotlib, Event-Loop) frei, damit
+    auch bei laufenden Batch-Berechnungen im selben Prozess flüssig weitergearbeitet werden kann.
+
+    Attributes:
+        busyChanged (pyqtSignal): Schlüssel und Zustand (True = Auftrag läuft) für die Besetzt-Anzeige.
+    """
+    busyChanged = pyqtSignal(str, bool)
+
+    def __init__(self, parent=None, max_threads=None):
+        """
+        Initialisiert den Pool.
+
+        Args:
+            parent (QObject, optional): Das Elternobjekt.
+            max_threads (int, optional): Maximale Anzahl gleichzeitiger Worker. Standard: Kerne - 1 (mind. 1).
+        """
+        super().__init__(parent)
+        self.pool = QThreadPool()
+        if max_threads is None:
+            max_threads = max(1, QThreadPool.globalInstance().maxThreadCount() - 1)
+        self.pool.setMaxThreadCount(max_threads)
+        self._next_id = 0
+        self._current = {}  # Schlüssel -> aktueller Auftrag (job_id, worker)
+        self._callbacks = {}  # job_id -> (Schlüssel, on_result, on_error)
+
+    def submit(self, key, fn, *args, on_result=None, on_error=None, **kwargs):
+        """
+        Reicht einen Auftrag ein und verwirft ältere Aufträge mit demselben Schlüssel.
+
+        Args:
+            key (str): Abschnitt bzw. Art des Auftrags.
+            fn (callable): Die im Hintergrund auszuführende Funktion.
+            *args: Positionsargumente für fn.
+            on_result (callable, optional): Wird im GUI-Thread mit dem Ergebnis aufgerufen.
+            on_error (callable, optional): Wird im GUI-Thread mit der Exception aufgerufen.
+            **kwargs: Schlüsselwortargumente für fn.
+
+        Returns:
+            int: Die Nummer des Auftrags.
+        """
+        self.cancel(key)
+        self._next_id += 1
+        job_id = self._next_id
+        worker = Worker(job_id, fn, args, kwargs)
+        worker.signals.finished.connect(self._on_finished)
+        worker.signals.error.connect(self._on_error)
+        self._current[key] = (job_id, worker)
+        self._callbacks[job_id] = (key, on_result, on_error)
+        self.busyChanged.emit(key, True)
+        self.pool.start(worker)
+        return job_id
+
+    def cancel(self, key):
+        """
+        Bricht den aktuellen Auftrag eines Schlüssels ab.
+        Noch wartende Aufträge werden entfernt, laufende Aufträge liefern kein Ergebnis mehr.
+
+        Args:
+            key (str): Der Schlüssel des abzubrechenden Auftrags.
+        """
+        current = self._current.pop(key, None)
+        if current is None:
+            return
+        job_id, worker = current
+        try:
+            self.pool.tryTake(worker)
+        except RuntimeError:
+            pass  # Worker ist bereits beendet und von Qt gelöscht
+        self._callbacks.pop(job_id, None)
+        self.busyChanged.emit(key, False)
+
+    def is_busy(self, key):
+        """
+        Gibt zurück, ob für einen Schlüssel gerade ein Auftrag aussteht.
+        """
+        return key in self._current
+
+    def wait(self, msecs=-1):
+        """
+        Wartet, bis alle Aufträge beendet sind (z.B. beim Schließen des Programms).
+        """
+        return self.pool.waitForDone(msecs)
+
+    def _finish(self, job_id):
+        """
+        Entfernt einen beendeten Auftrag und gibt seine Callbacks zurück, falls er noch aktuell ist.
+        """
+        entry = self._callbacks.pop(job_id, None)
+        if entry is None:
+            return None
+        key = entry[0]
+        if key in self._current and self._current[key][0] == job_id:
+            del self._current[key]
+            self.busyChanged.emit(key, False)
+        return entry
+
+    @pyqtSlot(int, object)
+    def _on_finished(self, job_id, result):
+        entry = self._finish(job_id)
+        if entry is not None and entry[1] is not None:
+            entry[1](result)
+
+    @pyqtSlot(int, object)
+    def _on_error(self, job_id, error):
+        entry = self._finish(job_id)
+        if entry is None:
+            return
+        if entry[2] is not None:
+            entry[2](error)
+        else:
+            print(f"Fehler im Hintergrundauftrag '{entry[0]}': {error}")